@@ -42,10 +42,10 @@ import numpy as np
 from datetime import date, datetime, timedelta
 import json
 from pathlib import Path
-import glob
 from typing import Dict, List
 
 from src.data.polygon_options import PolygonOptionsLoader
+from src.data.spy_daily import SpyDailyBars
 from src.analysis.trade_tracker import TradeTracker
 from src.trading.exit_engine import ExitEngine
 
@@ -54,6 +54,8 @@ from src.trading.exit_engine import ExitEngine
 VALIDATION_START = date(2022, 1, 1)
 VALIDATION_END = date(2023, 12, 31)
 
+SPY_STOCK_ROOT = '/Volumes/VelocityData/velocity_om/parquet/stock/SPY'
+
 
 def load_train_params() -> Dict:
     """Load parameters derived from train period
@@ -100,28 +102,11 @@ def load_spy_data() -> pd.DataFrame:
     print(f"  Warmup:     {warmup_start} to {VALIDATION_START}")
     print(f"  Validation: {VALIDATION_START} to {VALIDATION_END}")
 
-    spy_files = sorted(glob.glob('/Volumes/VelocityData/velocity_om/parquet/stock/SPY/*.parquet'))
-    spy_data = []
-
-    for f in spy_files:
-        df = pd.read_parquet(f)
-        if len(df) > 0:
-            file_date = pd.to_datetime(df['ts'].iloc[0]).date()
-
-            # Load warmup + validation period
-            if file_date < warmup_start or file_date > VALIDATION_END:
-                continue
-
-            spy_data.append({
-                'date': file_date,
-                'open': df['open'].iloc[0],
-                'high': df['high'].max(),
-                'low': df['low'].min(),
-                'close': df['close'].iloc[-1],
-                'volume': df['volume'].sum()
-            })
+    # Daily bars from the consolidated table (refreshed incrementally from the minute parquets)
+    spy = SpyDailyBars(SPY_STOCK_ROOT).load()
 
-    spy = pd.DataFrame(spy_data)
+    # Load warmup + validation period
+    spy = spy[(spy['date'] >= warmup_start) & (spy['date'] <= VALIDATION_END)]
 
     # Validate data loaded successfully
     if len(spy) == 0:
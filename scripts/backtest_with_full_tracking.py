@@ -20,34 +20,23 @@ import numpy as np
 from datetime import date, timedelta
 import json
 from pathlib import Path
-import glob
 from typing import Dict, List
 
 from src.data.polygon_options import PolygonOptionsLoader
+from src.data.spy_daily import SpyDailyBars
 from src.analysis.trade_tracker import TradeTracker
 from src.trading.exit_engine import ExitEngine
 
 
+SPY_STOCK_ROOT = '/Volumes/VelocityData/velocity_om/parquet/stock/SPY'
+
+
 def load_spy_data() -> pd.DataFrame:
     """Load SPY minute data and aggregate to daily with derived features"""
     print("Loading SPY data...")
 
-    spy_files = sorted(glob.glob('/Volumes/VelocityData/velocity_om/parquet/stock/SPY/*.parquet'))
-    spy_data = []
-
-    for f in spy_files:
-        df = pd.read_parquet(f)
-        if len(df) > 0:
-            spy_data.append({
-                'date': pd.to_datetime(df['ts'].iloc[0]).date(),
-                'open': df['open'].iloc[0],
-                'high': df['high'].max(),
-                'low': df['low'].min(),
-                'close': df['close'].iloc[-1],
-                'volume': df['volume'].sum()
-            })
-
-    spy = pd.DataFrame(spy_data)
+    # Daily bars from the consolidated table (refreshed incrementally from the minute parquets)
+    spy = SpyDailyBars(SPY_STOCK_ROOT).load()
 
     # Calculate derived features
     spy['return_1d'] = spy['close'].pct_change()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: per-row vs vectorized OCC ticker parsing.
+
+Builds a synthetic OPRA-sized ticker column (mostly non-SPY roots, like the
+real day_aggs files) and times both parsers on it.
+
+Usage:
+    python scripts/benchmark_ticker_parser.py --rows 1000000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.option_tickers import parse_option_tickers
+from src.data.polygon_options import PolygonOptionsLoader
+
+
+def build_tickers(n_rows: int, spy_fraction: float, seed: int = 0) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    roots = np.where(rng.random(n_rows) < spy_fraction, 'SPY', 'QQQ')
+    expiries = rng.choice(['240119', '240216', '240315', '240621', '241220'], n_rows)
+    types = rng.choice(['C', 'P'], n_rows)
+    strikes = rng.integers(300, 600, n_rows) * 1000
+    tickers = [
+        f"O:{root}{exp}{t}{strike:08d}"
+        for root, exp, t, strike in zip(roots, expiries, types, strikes)
+    ]
+    return pd.Series(tickers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark OCC ticker parsers.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--spy-fraction", type=float, default=0.05)
+    args = parser.parse_args()
+
+    tickers = build_tickers(args.rows, args.spy_fraction)
+    loader = PolygonOptionsLoader.__new__(PolygonOptionsLoader)  # parser needs no data root
+
+    start = time.perf_counter()
+    parsed = tickers.apply(loader._parse_option_ticker)
+    parsed = parsed[parsed.notna()]
+    scalar_df = pd.DataFrame(parsed.tolist())
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vector_df = parse_option_tickers(tickers)
+    vector_time = time.perf_counter() - start
+
+    assert len(scalar_df) == len(vector_df), "Parsers disagree on row count"
+
+    print(f"Rows:        {args.rows:,} ({len(vector_df):,} SPY)")
+    print(f"Per-row:     {scalar_time:.3f}s")
+    print(f"Vectorized:  {vector_time:.3f}s")
+    print(f"Speedup:     {scalar_time / max(vector_time, 1e-9):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Pre-build the shared chain arena (memory-mapped Arrow IPC day chains).
+
+Each day chain is built once (chain store partition when present, raw Polygon
+day_aggs CSV.gz otherwise) and written as an uncompressed Arrow IPC file.
+Backtest processes with POLYGON_CHAIN_ARENA_ROOT pointing at the arena then
+map the days read-only and share one physical copy instead of each parsing
+and holding its own. Loaders also publish missing days on first use, so
+pre-building is optional.
+
+Usage:
+    python scripts/build_chain_arena.py --start 2020-01-01 --end 2024-12-31
+    python scripts/build_chain_arena.py --arena-dir /dev/shm/chain_arena --force
+"""
+
+import argparse
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.chain_arena import ChainArena, DEFAULT_CHAIN_ARENA_ROOT
+from src.data.chain_cache import ChainCache
+from src.data.chain_store import DEFAULT_CHAIN_STORE_ROOT
+from src.data.polygon_options import PolygonOptionsLoader, DEFAULT_POLYGON_ROOT
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build the shared memory-mapped chain arena.")
+    parser.add_argument("--raw-dir", type=Path, default=Path(DEFAULT_POLYGON_ROOT),
+                        help="Polygon day_aggs root (default: %(default)s)")
+    parser.add_argument("--store-dir", type=Path, default=Path(DEFAULT_CHAIN_STORE_ROOT),
+                        help="Chain store root (default: %(default)s)")
+    parser.add_argument("--arena-dir", type=Path, default=Path(DEFAULT_CHAIN_ARENA_ROOT),
+                        help="Chain arena root (default: %(default)s)")
+    parser.add_argument("--underlying", default='SPY',
+                        help="Option root (default: %(default)s)")
+    parser.add_argument("--start", type=date.fromisoformat, default=None,
+                        help="First trade date (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, default=None,
+                        help="Last trade date (YYYY-MM-DD)")
+    parser.add_argument("--force", action="store_true",
+                        help="Rewrite days already in the arena")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    arena = ChainArena(str(args.arena_dir), underlying=args.underlying)
+
+    # No arena on the loader: build private frames and write them explicitly;
+    # a small cache keeps one day resident at a time
+    loader = PolygonOptionsLoader(
+        data_root=str(args.raw_dir),
+        chain_store_root=str(args.store_dir),
+        chain_cache=ChainCache(max_bytes=1),
+        underlying=args.underlying,
+        chain_arena_root=str(args.arena_dir / '.unused')
+    )
+
+    dates = set(loader.chain_store.list_dates()) | set(loader.day_manifest.dates())
+    targets = sorted(
+        d for d in dates
+        if (args.start is None or d >= args.start) and (args.end is None or d <= args.end)
+        and (args.force or not arena.has_day(d))
+    )
+    if not targets:
+        print("All arena days already exist. Nothing to do.")
+        return
+
+    print(f"Writing {len(targets)} days to {args.arena_dir / args.underlying}...")
+    started = time.time()
+    written = 0
+    for i, trade_date in enumerate(targets, 1):
+        frame = loader._load_day_chain(trade_date).frame
+        if not frame.empty:
+            arena.write_day(trade_date, frame)
+            written += 1
+        if i % 50 == 0:
+            print(f"  {i}/{len(targets)} days")
+
+    print(f"Chain arena build complete: {written} days in {time.time() - started:.1f}s.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Build the per-contract time-series panel from the SPY options chain.
+
+Reads every trading day (chain store partition when present, raw Polygon
+day_aggs CSV.gz otherwise) and writes one memory-mapped panel where each
+contract's whole life is a contiguous slice. TradeTracker uses it to read a
+trade's path in one slice instead of one chain lookup per leg per day.
+
+Usage:
+    python scripts/build_contract_panel.py
+    python scripts/build_contract_panel.py --start 2020-01-01 --end 2024-12-31
+"""
+
+import argparse
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+
+from src.data.chain_store import DEFAULT_CHAIN_STORE_ROOT
+from src.data.contract_panel import ContractPanel, DEFAULT_CONTRACT_PANEL_ROOT
+from src.data.polygon_options import PolygonOptionsLoader, DEFAULT_POLYGON_ROOT
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build SPY per-contract time-series panel.")
+    parser.add_argument("--raw-dir", type=Path, default=Path(DEFAULT_POLYGON_ROOT),
+                        help="Polygon day_aggs root (default: %(default)s)")
+    parser.add_argument("--store-dir", type=Path, default=Path(DEFAULT_CHAIN_STORE_ROOT),
+                        help="Chain store root (default: %(default)s)")
+    parser.add_argument("--panel-dir", type=Path, default=Path(DEFAULT_CONTRACT_PANEL_ROOT),
+                        help="Contract panel root (default: %(default)s)")
+    parser.add_argument("--start", type=date.fromisoformat, default=None,
+                        help="First trade date (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, default=None,
+                        help="Last trade date (YYYY-MM-DD)")
+    return parser.parse_args()
+
+
+def find_dates(loader: PolygonOptionsLoader, start: Optional[date], end: Optional[date]) -> List[date]:
+    """Trade dates available in the chain store or the raw directory."""
+    dates = set(loader.chain_store.list_dates()) | set(loader.day_manifest.dates())
+    return sorted(d for d in dates if (start is None or d >= start) and (end is None or d <= end))
+
+
+def iter_days(loader: PolygonOptionsLoader, dates: List[date]) -> Iterator[pd.DataFrame]:
+    for i, trade_date in enumerate(dates, 1):
+        # Read directly (not via the chain cache) - each day is used once
+        yield loader._read_day(trade_date)
+        if i % 50 == 0:
+            print(f"  read {i}/{len(dates)} days")
+
+
+def main():
+    args = parse_args()
+
+    loader = PolygonOptionsLoader(data_root=str(args.raw_dir), chain_store_root=str(args.store_dir))
+    dates = find_dates(loader, args.start, args.end)
+    if not dates:
+        print("No trade dates found. Nothing to do.")
+        return
+
+    print(f"Building contract panel from {len(dates)} days ({dates[0]} to {dates[-1]})...")
+    started = time.perf_counter()
+    panel = ContractPanel.build(iter_days(loader, dates), root=str(args.panel_dir))
+    meta = panel.meta
+
+    print(f"Wrote {meta['contracts']} contracts / {meta['rows']} rows to {panel.panel_dir} "
+          f"in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Build or refresh the coverage manifests for the raw data roots.
+
+Loaders keep manifests current cheaply (directory mtimes only). This script
+runs the detailed refresh: it also records row counts and SHA-256 checksums
+for files that are new or changed since the last run.
+
+Usage:
+    python scripts/build_data_manifest.py
+    python scripts/build_data_manifest.py --full --verify
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.loaders import DEFAULT_POLYGON_ROOT, DEFAULT_POLYGON_MINUTE_ROOT, DEFAULT_STOCK_ROOT
+from src.data.manifest import get_manifest
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Refresh data coverage manifests.")
+    parser.add_argument("--day-dir", type=Path, default=Path(DEFAULT_POLYGON_ROOT),
+                        help="Polygon day_aggs root (default: %(default)s)")
+    parser.add_argument("--minute-dir", type=Path, default=Path(DEFAULT_POLYGON_MINUTE_ROOT),
+                        help="Polygon minute_aggs root (default: %(default)s)")
+    parser.add_argument("--stock-dir", type=Path, default=Path(DEFAULT_STOCK_ROOT),
+                        help="SPY minute parquet root (default: %(default)s)")
+    parser.add_argument("--full", action="store_true",
+                        help="Re-stat every file, not just directories whose mtime changed")
+    parser.add_argument("--verify", action="store_true",
+                        help="Recompute every checksum and report mismatches")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    roots = [
+        ('day_aggs', args.day_dir, '.csv.gz', True),
+        ('minute_aggs', args.minute_dir, '.csv.gz', True),
+        ('stock', args.stock_dir, '.parquet', False),
+    ]
+    for name, root, suffix, nested in roots:
+        if not root.exists():
+            print(f"{name}: {root} not found, skipping")
+            continue
+
+        manifest = get_manifest(root, suffix=suffix, nested=nested)
+        counts = manifest.refresh(detail=True, full=args.full)
+        coverage = manifest.coverage()
+        print(f"{name}: {coverage['count']} days {coverage['start']} -> {coverage['end']} "
+              f"(+{counts['added']} ~{counts['updated']} -{counts['removed']}, "
+              f"{counts['dirs_scanned']} dirs scanned) -> {manifest.manifest_path}")
+
+        if args.verify:
+            bad = [d for d in manifest.dates() if not manifest.verify(d)]
+            for d in bad:
+                print(f"  CHECKSUM MISMATCH: {d}")
+            print(f"  verified {len(manifest.dates()) - len(bad)}/{len(manifest.dates())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Build the per-contract minute-bar store from raw Polygon minute_aggs files.
+
+Each raw file /Volumes/VelocityData/polygon_downloads/us_options_opra/minute_aggs_v1/<YYYY>/<MM>/<YYYY-MM-DD>.csv.gz
+holds every OPRA contract's minute bars. We parse it once, keep the requested
+underlyings (SPY by default), sort rows by contract and write one Parquet
+partition per underlying and day. Reading one contract's intraday bars then
+decodes only the row groups holding it.
+
+Usage:
+    python scripts/build_minute_bar_store.py --workers 8
+    python scripts/build_minute_bar_store.py --underlyings SPY QQQ IWM
+    python scripts/build_minute_bar_store.py --start 2023-01-01 --end 2023-01-31 --force
+"""
+
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+from pathlib import Path
+from typing import List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.manifest import get_manifest
+from src.data.minute_store import MinuteBarStore, DEFAULT_MINUTE_STORE_ROOT
+from src.data.polygon_options import PolygonOptionsLoader, DEFAULT_POLYGON_MINUTE_ROOT
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build per-contract minute-bar Parquet store.")
+    parser.add_argument("--raw-dir", type=Path, default=Path(DEFAULT_POLYGON_MINUTE_ROOT),
+                        help="Polygon minute_aggs root (default: %(default)s)")
+    parser.add_argument("--store-dir", type=Path, default=Path(DEFAULT_MINUTE_STORE_ROOT),
+                        help="Minute store root (default: %(default)s)")
+    parser.add_argument("--start", type=date.fromisoformat, default=None,
+                        help="First date to ingest (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, default=None,
+                        help="Last date to ingest (YYYY-MM-DD)")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="Number of parallel workers (default: %(default)s)")
+    parser.add_argument("--force", action="store_true",
+                        help="Rebuild even if partition already exists")
+    parser.add_argument("--underlyings", nargs="+", default=['SPY'],
+                        help="Option roots extracted from each raw file in one pass (default: %(default)s)")
+    return parser.parse_args()
+
+
+def find_raw_dates(raw_dir: Path, start: Optional[date], end: Optional[date]) -> List[date]:
+    """Raw trade dates in [start, end], from the coverage manifest."""
+    return [
+        d for d in get_manifest(raw_dir).dates()
+        if (start is None or d >= start) and (end is None or d <= end)
+    ]
+
+
+def process_day(
+    trade_date: date,
+    raw_dir: Path,
+    store_dir: Path,
+    underlyings: List[str],
+    force: bool = False
+) -> str:
+    stores = {u: MinuteBarStore(str(store_dir), underlying=u) for u in underlyings}
+    missing = [u for u, store in stores.items() if force or not store.has_day(trade_date)]
+    if not missing:
+        return f"skip:{trade_date}"
+
+    # Only the minute root is read here (data_root just has to exist)
+    loader = PolygonOptionsLoader(
+        data_root=str(raw_dir),
+        minute_data_root=str(raw_dir),
+        minute_store_root=str(store_dir)
+    )
+    days = loader.read_raw_minute_bars_multi(trade_date, missing)
+    for underlying, df in days.items():
+        stores[underlying].write_day(trade_date, df)
+
+    if all(df.empty for df in days.values()):
+        return f"no_data:{trade_date}"
+    built = ", ".join(f"{u} {len(df)}" for u, df in days.items())
+    return f"built:{trade_date} ({built} bars)"
+
+
+def main():
+    args = parse_args()
+
+    if not args.raw_dir.exists():
+        raise FileNotFoundError(f"Raw directory {args.raw_dir} does not exist")
+
+    args.store_dir.mkdir(parents=True, exist_ok=True)
+    stores = [MinuteBarStore(str(args.store_dir), underlying=u) for u in args.underlyings]
+
+    targets = find_raw_dates(args.raw_dir, args.start, args.end)
+    if not args.force:
+        # A day is done only when every requested underlying has its partition
+        targets = [d for d in targets if not all(store.has_day(d) for store in stores)]
+
+    if not targets:
+        print("All minute-bar partitions already exist. Nothing to do.")
+        return
+
+    print(f"Processing {len(targets)} days with {args.workers} workers...")
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {
+            executor.submit(
+                process_day, trade_date, args.raw_dir, args.store_dir, args.underlyings, args.force
+            ): trade_date
+            for trade_date in targets
+        }
+        for future in as_completed(futures):
+            trade_date = futures[future]
+            try:
+                print(future.result())
+            except Exception as exc:
+                print(f"ERROR:{trade_date}:{exc}")
+
+    print("Minute-bar store build complete.")
+
+
+if __name__ == "__main__":
+    main()
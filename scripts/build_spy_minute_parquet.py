@@ -8,15 +8,21 @@ write a parquet per trading day into /Volumes/VelocityData/velocity_om/parquet/s
 
 Usage:
     python scripts/build_spy_minute_parquet.py --workers 8 --force
+
+For nightly updates prefer scripts/ingest_daily.py, which also tracks changed
+files and covers the options stores.
 """
 
 import argparse
+import sys
 from concurrent.futures import ProcessPoolExecutor, as_completed
-from datetime import datetime
+from datetime import date
 from pathlib import Path
 from typing import List
 
-import pandas as pd
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.ingest import convert_stock_minutes
 
 RAW_DEFAULT = Path("/Volumes/VelocityData/velocity_om/raw/stock")
 OUT_DEFAULT = Path("/Volumes/VelocityData/velocity_om/parquet/stock/SPY")
@@ -37,6 +43,11 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def raw_day(path: Path) -> str:
+    """YYYY-MM-DD from <YYYY-MM-DD>.csv.gz (Path.stem would keep '.csv')."""
+    return path.name[:-len(".csv.gz")]
+
+
 def find_missing(raw_dir: Path, out_dir: Path, force: bool) -> List[Path]:
     raw_files = sorted(raw_dir.glob("*.csv.gz"))
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -46,50 +57,20 @@ def find_missing(raw_dir: Path, out_dir: Path, force: bool) -> List[Path]:
 
     missing = []
     for path in raw_files:
-        candidate = out_dir / f"{path.stem}.parquet"
+        candidate = out_dir / f"{raw_day(path)}.parquet"
         if not candidate.exists():
             missing.append(path)
     return missing
 
 
 def process_file(path: Path, out_dir: Path, force: bool = False) -> str:
-    target = out_dir / f"{path.stem}.parquet"
+    target = out_dir / f"{raw_day(path)}.parquet"
     if target.exists() and not force:
         return f"skip:{path.stem}"
 
-    chunks = []
-    for chunk in pd.read_csv(
-        path,
-        usecols=["ticker", "volume", "open", "close", "high", "low", "window_start"],
-        chunksize=1_000_000,
-    ):
-        spy_chunk = chunk[chunk["ticker"] == "SPY"]
-        if not spy_chunk.empty:
-            chunks.append(spy_chunk)
-
-    if not chunks:
+    rows = convert_stock_minutes(path, out_dir, date.fromisoformat(raw_day(path)))
+    if rows == 0:
         return f"no_data:{path.stem}"
-
-    spy = pd.concat(chunks, ignore_index=True)
-    spy["ts"] = pd.to_datetime(spy["window_start"], unit="ns")
-    spy = spy.sort_values("ts")
-    spy["minute"] = spy["ts"].dt.floor("min")
-
-    agg = (
-        spy.groupby("minute", sort=True)
-        .agg(
-            open=("open", "first"),
-            high=("high", "max"),
-            low=("low", "min"),
-            close=("close", "last"),
-            volume=("volume", "sum"),
-        )
-        .reset_index()
-    )
-    agg["date"] = agg["minute"].dt.date
-    agg.rename(columns={"minute": "ts"}, inplace=True)
-
-    agg.to_parquet(target, index=False)
     return f"built:{path.stem}"
 
 
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Import VIX-family daily closes into the local VIX store.
+
+Backtests read VIX from the store only (no network). Run this once on a
+machine with network access, or feed it CBOE history CSVs
+(https://www.cboe.com/tradable_products/vix/vix_historical_data/):
+
+Usage:
+    python scripts/import_vix.py --start 2018-01-01
+    python scripts/import_vix.py --series vix_close vvix_close --start 2020-01-01 --end 2024-12-31
+    python scripts/import_vix.py --csv vix_close=VIX_History.csv --csv vvix_close=VVIX_History.csv
+"""
+
+import argparse
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.vix_store import VixStore, VIX_SERIES, DEFAULT_VIX_STORE_PATH, download_series, read_cboe_csv
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Import VIX series into the local VIX store.")
+    parser.add_argument("--store", type=Path, default=None,
+                        help=f"VIX store path (default: $VIX_STORE_PATH or {DEFAULT_VIX_STORE_PATH})")
+    parser.add_argument("--series", nargs="+", choices=sorted(VIX_SERIES), default=sorted(VIX_SERIES),
+                        help="Series to download from yfinance (default: all)")
+    parser.add_argument("--start", type=date.fromisoformat, default=date(2014, 1, 1),
+                        help="First date to download (default: %(default)s)")
+    parser.add_argument("--end", type=date.fromisoformat, default=date.today(),
+                        help="Last date to download (default: today)")
+    parser.add_argument("--csv", action="append", default=[], metavar="COLUMN=PATH",
+                        help="Import a CBOE history CSV instead of downloading (repeatable)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    store = VixStore(str(args.store) if args.store else None)
+
+    if args.csv:
+        for spec in args.csv:
+            column, _, path = spec.partition("=")
+            if column not in VIX_SERIES or not path:
+                raise ValueError(f"Expected COLUMN=PATH with COLUMN in {sorted(VIX_SERIES)}, got {spec!r}")
+            df = read_cboe_csv(path, column)
+            store.upsert(df)
+            print(f"{column}: imported {len(df)} rows from {path}")
+    else:
+        for column in args.series:
+            df = download_series(column, args.start, args.end)
+            if df.empty:
+                print(f"{column}: no data returned for {args.start} -> {args.end}")
+                continue
+            store.upsert(df)
+            print(f"{column}: imported {len(df)} rows ({df['date'].min()} -> {df['date'].max()})")
+
+    coverage = store.coverage()
+    print(f"VIX store {store.path}: vix_close coverage {coverage}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Incremental ingest of new or changed raw Polygon files.
+
+Covers SPY stock minutes, option day aggregates (chain store) and option
+minute aggregates (minute store) in one command. Each raw file's size, mtime
+and checksum are tracked in the ingest state file, so a nightly run converts
+only the new day. See src/data/ingest.py.
+
+Usage:
+    python scripts/ingest_daily.py --workers 8
+    python scripts/ingest_daily.py --sources option_day --underlyings SPY QQQ IWM
+    python scripts/ingest_daily.py --start 2024-01-01 --end 2024-01-31 --force
+    python scripts/ingest_daily.py --dry-run
+"""
+
+import argparse
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.ingest import DailyIngest, INGEST_SOURCES, DEFAULT_INGEST_TASKS_PER_WORKER
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Convert new or changed raw Polygon files.")
+    parser.add_argument("--sources", nargs="+", choices=INGEST_SOURCES, default=INGEST_SOURCES,
+                        help="Raw sources to ingest (default: all)")
+    parser.add_argument("--underlyings", nargs="+", default=['SPY'],
+                        help="Option roots written to the chain/minute stores (default: %(default)s)")
+    parser.add_argument("--stock-raw-dir", default=None, help="Raw stock CSV.gz root")
+    parser.add_argument("--stock-out-dir", default=None, help="SPY minute parquet root")
+    parser.add_argument("--day-raw-dir", default=None, help="Polygon day_aggs root")
+    parser.add_argument("--minute-raw-dir", default=None, help="Polygon minute_aggs root")
+    parser.add_argument("--chain-store-dir", default=None, help="Options chain store root")
+    parser.add_argument("--minute-store-dir", default=None, help="Minute-bar store root")
+    parser.add_argument("--state", default=None, help="Ingest state file")
+    parser.add_argument("--start", type=date.fromisoformat, default=None,
+                        help="First date to ingest (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, default=None,
+                        help="Last date to ingest (YYYY-MM-DD)")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="Number of parallel workers (default: %(default)s)")
+    parser.add_argument("--tasks-per-worker", type=int, default=DEFAULT_INGEST_TASKS_PER_WORKER,
+                        help="Files a worker converts before it is replaced (default: %(default)s)")
+    parser.add_argument("--force", action="store_true",
+                        help="Reconvert every file in range")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="List the files that would be converted")
+    return parser.parse_args()
+
+
+def report(result):
+    if result['status'] == 'failed':
+        print(f"ERROR:{result['source']}:{result['date']}:{result['error']}")
+    elif result['status'] == 'built':
+        print(f"built:{result['source']}:{result['date']} ({result['rows']} rows)")
+    else:
+        print(f"unchanged:{result['source']}:{result['date']}")
+
+
+def main():
+    args = parse_args()
+
+    ingest = DailyIngest(
+        stock_raw_root=args.stock_raw_dir,
+        stock_minute_root=args.stock_out_dir,
+        option_day_root=args.day_raw_dir,
+        option_minute_root=args.minute_raw_dir,
+        chain_store_root=args.chain_store_dir,
+        minute_store_root=args.minute_store_dir,
+        underlyings=args.underlyings,
+        state_path=args.state
+    )
+
+    if args.dry_run:
+        tasks = ingest.plan(args.sources, args.start, args.end, args.force)
+        for task in tasks:
+            print(f"{task['source']}:{task['date']} {task['path']}")
+        print(f"{len(tasks)} files to convert.")
+        return
+
+    counts = ingest.run(
+        args.sources, args.start, args.end,
+        workers=args.workers,
+        force=args.force,
+        tasks_per_worker=args.tasks_per_worker,
+        progress=report
+    )
+
+    for source, source_counts in counts.items():
+        print(f"{source}: {source_counts['built']} built, {source_counts['unchanged']} unchanged, "
+              f"{source_counts['failed']} failed")
+    print("Ingest complete.")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,33 +6,13 @@ See actual intraday peak timing, drawdowns, Greeks evolution
 
 import json
 import pandas as pd
-import gzip
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 import sys
 
-# Add src to path (if needed later)
-# sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-
-def load_minute_bars(date_str, data_dir="/Volumes/VelocityData/polygon_downloads/us_options_opra/minute_aggs_v1"):
-    """Load minute bars for a specific date"""
-    year, month = date_str[:4], date_str[5:7]
-    file_path = Path(data_dir) / year / month / f"{date_str}.csv.gz"
-
-    if not file_path.exists():
-        print(f"Warning: {file_path} not found")
-        return pd.DataFrame()
-
-    with gzip.open(file_path, 'rt') as f:
-        df = pd.read_csv(f)
-
-    # Convert timestamp
-    df['timestamp'] = pd.to_datetime(df['window_start'], unit='ns')
-    df['date'] = df['timestamp'].dt.date
-    df['time'] = df['timestamp'].dt.time
-
-    return df
+from src.data.polygon_options import PolygonOptionsLoader
 
 
 def get_trading_dates(start_date, end_date):
@@ -51,8 +31,8 @@ def build_option_ticker(expiry, strike, option_type):
     return f"O:SPY{yymmdd}{opt_letter}{strike_padded}"
 
 
-def rebuild_trade_intraday(trade, profile_name):
-    """Rebuild a single trade with minute bars"""
+def rebuild_trade_intraday(trade, profile_name, loader):
+    """Rebuild a single trade with minute bars (one contract read per leg per day)"""
     entry_date = trade['entry']['entry_date']
     exit_date = trade['exit']['exit_date'] if 'exit' in trade else None
 
@@ -66,6 +46,7 @@ def rebuild_trade_intraday(trade, profile_name):
 
     # Entry details
     expiry = trade['entry']['expiry']
+    expiry_date = pd.to_datetime(expiry).date()
     strike = trade['entry']['strike']
     legs = trade['entry']['legs']
     entry_prices = trade['entry']['entry_prices']
@@ -89,21 +70,18 @@ def rebuild_trade_intraday(trade, profile_name):
 
     # Load minute bars for each day and track combined P&L
     all_minutes = []
-    for date in trading_dates:
-        minute_bars = load_minute_bars(date)
-        if minute_bars.empty:
-            continue
+    for date_str in trading_dates:
+        trade_date = date.fromisoformat(date_str)
 
         # Track P&L for each leg at this timestamp
         daily_pnl_by_minute = {}
 
         for leg in leg_data:
-            ticker = leg['ticker']
             entry_price = leg['entry_price']
             qty = leg['qty']
 
-            # Get minute data for this leg
-            leg_minutes = minute_bars[minute_bars['ticker'] == ticker].copy()
+            # Get minute data for this leg (minute store when built, raw file otherwise)
+            leg_minutes = loader.load_minute_bars(trade_date, strike, expiry_date, leg['type'])
 
             if leg_minutes.empty:
                 continue
@@ -212,10 +190,14 @@ def main():
     print("=" * 60)
 
     # Rebuild each trade
+    loader = PolygonOptionsLoader()
+    if not loader.minute_store.available and not loader.has_minute_data:
+        print(f"Warning: no minute data at {loader.minute_store.root} or {loader.minute_data_root}")
+
     intraday_results = []
     for profile_name, trade in jan_2023_trades:
         try:
-            result = rebuild_trade_intraday(trade, profile_name)
+            result = rebuild_trade_intraday(trade, profile_name, loader)
             if result:
                 intraday_results.append(result)
         except Exception as e:
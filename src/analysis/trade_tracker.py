@@ -22,6 +22,8 @@ import sys
 sys.path.append('/Users/zstoc/rotation-engine')
 
 from src.data.polygon_options import PolygonOptionsLoader
+from src.data.contract_panel import ContractPanel
+from src.data.contract_index import quote_mask
 from src.pricing.greeks import calculate_all_greeks
 
 
@@ -33,8 +35,15 @@ class TradeTracker:
     happens to position over its lifetime (not just entry/exit)
     """
 
-    def __init__(self, polygon_loader: PolygonOptionsLoader):
+    def __init__(self, polygon_loader: PolygonOptionsLoader, contract_panel: Optional[ContractPanel] = None):
+        """
+        Args:
+            polygon_loader: Loader used for option prices (and the spread model)
+            contract_panel: Optional prebuilt ContractPanel. When given, each leg's
+                whole path is read as one slice instead of one chain lookup per day.
+        """
         self.polygon = polygon_loader
+        self.contract_panel = contract_panel
 
     def track_trade(
         self,
@@ -70,6 +79,9 @@ class TradeTracker:
         entry_row = spy_subset.iloc[0]
         entry_spot = entry_row['close']
 
+        # Per-leg price paths from the contract panel (None = per-day chain lookups)
+        leg_paths = self._load_leg_paths(position, entry_date, spy_subset.iloc[-1]['date'])
+
         # Get entry prices
         entry_prices = {}
         entry_cost = 0.0
@@ -84,14 +96,10 @@ class TradeTracker:
             # This matches how Simulator.py gets prices (lines 424-429)
             if qty > 0:
                 # Long: pay the ask
-                price = self.polygon.get_option_price(
-                    entry_date, position['strike'], position['expiry'], opt_type, 'ask'
-                )
+                price = self._get_leg_price(entry_date, position, opt_type, 'ask', leg_paths)
             else:
                 # Short: receive the bid
-                price = self.polygon.get_option_price(
-                    entry_date, position['strike'], position['expiry'], opt_type, 'bid'
-                )
+                price = self._get_leg_price(entry_date, position, opt_type, 'bid', leg_paths)
 
             if price is None:
                 return None
@@ -161,14 +169,10 @@ class TradeTracker:
                 # Long positions would exit at bid (selling), short at ask (buying to cover)
                 if qty > 0:
                     # Long: exit at bid (we're selling)
-                    price = self.polygon.get_option_price(
-                        day_date, position['strike'], position['expiry'], opt_type, 'bid'
-                    )
+                    price = self._get_leg_price(day_date, position, opt_type, 'bid', leg_paths)
                 else:
                     # Short: exit at ask (we're buying to cover)
-                    price = self.polygon.get_option_price(
-                        day_date, position['strike'], position['expiry'], opt_type, 'ask'
-                    )
+                    price = self._get_leg_price(day_date, position, opt_type, 'ask', leg_paths)
 
                 if price is None:
                     # If we can't get price, stop tracking
@@ -270,6 +274,57 @@ class TradeTracker:
 
         return trade_record
 
+    def _load_leg_paths(self, position: Dict, start: date, end: date) -> Optional[Dict[str, Dict]]:
+        """
+        Slice each leg's contract path from the panel once per trade.
+
+        Bid/ask come from the loader's spread model, with the same inputs as
+        get_option_price (no spot), and garbage quotes are masked the same way.
+        """
+        if self.contract_panel is None:
+            return None
+
+        leg_paths = {}
+        for leg in position['legs']:
+            opt_type = leg['type']
+            path = self.contract_panel.path(position['strike'], position['expiry'], opt_type, start, end)
+            if path is None or len(path['date']) == 0:
+                continue
+
+            bid, ask = self.polygon.model_bid_ask(
+                path['mid'], position['strike'], path['dte'], trade_date=start
+            )
+            path = dict(path, bid=bid, ask=ask)
+            path['valid'] = quote_mask(path['close'], bid, ask, path['volume'])
+            leg_paths[opt_type] = path
+
+        return leg_paths
+
+    def _get_leg_price(
+        self,
+        trade_date: date,
+        position: Dict,
+        opt_type: str,
+        price_type: str,
+        leg_paths: Optional[Dict[str, Dict]]
+    ) -> Optional[float]:
+        """Option price for one leg on one day (panel slice or chain lookup)."""
+        if leg_paths is None:
+            return self.polygon.get_option_price(
+                trade_date, position['strike'], position['expiry'], opt_type, price_type
+            )
+
+        path = leg_paths.get(opt_type)
+        if path is None:
+            return None
+
+        target = np.datetime64(trade_date, 'D')
+        i = int(np.searchsorted(path['date'], target))
+        if i >= len(path['date']) or path['date'][i] != target or not path['valid'][i]:
+            return None
+
+        return float(path[price_type][i])
+
     def _calculate_position_greeks(
         self,
         trade_date: date,
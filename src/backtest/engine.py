@@ -10,16 +10,27 @@ This is the top-level interface that:
 6. Generates performance metrics
 """
 
+import os
 import pandas as pd
 import numpy as np
-from typing import Optional, Dict, Tuple
+import pyarrow as pa
+import pyarrow.ipc as ipc
 import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, Tuple
 from pathlib import Path
 
 # Import data and profile modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.data.loaders import load_spy_data
+from src.data.chain_cache import get_shared_chain_cache
 from src.profiles.detectors import ProfileDetectors
+from src.trading.checkpoint import (
+    SimulationCheckpoint, checkpoint_dir_default, checkpoint_env, data_fingerprint, fingerprint
+)
 
 # Import profile backtests
 from src.trading.profiles.profile_1 import run_profile_1_backtest
@@ -34,6 +45,67 @@ from .rotation import RotationAllocator
 from .portfolio import PortfolioAggregator
 
 
+# Profile backtests run in this many worker processes (1 = serially in-process)
+DEFAULT_PROFILE_WORKERS = 1
+
+PROFILE_RUNNERS = {
+    'profile_1': run_profile_1_backtest,
+    'profile_2': run_profile_2_backtest,
+    'profile_3': run_profile_3_backtest,
+    'profile_4': run_profile_4_backtest,
+    'profile_5': run_profile_5_backtest,
+    'profile_6': run_profile_6_backtest
+}
+
+# Market data handed to profile worker processes (set by _init_profile_worker)
+_worker_frames: Dict[str, pd.DataFrame] = {}
+
+
+def _write_handoff(frames: Dict[str, pd.DataFrame], handoff_dir: str) -> Optional[Dict[str, str]]:
+    """
+    Write frames as uncompressed Arrow IPC files for workers to memory-map.
+
+    Returns None if a frame has no Arrow representation (workers then get
+    pickled copies).
+    """
+    paths = {}
+    try:
+        for name, frame in frames.items():
+            table = pa.Table.from_pandas(frame)
+            path = os.path.join(handoff_dir, f"{name}.arrow")
+            with pa.OSFile(path, 'wb') as sink:
+                with ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            paths[name] = path
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+    return paths
+
+
+def _init_profile_worker(paths: Optional[Dict[str, str]], frames: Optional[Dict[str, pd.DataFrame]]):
+    """Load the shared market data once per worker process."""
+    global _worker_frames
+    if paths is not None:
+        frames = {
+            name: ipc.open_file(pa.memory_map(path).read_buffer()).read_all().to_pandas()
+            for name, path in paths.items()
+        }
+    _worker_frames = frames
+
+
+def _run_profile_task(runner, threshold: float, regimes: list, checkpoint_settings: tuple) -> Tuple[pd.DataFrame, int, float]:
+    """Run one profile backtest in a worker: (results, trade count, wall seconds)."""
+    started = time.perf_counter()
+    with checkpoint_env(*checkpoint_settings):
+        profile_results, trades = runner(
+            data=_worker_frames['data'],
+            profile_scores=_worker_frames['profile_scores'],
+            score_threshold=threshold,
+            regime_filter=regimes
+        )
+    return profile_results, len(trades), time.perf_counter() - started
+
+
 class RotationEngine:
     """
     Main rotation engine orchestrator.
@@ -52,7 +124,10 @@ class RotationEngine:
         max_profile_weight: float = 0.40,
         min_profile_weight: float = 0.05,
         vix_scale_threshold: float = 0.30,
-        vix_scale_factor: float = 0.5
+        vix_scale_factor: float = 0.5,
+        profile_workers: Optional[int] = None,
+        checkpoint_dir: Optional[str] = None,
+        checkpoint_every: Optional[int] = None
     ):
         """
         Initialize rotation engine.
@@ -67,6 +142,18 @@ class RotationEngine:
             RV20 threshold for scaling down (default 30%)
         vix_scale_factor : float
             Scale factor when above threshold (default 0.5)
+        profile_workers : int, optional
+            Worker processes for the profile backtests (default 1 = serial,
+            env ROTATION_PROFILE_WORKERS). Profiles are independent given the
+            scored data, which is written once to memory-mapped Arrow files
+            that every worker reads.
+        checkpoint_dir : str, optional
+            Checkpoint completed profile backtests here, and have each
+            profile's TradeSimulator checkpoint every `checkpoint_every` days
+            (default env SIMULATION_CHECKPOINT_DIR; unset = off). A rerun on
+            the same data resumes and gives identical results.
+        checkpoint_every : int, optional
+            Simulated days between simulator checkpoints
         """
         self.allocator = RotationAllocator(
             max_profile_weight=max_profile_weight,
@@ -76,6 +163,14 @@ class RotationEngine:
         )
         self.aggregator = PortfolioAggregator()
 
+        if profile_workers is None:
+            profile_workers = int(os.environ.get("ROTATION_PROFILE_WORKERS", DEFAULT_PROFILE_WORKERS))
+        self.profile_workers = max(profile_workers, 1)
+        self.profile_timings: Dict[str, float] = {}
+
+        self.checkpoint_dir = checkpoint_dir or checkpoint_dir_default()
+        self.checkpoint_every = checkpoint_every
+
         # Profile configurations
         self.profile_configs = {
             'profile_1': {'threshold': 0.6, 'regimes': [1, 3]},  # LDG
@@ -172,6 +267,10 @@ class RotationEngine:
         # BUG FIX (2025-11-18): Pass data_with_scores instead of data to ensure regime data available
         # Agent #1/#10 found: profile backtests use data but allocations use data_with_scores
         profile_results = self._run_profile_backtests(data_with_scores, profile_scores)
+        if self.profile_workers == 1:
+            cache_stats = get_shared_chain_cache().stats()
+            print(f"  Chain cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+                  f"{cache_stats['evictions']} evictions ({cache_stats['bytes'] / 1e6:.0f} MB)")
 
         # Step 4: Calculate dynamic allocations
         print("\nStep 4: Calculating dynamic allocations...")
@@ -220,9 +319,13 @@ class RotationEngine:
             'attribution_by_regime': attribution_by_regime,
             'rotation_metrics': rotation_metrics,
             'exposure_over_time': self.aggregator.calculate_exposure_over_time(portfolio),
-            'regime_distribution': self.aggregator.calculate_regime_distribution(portfolio)
+            'regime_distribution': self.aggregator.calculate_regime_distribution(portfolio),
+            'profile_timings': dict(self.profile_timings)
         }
 
+        # Run complete: a rerun starts fresh
+        self._clear_profile_checkpoints(data_with_scores, profile_scores)
+
         print("\n" + "=" * 80)
         print("ROTATION ENGINE BACKTEST COMPLETE")
         print("=" * 80)
@@ -269,6 +372,11 @@ class RotationEngine:
         """
         Run all 6 profile backtests.
 
+        With profile_workers > 1 the profiles run concurrently in a process
+        pool; results are merged in profile order either way, and a failing
+        profile raises as in the serial path. Wall time per profile is
+        recorded in self.profile_timings.
+
         Parameters:
         -----------
         data : pd.DataFrame
@@ -281,38 +389,148 @@ class RotationEngine:
         results : dict
             Mapping of profile names to backtest results
         """
-        runners = {
-            'profile_1': run_profile_1_backtest,
-            'profile_2': run_profile_2_backtest,
-            'profile_3': run_profile_3_backtest,
-            'profile_4': run_profile_4_backtest,
-            'profile_5': run_profile_5_backtest,
-            'profile_6': run_profile_6_backtest
+        runners = dict(PROFILE_RUNNERS)
+        self.profile_timings = {}
+
+        # Profiles finished by an earlier, interrupted run on the same inputs
+        checkpoints = self._profile_checkpoints(runners, data, profile_scores)
+        completed = {}
+        for profile_name, checkpoint in checkpoints.items():
+            state = checkpoint.load()
+            if state is not None:
+                completed[profile_name] = state
+                print(f"  {profile_name}: restored from checkpoint ({state['trades']} trades)")
+
+        pending = {name: runner for name, runner in runners.items() if name not in completed}
+        if self.profile_workers > 1:
+            fresh = self._run_profile_backtests_parallel(pending, data, profile_scores, checkpoints)
+        else:
+            fresh = self._run_profile_backtests_serial(pending, data, profile_scores, checkpoints)
+
+        # Merge in profile order
+        return {
+            name: completed[name]['results'] if name in completed else fresh[name]
+            for name in runners
         }
 
+    def _profile_checkpoints(
+        self,
+        runners: Dict,
+        data: pd.DataFrame,
+        profile_scores: pd.DataFrame
+    ) -> Dict[str, SimulationCheckpoint]:
+        """Per-profile result checkpoints, keyed by inputs and profile config."""
+        if not self.checkpoint_dir:
+            return {}
+
+        inputs = fingerprint(data_fingerprint(data), data_fingerprint(profile_scores))
+        return {
+            name: SimulationCheckpoint(
+                self.checkpoint_dir, f"engine_{name}",
+                fingerprint(inputs, name, getattr(runner, '__qualname__', repr(runner)), self.profile_configs[name]),
+                every=1
+            )
+            for name, runner in runners.items()
+        }
+
+    def _checkpoint_settings(self, profile_name: str) -> tuple:
+        """
+        checkpoint_env arguments for one profile's simulator: the profile
+        config is its checkpoint key, so changed parameters start fresh.
+        """
+        return (self.checkpoint_dir, self.checkpoint_every,
+                {'profile': profile_name, **self.profile_configs[profile_name]})
+
+    def _clear_profile_checkpoints(self, data: pd.DataFrame, profile_scores: pd.DataFrame):
+        for checkpoint in self._profile_checkpoints(dict(PROFILE_RUNNERS), data, profile_scores).values():
+            checkpoint.clear()
+
+    def _run_profile_backtests_serial(
+        self,
+        runners: Dict,
+        data: pd.DataFrame,
+        profile_scores: pd.DataFrame,
+        checkpoints: Dict[str, SimulationCheckpoint]
+    ) -> Dict[str, pd.DataFrame]:
+        """Run profile backtests one after another in this process."""
         results = {}
 
         for profile_name, runner in runners.items():
             config = self.profile_configs[profile_name]
 
             print(f"  Running {profile_name}...")
+            started = time.perf_counter()
             try:
-                profile_results, trades = runner(
-                    data=data,
-                    profile_scores=profile_scores,
-                    score_threshold=config['threshold'],
-                    regime_filter=config['regimes']
-                )
+                with checkpoint_env(*self._checkpoint_settings(profile_name)):
+                    profile_results, trades = runner(
+                        data=data,
+                        profile_scores=profile_scores,
+                        score_threshold=config['threshold'],
+                        regime_filter=config['regimes']
+                    )
+            except Exception as e:
+                self._raise_profile_failure(profile_name, e)
 
-                results[profile_name] = profile_results
-                print(f"    {len(trades)} trades executed")
+            self.profile_timings[profile_name] = time.perf_counter() - started
+            results[profile_name] = profile_results
+            print(f"    {len(trades)} trades executed ({self.profile_timings[profile_name]:.1f}s)")
+            if profile_name in checkpoints:
+                checkpoints[profile_name].save({'results': profile_results, 'trades': len(trades)})
 
-            except Exception as e:
-                import traceback
-                print(f"    ❌ CRITICAL: {profile_name} failed: {e}")
-                print("    " + "\n    ".join(traceback.format_exc().split('\n')))
-                # BUG FIX (2025-11-18): Agent #2/#10 found - don't mask failures silently
-                # RAISE error instead of creating dummy results - silent failures hide critical bugs
-                raise RuntimeError(f"Profile {profile_name} backtest failed - fix before continuing") from e
+        return results
+
+    def _run_profile_backtests_parallel(
+        self,
+        runners: Dict,
+        data: pd.DataFrame,
+        profile_scores: pd.DataFrame,
+        checkpoints: Dict[str, SimulationCheckpoint]
+    ) -> Dict[str, pd.DataFrame]:
+        """Run profile backtests in a process pool (see _run_profile_backtests)."""
+        if not runners:
+            return {}
+        workers = min(self.profile_workers, len(runners))
+        print(f"  Running {len(runners)} profiles on {workers} workers...")
+
+        results = {}
+        with tempfile.TemporaryDirectory(prefix='rotation_profiles_') as handoff_dir:
+            frames = {'data': data, 'profile_scores': profile_scores}
+            paths = _write_handoff(frames, handoff_dir)
+            initargs = (paths, None) if paths is not None else (None, frames)
+
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_profile_worker, initargs=initargs)
+            try:
+                futures = {
+                    profile_name: executor.submit(
+                        _run_profile_task, runner,
+                        self.profile_configs[profile_name]['threshold'],
+                        self.profile_configs[profile_name]['regimes'],
+                        self._checkpoint_settings(profile_name)
+                    )
+                    for profile_name, runner in runners.items()
+                }
+
+                # Merge in profile order so output does not depend on completion order
+                for profile_name, future in futures.items():
+                    try:
+                        profile_results, n_trades, seconds = future.result()
+                    except Exception as e:
+                        executor.shutdown(wait=True, cancel_futures=True)
+                        self._raise_profile_failure(profile_name, e)
+
+                    self.profile_timings[profile_name] = seconds
+                    results[profile_name] = profile_results
+                    print(f"  {profile_name}: {n_trades} trades executed ({seconds:.1f}s)")
+                    if profile_name in checkpoints:
+                        checkpoints[profile_name].save({'results': profile_results, 'trades': n_trades})
+            finally:
+                executor.shutdown(wait=True)
 
         return results
+
+    def _raise_profile_failure(self, profile_name: str, error: Exception):
+        print(f"    ❌ CRITICAL: {profile_name} failed: {error}")
+        print("    " + "\n    ".join("".join(traceback.format_exception(error)).split('\n')))
+        # BUG FIX (2025-11-18): Agent #2/#10 found - don't mask failures silently
+        # RAISE error instead of creating dummy results - silent failures hide critical bugs
+        raise RuntimeError(f"Profile {profile_name} backtest failed - fix before continuing") from error
@@ -2,10 +2,12 @@
 
 from .loaders import OptionsDataLoader, DataSpine
 from .features import add_derived_features, validate_features
+from .spine import RollingSpine
 
 __all__ = [
     'OptionsDataLoader',
     'DataSpine',
+    'RollingSpine',
     'add_derived_features',
     'validate_features'
 ]
@@ -0,0 +1,134 @@
+"""
+Shared chain arena: memory-mapped Arrow IPC day chains.
+
+Profiles and parameter sweeps that run in separate processes each used to
+parse and hold a private copy of every chain day. The arena keeps each day's
+prepared chain (PolygonOptionsLoader day-chain frame, compact schema) as one
+uncompressed Arrow IPC file:
+
+    <arena_root>/<UNDERLYING>/<YYYY>/<MM>/<YYYY-MM-DD>.arrow
+
+Loaders memory-map these files read-only. Numeric columns are zero-copy views
+of the mapping, so every process reading a day shares the same physical page-
+cache pages; only the small categorical codes and the contract index are
+private. Point the root at a RAM-backed filesystem (e.g. /dev/shm) to keep the
+arena out of disk I/O entirely.
+
+The arena is opt-in: loaders use it when the root exists, and days missing
+from it are published on first build (atomic rename, so concurrent writers are
+safe). Pre-build a range with scripts/build_chain_arena.py.
+"""
+
+import os
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+
+DEFAULT_CHAIN_ARENA_ROOT = "/Volumes/VelocityData/rotation_engine/chain_arena"
+
+
+@dataclass
+class ArenaDay:
+    """A day chain mapped from the arena, with the address range of its mapping."""
+
+    frame: pd.DataFrame
+    map_address: int
+    map_size: int
+
+    def shared_nbytes(self, arrays: Iterable[np.ndarray]) -> int:
+        """Bytes of the given arrays whose data lives in this day's mapping."""
+        lo, hi = self.map_address, self.map_address + self.map_size
+        total = 0
+        for values in arrays:
+            if isinstance(values, np.ndarray) and values.nbytes:
+                address = values.__array_interface__['data'][0]
+                if lo <= address < hi:
+                    total += values.nbytes
+        return total
+
+    def column_arrays(self) -> List[np.ndarray]:
+        """Numpy data behind each column (categorical codes for categoricals)."""
+        arrays = []
+        for col in self.frame.columns:
+            values = self.frame[col]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                values = values.cat.codes
+            arrays.append(values.to_numpy())
+        return arrays
+
+
+class ChainArena:
+    """Memory-mapped Arrow IPC day chains for one underlying."""
+
+    def __init__(self, root: Optional[str] = None, underlying: str = 'SPY'):
+        resolved_root = root or os.environ.get("POLYGON_CHAIN_ARENA_ROOT", DEFAULT_CHAIN_ARENA_ROOT)
+        self.root = Path(resolved_root).expanduser()
+        self.underlying = underlying
+
+    @property
+    def available(self) -> bool:
+        """True when the arena root exists (the arena is optional)."""
+        return self.root.exists()
+
+    def partition_path(self, trade_date: date) -> Path:
+        year = f"{trade_date.year:04d}"
+        month = f"{trade_date.month:02d}"
+        return self.root / self.underlying / year / month / f"{trade_date.isoformat()}.arrow"
+
+    def has_day(self, trade_date: date) -> bool:
+        return self.available and self.partition_path(trade_date).exists()
+
+    def read_day(self, trade_date: date) -> Optional[ArenaDay]:
+        """
+        Map one day read-only. Numeric columns are zero-copy views of the
+        mapping (read-only); None if the day is not in the arena.
+        """
+        path = self.partition_path(trade_date)
+        if not path.exists():
+            return None
+
+        try:
+            buffer = pa.memory_map(str(path)).read_buffer()
+            table = ipc.open_file(buffer).read_all()
+        except (OSError, pa.ArrowInvalid) as e:
+            print(f"Error mapping {path}: {e}")
+            return None
+
+        # split_blocks keeps one block per column, so numeric columns are not
+        # consolidated (copied) into 2-D blocks
+        frame = table.to_pandas(split_blocks=True)
+        return ArenaDay(frame=frame, map_address=buffer.address, map_size=buffer.size)
+
+    def write_day(self, trade_date: date, frame: pd.DataFrame) -> Path:
+        """Write one day chain atomically (temp file + rename)."""
+        path = self.partition_path(trade_date)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        table = pa.Table.from_pandas(frame.reset_index(drop=True), preserve_index=False)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with pa.OSFile(str(tmp_path), 'wb') as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+
+        return path
+
+    def list_dates(self) -> List[date]:
+        """All dates in the arena, sorted."""
+        base = self.root / self.underlying
+        if not base.exists():
+            return []
+
+        dates = []
+        for path in base.glob('*/*/*.arrow'):
+            try:
+                dates.append(date.fromisoformat(path.stem))
+            except ValueError:
+                continue
+        return sorted(dates)
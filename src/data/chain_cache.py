@@ -0,0 +1,226 @@
+"""
+Process-wide shared cache for parsed option chains.
+
+Every TradeSimulator used to own a PolygonOptionsLoader with a private cache,
+so a rotation run parsed each trading day once per profile. Loaders now share
+one ChainCache by default (get_shared_chain_cache), or take an injected one.
+
+The cache is an LRU bounded by an approximate byte budget, with hit/miss/
+eviction counters for sizing. Concurrent get_or_load calls for the same
+missing key (e.g. the prefetcher and the simulation reaching one day) share a
+single load. The budget counts resident (private) bytes;
+values backed by the shared chain arena (a `shared_nbytes` attribute) report
+their mapped bytes separately.
+
+Cached DataFrames are frozen (their numpy column data is marked read-only) so
+loaders can hand out zero-copy views instead of defensive copies: in-place
+writes to a cached frame raise, and a shallow view (df.copy(deep=False)) can
+take new columns without touching the shared entry.
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_CHAIN_CACHE_BYTES = 2 * 1024 ** 3  # 2 GiB
+
+
+def estimate_nbytes(value: Any) -> int:
+    """Approximate in-memory size of a cached value."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if hasattr(value, 'nbytes'):
+        return int(value.nbytes)
+    return sys.getsizeof(value)
+
+
+def freeze_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Mark a DataFrame's numpy-backed column data read-only (in place).
+
+    Returns the same frame. In-place writes (df.loc[...] = ..., writes through
+    .values) then raise ValueError; adding or replacing whole columns on a
+    shallow copy is still allowed and leaves the frozen frame untouched.
+    """
+    for block in getattr(df._mgr, 'blocks', ()):
+        values = getattr(block.values, '_ndarray', block.values)
+        if isinstance(values, np.ndarray):
+            values.flags.writeable = False
+    return df
+
+
+class ChainCache:
+    """Thread-safe LRU cache with a byte budget and usage counters."""
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        if max_bytes is None:
+            max_bytes = int(os.environ.get("CHAIN_CACHE_MAX_BYTES", DEFAULT_CHAIN_CACHE_BYTES))
+        self.max_bytes = max_bytes
+
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._lock = threading.RLock()
+        self._loading: Dict[Hashable, Future] = {}
+
+        self.current_bytes = 0
+        self.shared_bytes = 0
+        self._shared: Dict[Hashable, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return cached value (marking it most recently used) or None."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any, nbytes: Optional[int] = None):
+        """
+        Insert value, evicting least recently used entries to stay within budget.
+
+        DataFrame values are frozen read-only - callers must not mutate them.
+        """
+        if isinstance(value, pd.DataFrame):
+            freeze_frame(value)
+        if nbytes is None:
+            nbytes = estimate_nbytes(value)
+        shared = int(getattr(value, 'shared_nbytes', 0))
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = value
+            self._sizes[key] = nbytes
+            self._shared[key] = shared
+            self.current_bytes += nbytes
+            self.shared_bytes += shared
+
+            # Always keep the newest entry, even if it alone exceeds the budget
+            while self.current_bytes > self.max_bytes and len(self._entries) > 1:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: Hashable):
+        del self._entries[key]
+        self.current_bytes -= self._sizes.pop(key)
+        self.shared_bytes -= self._shared.pop(key)
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """Remove and return a cached value (None if absent)."""
+        with self._lock:
+            value = self._entries.get(key)
+            if key in self._entries:
+                self._remove(key)
+            return value
+
+    def get_or_load(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """
+        Return cached value, or load, cache and return it.
+
+        Only one caller loads a missing key; concurrent callers for the same
+        key wait for that load (and see its exception if it fails).
+        """
+        with self._lock:
+            value = self.get(key)
+            if value is not None:
+                return value
+            pending = self._loading.get(key)
+            loading = pending is None
+            if loading:
+                pending = self._loading[key] = Future()
+
+        if not loading:
+            return pending.result()
+
+        try:
+            value = load()
+            self.put(key, value)
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        else:
+            pending.set_result(value)
+        finally:
+            with self._lock:
+                del self._loading[key]
+        return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._shared.clear()
+            self.current_bytes = 0
+            self.shared_bytes = 0
+
+    def discard(self, predicate: Callable[[Hashable], bool]):
+        """Drop entries whose key matches predicate."""
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                self._remove(key)
+
+    def reset_stats(self):
+        """Zero the hit/miss/eviction counters."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Usage counters and current footprint (resident vs arena-shared bytes)."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'resident_bytes': self.current_bytes,
+                'shared_bytes': self.shared_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+
+_shared_cache: Optional[ChainCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_chain_cache() -> ChainCache:
+    """Process-wide cache used by loaders that are not given one explicitly."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = ChainCache()
+        return _shared_cache
+
+
+def set_shared_chain_cache(cache: Optional[ChainCache]):
+    """Replace the process-wide cache (None resets to a fresh default on next use)."""
+    global _shared_cache
+    with _shared_lock:
+        _shared_cache = cache
@@ -0,0 +1,120 @@
+"""
+Compact canonical schema for cached option chains.
+
+Parsed chains used to hold trade date and expiry as Python date objects,
+option_type as Python strings, and every number as 64-bit. Cached days now
+use a compact layout:
+
+    date, expiry, option_type, underlying   categorical (int8 codes + a few objects)
+    strike_cents                            int32 (replaces float strike)
+    dte                                     int16
+    open/high/low/close/mid/bid/ask         float64, or float32 when enabled
+    volume, transactions                    int32 (when they fit)
+
+Strikes are kept in cents rather than tenths - some adjusted contracts have
+cent strikes, and ContractIndex already keys on cents.
+
+Loader APIs return the familiar layout: expand_chain() at the API edge turns
+categoricals back into object columns (sharing the category objects) and
+strike_cents back into a float64 `strike`. Internal code reads compact or
+expanded frames through chain_strikes / chain_day_ordinals.
+"""
+
+import os
+import numpy as np
+import pandas as pd
+from typing import Optional
+
+
+# Store prices as float32 in cached chains (halves price memory; ~7 significant digits)
+DEFAULT_CHAIN_FLOAT32_PRICES = False
+
+CATEGORICAL_COLUMNS = ['date', 'expiry', 'option_type', 'underlying']
+PRICE_COLUMNS = ['open', 'high', 'low', 'close', 'mid', 'bid', 'ask']
+COUNT_COLUMNS = ['volume', 'transactions']
+
+_INT32_MAX = np.iinfo(np.int32).max
+
+
+def float32_prices_enabled() -> bool:
+    value = os.environ.get("CHAIN_FLOAT32_PRICES")
+    if value is None:
+        return DEFAULT_CHAIN_FLOAT32_PRICES
+    return value.strip().lower() in ('1', 'true', 'yes')
+
+
+def compact_columns(columns) -> list:
+    """Column list with 'strike' renamed to its compact 'strike_cents'."""
+    return ['strike_cents' if c == 'strike' else c for c in columns]
+
+
+def compact_chain(df: pd.DataFrame, float32_prices: Optional[bool] = None) -> pd.DataFrame:
+    """
+    Convert a parsed chain to the compact schema (idempotent; unknown columns kept).
+    """
+    if float32_prices is None:
+        float32_prices = float32_prices_enabled()
+
+    out = {}
+    for col in df.columns:
+        values = df[col]
+        if col in CATEGORICAL_COLUMNS:
+            out[col] = values if isinstance(values.dtype, pd.CategoricalDtype) else values.astype('category')
+        elif col == 'strike':
+            out['strike_cents'] = np.rint(values.to_numpy(dtype=float) * 100).astype(np.int32)
+        elif col in PRICE_COLUMNS:
+            out[col] = values.to_numpy(dtype=np.float32 if float32_prices else np.float64)
+        elif col in COUNT_COLUMNS and values.dtype.kind in 'iu':
+            counts = values.to_numpy()
+            fits = len(counts) == 0 or (counts.min() >= 0 and counts.max() <= _INT32_MAX)
+            out[col] = counts.astype(np.int32) if fits else counts
+        elif col == 'dte' and values.dtype.kind in 'iu':
+            out[col] = values.to_numpy().astype(np.int16)
+        else:
+            out[col] = values
+
+    return pd.DataFrame(out, index=df.index)
+
+
+def expand_chain(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compact chain -> API layout (object dates/strings, float64 strike and
+    prices, int64 counts). Float64 price columns stay zero-copy views.
+    """
+    out = df.copy(deep=False)
+    for col in df.columns:
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            out[col] = np.asarray(values, dtype=object)
+        elif col in PRICE_COLUMNS and values.dtype != np.float64:
+            out[col] = values.to_numpy(dtype=np.float64)
+        elif (col in COUNT_COLUMNS or col == 'dte') and values.dtype.kind in 'iu' and values.dtype.itemsize < 8:
+            out[col] = values.to_numpy().astype(np.int64)
+
+    if 'strike_cents' in out.columns:
+        loc = out.columns.get_loc('strike_cents')
+        strikes = out['strike_cents'].to_numpy() / 100.0
+        out = out.drop(columns='strike_cents')
+        out.insert(loc, 'strike', strikes)
+
+    return out
+
+
+def chain_strikes(df: pd.DataFrame) -> np.ndarray:
+    """Float64 strikes of a compact or expanded chain."""
+    if 'strike_cents' in df.columns:
+        return df['strike_cents'].to_numpy() / 100.0
+    return df['strike'].to_numpy(dtype=float)
+
+
+def chain_day_ordinals(values: pd.Series) -> np.ndarray:
+    """Proleptic ordinals (int64) of a date column, categorical or object."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        categories = values.cat.categories
+        ordinals = np.fromiter((pd.Timestamp(d).toordinal() for d in categories),
+                               dtype=np.int64, count=len(categories))
+        codes = values.cat.codes.to_numpy()
+        return ordinals[codes]
+
+    lookup = {d: pd.Timestamp(d).toordinal() for d in pd.unique(values)}
+    return values.map(lookup).to_numpy(dtype=np.int64)
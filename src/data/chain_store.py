@@ -0,0 +1,140 @@
+"""
+Columnar options chain store.
+
+Polygon day_aggs files carry every OPRA contract for a day, gzipped as CSV.
+Parsing one costs seconds; the SPY slice we actually use is a tiny fraction.
+This store holds the pre-parsed SPY slice as one Parquet partition per day:
+
+    <store_root>/<UNDERLYING>/<YYYY>/<MM>/<YYYY-MM-DD>.parquet
+
+Rows are sorted by (expiry, option_type, strike) on write, whatever order
+the source frame is in, so with small row groups the min/max statistics let
+expiry/strike predicates skip most of a partition.
+
+Build it once with scripts/build_options_chain_store.py. Loaders read a
+partition when present and fall back to the raw CSV.gz when it is missing.
+"""
+
+import os
+import pandas as pd
+from pathlib import Path
+from datetime import date
+from typing import Optional, List
+
+
+DEFAULT_CHAIN_STORE_ROOT = "/Volumes/VelocityData/rotation_engine/chain_store/day_aggs"
+
+# Rows per Parquet row group (a SPY day is a few thousand contracts)
+DEFAULT_CHAIN_ROW_GROUP_SIZE = 1024
+
+# Columns persisted per contract (trade date is implied by the partition)
+CHAIN_STORE_COLUMNS = [
+    'ticker', 'underlying', 'expiry', 'strike', 'option_type',
+    'open', 'high', 'low', 'close',
+    'volume', 'transactions', 'window_start'
+]
+
+# Row order within a partition (lets row group statistics prune predicates)
+CHAIN_STORE_SORT_KEYS = ['expiry', 'option_type', 'strike']
+
+
+class OptionsChainStore:
+    """Date-partitioned Parquet dataset of pre-parsed option chains."""
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        underlying: str = 'SPY',
+        row_group_size: int = DEFAULT_CHAIN_ROW_GROUP_SIZE
+    ):
+        resolved_root = root or os.environ.get("POLYGON_CHAIN_STORE_ROOT", DEFAULT_CHAIN_STORE_ROOT)
+        self.root = Path(resolved_root).expanduser()
+        self.underlying = underlying
+        self.row_group_size = row_group_size
+
+    @property
+    def available(self) -> bool:
+        """True when the store root exists (store is optional)."""
+        return self.root.exists()
+
+    def partition_path(self, trade_date: date) -> Path:
+        """Path of the Parquet partition for a trade date."""
+        year = trade_date.year
+        month = f"{trade_date.month:02d}"
+        day = f"{trade_date.day:02d}"
+        return self.root / self.underlying / str(year) / month / f"{year}-{month}-{day}.parquet"
+
+    def has_day(self, trade_date: date) -> bool:
+        """Check whether a partition exists for this date."""
+        return self.partition_path(trade_date).exists()
+
+    def read_day(self, trade_date: date, filters: Optional[List[tuple]] = None) -> Optional[pd.DataFrame]:
+        """
+        Read one day's chain.
+
+        Args:
+            trade_date: Partition date
+            filters: Optional pyarrow predicates, e.g. [('expiry', '>=', d)];
+                row groups whose statistics exclude them are not decoded
+
+        Returns:
+            DataFrame in the same layout the raw CSV parser produces
+            (raw Polygon columns + underlying/expiry/strike/option_type + date),
+            or None when the partition is missing so callers can fall back.
+        """
+        path = self.partition_path(trade_date)
+        if not path.exists():
+            return None
+
+        try:
+            df = pd.read_parquet(path, filters=filters)
+        except Exception as e:
+            print(f"Error loading {path}: {e}")
+            return None
+
+        if df.empty:
+            return pd.DataFrame()
+
+        df['date'] = trade_date
+        return df
+
+    def write_day(self, trade_date: date, df: pd.DataFrame) -> Path:
+        """
+        Write one day's parsed chain atomically.
+
+        Rows are sorted by (expiry, option_type, strike) so row group
+        statistics prune expiry/strike predicates. An empty frame is still
+        written so days with no contracts are not re-parsed from raw on every
+        read.
+        """
+        path = self.partition_path(trade_date)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if df.empty:
+            out = pd.DataFrame(columns=CHAIN_STORE_COLUMNS)
+        else:
+            out = df[[c for c in CHAIN_STORE_COLUMNS if c in df.columns]]
+            sort_keys = [c for c in CHAIN_STORE_SORT_KEYS if c in out.columns]
+            out = out.sort_values(sort_keys, kind='stable').reset_index(drop=True)
+
+        # Write to a temp file then rename so readers never see a partial partition
+        tmp_path = path.with_name(path.name + '.tmp')
+        out.to_parquet(tmp_path, index=False, row_group_size=self.row_group_size)
+        os.replace(tmp_path, path)
+
+        return path
+
+    def list_dates(self) -> List[date]:
+        """All dates with a partition, sorted."""
+        base = self.root / self.underlying
+        if not base.exists():
+            return []
+
+        dates = []
+        for path in base.glob('*/*/*.parquet'):
+            try:
+                dates.append(date.fromisoformat(path.stem))
+            except ValueError:
+                continue
+
+        return sorted(dates)
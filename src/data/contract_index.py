@@ -0,0 +1,274 @@
+"""
+Per-day contract lookup index and bid/ask overlay.
+
+ContractIndex maps (expiry, option_type, strike in cents) to a row of a day's
+parsed chain, so single-contract price lookups are a dict hit instead of a
+boolean scan over the whole chain. It depends only on the parsed chain, so it
+is built once per date. Nearest-contract snaps use per-option-type sorted
+expiry/strike arrays, and expiry/DTE predicates a row order sorted by expiry
+(both built on first use and probed with searchsorted).
+
+SpreadOverlay holds the modeled bid/ask for one (date, spot, RV) input. It is
+a pair of float arrays aligned with the chain rows - cheap to compute and
+small to memoize.
+"""
+
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional, Dict, Tuple
+
+from .chain_schema import chain_day_ordinals, chain_strikes
+
+
+BASE_QUOTE_COLUMNS = ['open', 'high', 'low', 'close', 'mid', 'volume']
+
+OPTION_TYPE_CODES = {'call': 0, 'put': 1}
+
+_STRIKE_SPAN = 10 ** 9  # strike cents stay well below this
+
+
+def expiry_ordinal(expiry) -> int:
+    """Proleptic ordinal of an expiry given as date, datetime or pd.Timestamp."""
+    if isinstance(expiry, datetime):
+        expiry = expiry.date()
+    elif not isinstance(expiry, date):
+        expiry = pd.Timestamp(expiry).date()
+    return expiry.toordinal()
+
+
+def strike_cents(strike: float) -> int:
+    """Strike rounded to whole cents (lookups tolerate sub-cent float noise)."""
+    return int(round(float(strike) * 100))
+
+
+def contract_key(strike: float, expiry, option_type: str) -> Optional[int]:
+    """Single int64 key for (expiry, option_type, strike cents)."""
+    type_code = OPTION_TYPE_CODES.get(option_type)
+    if type_code is None:
+        return None
+    return (expiry_ordinal(expiry) * 2 + type_code) * _STRIKE_SPAN + strike_cents(strike)
+
+
+def contract_keys(df: pd.DataFrame) -> np.ndarray:
+    """
+    Vectorized contract_key over a chain DataFrame (expiry, option_type,
+    strike or strike_cents; compact or expanded schema).
+
+    Rows with an unknown option_type get key -1.
+    """
+    ordinals = chain_day_ordinals(df['expiry'])
+    type_codes = np.asarray(df['option_type'].map(OPTION_TYPE_CODES), dtype=float)
+    type_codes = np.where(np.isnan(type_codes), -1, type_codes).astype(np.int64)
+    if 'strike_cents' in df.columns:
+        cents = df['strike_cents'].to_numpy().astype(np.int64)
+    else:
+        cents = np.rint(df['strike'].to_numpy(dtype=float) * 100).astype(np.int64)
+    keys = (ordinals * 2 + type_codes) * _STRIKE_SPAN + cents
+    keys[type_codes < 0] = -1
+    return keys
+
+
+def quote_mask(close: np.ndarray, bid: np.ndarray, ask: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    """
+    Rows that pass the garbage-quote filter:
+    positive close/bid/ask, ask >= bid, non-zero volume.
+    """
+    return (close > 0) & (bid > 0) & (ask > 0) & (ask >= bid) & (volume > 0)
+
+
+def garbage_mask(df: pd.DataFrame) -> np.ndarray:
+    """quote_mask over a chain DataFrame (one pass, no intermediate frames)."""
+    if df.empty:
+        return np.zeros(0, dtype=bool)
+    return quote_mask(
+        df['close'].to_numpy(), df['bid'].to_numpy(),
+        df['ask'].to_numpy(), df['volume'].to_numpy()
+    )
+
+
+@dataclass
+class SpreadOverlay:
+    """Modeled bid/ask for one day's chain under one spread input."""
+
+    bid: np.ndarray
+    ask: np.ndarray
+    valid: np.ndarray  # quote_mask result
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.bid.nbytes + self.ask.nbytes + self.valid.nbytes)
+
+
+class ContractIndex:
+    """Hash index over one day's parsed chain (built once, read many times)."""
+
+    def __init__(self, df: pd.DataFrame):
+        self.size = len(df)
+        self.strikes = chain_strikes(df) if self.size else np.zeros(0)
+        self.expiries = np.asarray(df['expiry'], dtype=object) if self.size else np.zeros(0, dtype=object)
+        self.option_types = np.asarray(df['option_type'], dtype=object) if self.size else np.zeros(0, dtype=object)
+        self.expiry_ordinals = chain_day_ordinals(df['expiry']) if self.size else np.zeros(0, dtype=np.int64)
+        self.columns = {
+            col: df[col].to_numpy(dtype=float)
+            for col in BASE_QUOTE_COLUMNS if col in df.columns
+        }
+
+        self._first_row: Dict[int, int] = {}
+        self._duplicates: Dict[int, np.ndarray] = {}
+        self._nearest_tables: Dict[str, Optional[Tuple[np.ndarray, ...]]] = {}
+        self._expiry_sorted: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        if self.size:
+            self._build(contract_keys(df))
+
+    def _build(self, keys: np.ndarray):
+        """Map key -> first row position (matches iloc[0] semantics); remember duplicates."""
+        positions = np.flatnonzero(keys >= 0)
+        if len(positions) == 0:
+            return
+        order = positions[np.argsort(keys[positions], kind='stable')]
+        sorted_keys = keys[order]
+        unique_keys, first, counts = np.unique(sorted_keys, return_index=True, return_counts=True)
+        self._first_row = dict(zip(unique_keys.tolist(), order[first].tolist()))
+        for i in np.flatnonzero(counts > 1):
+            self._duplicates[int(unique_keys[i])] = order[first[i]:first[i] + counts[i]]
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [self.strikes, self.expiries, self.option_types, self.expiry_ordinals] + list(self.columns.values())
+        return int(sum(a.nbytes for a in arrays)) + 100 * len(self._first_row)
+
+    def find(self, strike: float, expiry, option_type: str, valid: Optional[np.ndarray] = None) -> Optional[int]:
+        """
+        Row position of a contract, or None.
+
+        If `valid` is given, returns the first row for the contract that is valid.
+        """
+        key = contract_key(strike, expiry, option_type)
+        if key is None:
+            return None
+
+        pos = self._first_row.get(key)
+        if pos is None or valid is None or valid[pos]:
+            return pos
+
+        for candidate in self._duplicates.get(key, ()):
+            if valid[candidate]:
+                return int(candidate)
+        return None
+
+    def rows_in_expiry_range(self, first: Optional[int] = None, last: Optional[int] = None) -> np.ndarray:
+        """
+        Row positions (ascending) whose expiry ordinal is within [first, last]
+        (None = unbounded): a searchsorted range over the expiry-sorted rows.
+        """
+        if self._expiry_sorted is None:
+            ordinals = self.expiry_ordinals
+            order = np.argsort(ordinals, kind='stable')
+            self._expiry_sorted = (ordinals[order], order)
+
+        ordinals, order = self._expiry_sorted
+        lo = 0 if first is None else int(np.searchsorted(ordinals, first, side='left'))
+        hi = len(ordinals) if last is None else int(np.searchsorted(ordinals, last, side='right'))
+        return np.sort(order[lo:hi])
+
+    def _nearest_table(self, option_type: str) -> Optional[Tuple[np.ndarray, ...]]:
+        """
+        Sorted search arrays for one option type (built on first use):
+        unique expiry ordinals, block offsets into the strike arrays, and per
+        expiry the unique strikes ascending with their first row position.
+        """
+        if option_type in self._nearest_tables:
+            return self._nearest_tables[option_type]
+
+        rows = np.flatnonzero(self.option_types == option_type) if self.size else np.zeros(0, dtype=np.int64)
+        if len(rows) == 0:
+            self._nearest_tables[option_type] = None
+            return None
+
+        ordinals = self.expiry_ordinals[rows]
+        strikes = self.strikes[rows]
+
+        # Sort by (expiry, strike, row); the first row of an (expiry, strike) wins
+        order = np.lexsort((rows, strikes, ordinals))
+        ordinals, strikes, rows = ordinals[order], strikes[order], rows[order]
+        first = np.ones(len(rows), dtype=bool)
+        first[1:] = (ordinals[1:] != ordinals[:-1]) | (strikes[1:] != strikes[:-1])
+        ordinals, strikes, rows = ordinals[first], strikes[first], rows[first]
+
+        unique_ordinals, starts = np.unique(ordinals, return_index=True)
+        offsets = np.append(starts, len(ordinals))
+        table = (unique_ordinals, offsets, strikes, rows)
+        self._nearest_tables[option_type] = table
+        return table
+
+    def nearest(self, strike: float, expiry, option_type: str) -> Optional[Tuple[int, int, float]]:
+        """
+        Closest contract of a type: smallest expiry distance in days, then
+        smallest strike distance, then earliest row (the order a stable sort of
+        the chain by (expiry_diff, strike_diff) gives).
+
+        Returns:
+            (row position, expiry_diff days, strike_diff) or None if the day
+            has no contracts of this type
+        """
+        table = self._nearest_table(option_type)
+        if table is None:
+            return None
+        unique_ordinals, offsets, strikes, rows = table
+
+        target = expiry_ordinal(expiry)
+        j = int(np.searchsorted(unique_ordinals, target))
+        candidates = [k for k in (j - 1, j) if 0 <= k < len(unique_ordinals)]
+        expiry_diffs = [abs(int(unique_ordinals[k]) - target) for k in candidates]
+        expiry_diff = min(expiry_diffs)
+
+        best = None  # (strike_diff, row)
+        for k, diff in zip(candidates, expiry_diffs):
+            if diff != expiry_diff:
+                continue
+            lo, hi = int(offsets[k]), int(offsets[k + 1])
+            i = lo + int(np.searchsorted(strikes[lo:hi], strike))
+            for m in (i - 1, i):
+                if lo <= m < hi:
+                    candidate = (abs(float(strikes[m]) - strike), int(rows[m]))
+                    if not np.isnan(candidate[0]) and (best is None or candidate < best):
+                        best = candidate
+
+        if best is None:
+            return None
+        return best[1], expiry_diff, best[0]
+
+    def quote(self, pos: int, overlay: Optional[SpreadOverlay] = None) -> Dict:
+        """Quote record (contract + price columns, bid/ask from overlay) for a row position."""
+        record = {
+            'strike': float(self.strikes[pos]),
+            'expiry': self.expiries[pos],
+            'option_type': self.option_types[pos],
+        }
+        for col, values in self.columns.items():
+            record[col] = float(values[pos])
+        if overlay is not None:
+            record['bid'] = float(overlay.bid[pos])
+            record['ask'] = float(overlay.ask[pos])
+        return record
+
+
+@dataclass
+class DayChain:
+    """
+    One date's parsed chain (spot-independent columns) with its index.
+
+    shared_nbytes counts frame/index data mapped from the chain arena (shared
+    between processes); nbytes is the private, resident remainder.
+    """
+
+    frame: pd.DataFrame
+    index: ContractIndex
+    shared_nbytes: int = 0
+
+    @property
+    def nbytes(self) -> int:
+        total = int(self.frame.memory_usage(index=True, deep=True).sum()) + self.index.nbytes
+        return max(total - self.shared_nbytes, 0)
@@ -0,0 +1,217 @@
+"""
+Per-contract time-series panel.
+
+Walking a trade day by day used to cost one chain lookup per leg per day.
+The panel stores every contract's whole life contiguously, so a trade's path
+is one slice:
+
+    <panel_root>/<UNDERLYING>/
+        keys.npy      int64   sorted contract keys (contract_index.contract_key)
+        offsets.npy   int64   rows of keys[i] are offsets[i]:offsets[i + 1]
+        day.npy       int32   trade date as proleptic ordinal
+        open/high/low/close/volume.npy   float64
+        meta.json     underlying, first/last date, counts
+
+Rows are sorted by (contract, date). Arrays are memory-mapped read-only, so
+opening a panel costs nothing until a slice is touched.
+
+Only spot-independent columns are stored. Bid/ask depend on the spot/RV
+inputs of the spread model and are computed on the slice
+(PolygonOptionsLoader.model_bid_ask).
+
+Build it with scripts/build_contract_panel.py.
+"""
+
+import json
+import os
+import numpy as np
+from pathlib import Path
+from datetime import date
+from typing import Dict, Iterable, Optional
+
+from .contract_index import contract_key, contract_keys, expiry_ordinal
+
+
+DEFAULT_CONTRACT_PANEL_ROOT = "/Volumes/VelocityData/rotation_engine/contract_panel"
+
+PANEL_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class ContractPanel:
+    """Memory-mapped (contract -> daily bars) panel for one underlying."""
+
+    def __init__(self, root: Optional[str] = None, underlying: str = 'SPY'):
+        resolved_root = root or os.environ.get("CONTRACT_PANEL_ROOT", DEFAULT_CONTRACT_PANEL_ROOT)
+        self.root = Path(resolved_root).expanduser()
+        self.underlying = underlying
+        self.panel_dir = self.root / underlying
+
+        self._arrays: Optional[Dict[str, np.ndarray]] = None
+        self._positions: Optional[Dict[int, int]] = None
+
+    @property
+    def available(self) -> bool:
+        """True when a built panel exists (panel is optional)."""
+        return (self.panel_dir / 'meta.json').exists()
+
+    @property
+    def meta(self) -> Dict:
+        with open(self.panel_dir / 'meta.json') as f:
+            return json.load(f)
+
+    def _load(self) -> Dict[str, np.ndarray]:
+        if self._arrays is None:
+            if not self.available:
+                raise FileNotFoundError(
+                    f"Contract panel not found at {self.panel_dir}. "
+                    "Build it with scripts/build_contract_panel.py or set CONTRACT_PANEL_ROOT."
+                )
+            self._arrays = {
+                name: np.load(self.panel_dir / f"{name}.npy", mmap_mode='r')
+                for name in ['keys', 'offsets', 'day'] + PANEL_COLUMNS
+            }
+            keys = self._arrays['keys']
+            self._positions = dict(zip(keys.tolist(), range(len(keys))))
+        return self._arrays
+
+    def __len__(self) -> int:
+        """Number of contracts."""
+        return len(self._load()['keys'])
+
+    def contract_slice(self, strike: float, expiry, option_type: str) -> Optional[slice]:
+        """Row range of one contract, or None if it never traded."""
+        arrays = self._load()
+        key = contract_key(strike, expiry, option_type)
+        i = self._positions.get(key) if key is not None else None
+        if i is None:
+            return None
+        return slice(int(arrays['offsets'][i]), int(arrays['offsets'][i + 1]))
+
+    def path(
+        self,
+        strike: float,
+        expiry,
+        option_type: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """
+        One contract's daily bars, optionally limited to [start, end].
+
+        Returns:
+            Dict of equal-length arrays: 'date' (datetime64[D]), 'dte',
+            open/high/low/close, 'mid' (= close), 'volume' - or None if the
+            contract is not in the panel. Arrays are read-only views.
+        """
+        rows = self.contract_slice(strike, expiry, option_type)
+        if rows is None:
+            return None
+
+        arrays = self._arrays
+        day = arrays['day'][rows]
+        lo, hi = 0, len(day)
+        if start is not None:
+            lo = int(np.searchsorted(day, start.toordinal(), side='left'))
+        if end is not None:
+            hi = int(np.searchsorted(day, end.toordinal(), side='right'))
+        day = day[lo:hi]
+
+        result = {
+            'date': (day.astype(np.int64) - _EPOCH_ORDINAL).astype('datetime64[D]'),
+            'dte': expiry_ordinal(expiry) - day.astype(np.int64),
+        }
+        for col in PANEL_COLUMNS:
+            result[col] = arrays[col][rows][lo:hi]
+        result['mid'] = result['close']
+        return result
+
+    @staticmethod
+    def build(frames: Iterable, root: Optional[str] = None, underlying: str = 'SPY') -> 'ContractPanel':
+        """
+        Build a panel from per-day parsed chains and write it atomically.
+
+        Args:
+            frames: iterable of DataFrames with date, expiry, strike,
+                option_type and open/high/low/close/volume columns (one day each,
+                e.g. PolygonOptionsLoader._read_day)
+            root: panel root (default DEFAULT_CONTRACT_PANEL_ROOT / env)
+            underlying: subdirectory name
+
+        A contract quoted twice on one day keeps its first row (the row a
+        ContractIndex lookup returns).
+        """
+        panel = ContractPanel(root, underlying)
+
+        key_parts, day_parts = [], []
+        col_parts = {col: [] for col in PANEL_COLUMNS}
+        for df in frames:
+            if df is None or df.empty:
+                continue
+            keys = contract_keys(df)
+            keep = keys >= 0
+            day = np.fromiter((d.toordinal() for d in df['date']), dtype=np.int32, count=len(df))
+            key_parts.append(keys[keep])
+            day_parts.append(day[keep])
+            for col in PANEL_COLUMNS:
+                col_parts[col].append(df[col].to_numpy(dtype=float)[keep])
+
+        if key_parts:
+            keys = np.concatenate(key_parts)
+            day = np.concatenate(day_parts)
+        else:
+            keys = np.zeros(0, dtype=np.int64)
+            day = np.zeros(0, dtype=np.int32)
+
+        # Sort by (contract, date); stable so the first row of a duplicate wins
+        order = np.lexsort((day, keys))
+        keys = keys[order]
+        day = day[order]
+        first = np.ones(len(keys), dtype=bool)
+        first[1:] = (keys[1:] != keys[:-1]) | (day[1:] != day[:-1])
+        order = order[first]
+        keys = keys[first]
+        day = day[first]
+
+        unique_keys, starts = np.unique(keys, return_index=True)
+        offsets = np.append(starts, len(keys)).astype(np.int64)
+
+        arrays = {'keys': unique_keys.astype(np.int64), 'offsets': offsets, 'day': day}
+        for col in PANEL_COLUMNS:
+            values = np.concatenate(col_parts[col]) if col_parts[col] else np.zeros(0)
+            arrays[col] = values[order]
+
+        meta = {
+            'underlying': underlying,
+            'contracts': int(len(unique_keys)),
+            'rows': int(len(keys)),
+            'first_date': date.fromordinal(int(day.min())).isoformat() if len(day) else None,
+            'last_date': date.fromordinal(int(day.max())).isoformat() if len(day) else None,
+        }
+        panel._write(arrays, meta)
+        return panel
+
+    def _write(self, arrays: Dict[str, np.ndarray], meta: Dict):
+        """Write arrays to a temp directory, then swap it in."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.panel_dir.with_name(self.panel_dir.name + '.tmp')
+        tmp_path.mkdir(exist_ok=True)
+
+        for name, values in arrays.items():
+            np.save(tmp_path / f"{name}.npy", values)
+        with open(tmp_path / 'meta.json', 'w') as f:
+            json.dump(meta, f, indent=2)
+
+        if self.panel_dir.exists():
+            old_path = self.panel_dir.with_name(self.panel_dir.name + '.old')
+            os.replace(self.panel_dir, old_path)
+            os.replace(tmp_path, self.panel_dir)
+            for child in old_path.iterdir():
+                child.unlink()
+            old_path.rmdir()
+        else:
+            os.replace(tmp_path, self.panel_dir)
+
+        self._arrays = None
+        self._positions = None
@@ -12,6 +12,11 @@ import pandas as pd
 import numpy as np
 
 
+# Prior rows a row's features depend on: slope_MA50 looks 5 rows back at an
+# MA50 (49 more rows), and the first return needs one more close
+FEATURE_WARMUP_ROWS = 55
+
+
 def compute_returns(df: pd.DataFrame) -> pd.DataFrame:
     """Compute log returns."""
     df = df.copy()
@@ -182,6 +187,34 @@ def add_derived_features(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def extend_derived_features(featured: pd.DataFrame, new_rows: pd.DataFrame) -> pd.DataFrame:
+    """
+    Append OHLCV rows to an already-featured frame.
+
+    Only the trailing FEATURE_WARMUP_ROWS rows are recomputed together with the
+    new rows (every feature is a fixed trailing window), so extending a long
+    spine by one day costs the same as featurizing ~55 rows.
+
+    Args:
+        featured: Output of add_derived_features (sorted by date)
+        new_rows: SPY OHLCV rows dated after featured's last row
+
+    Returns:
+        DataFrame with all rows and derived features
+    """
+    if featured is None or featured.empty:
+        return add_derived_features(new_rows)
+    if new_rows.empty:
+        return featured
+
+    base_cols = [c for c in new_rows.columns if c in featured.columns]
+    context = featured[base_cols].iloc[-FEATURE_WARMUP_ROWS:]
+    recomputed = add_derived_features(pd.concat([context, new_rows], ignore_index=True))
+
+    appended = recomputed.iloc[len(context):]
+    return pd.concat([featured, appended], ignore_index=True)
+
+
 def validate_features(df: pd.DataFrame) -> dict:
     """
     Validate feature calculations.
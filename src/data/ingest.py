@@ -0,0 +1,425 @@
+"""
+Incremental daily ingest of raw Polygon files.
+
+Three raw sources feed the derived stores:
+
+    stock_minutes   <stock_raw_root>/<YYYY-MM-DD>.csv.gz          -> SPY minute parquet per day
+    option_day      <day_aggs_root>/<YYYY>/<MM>/<YYYY-MM-DD>.csv.gz -> OptionsChainStore partitions
+    option_minute   <minute_aggs_root>/<YYYY>/<MM>/<...>.csv.gz     -> MinuteBarStore partitions
+
+The per-source build scripts re-check or re-parse whole date ranges. The
+ingest keeps its own state file recording, per source and day, the raw file's
+size, mtime and SHA-256 at conversion time. A run lists the raw roots through
+their coverage manifests and converts only:
+
+    - days not in the state file, or whose outputs are missing
+    - days whose size/mtime changed AND whose checksum changed (a copy or touch
+      that leaves the content intact only updates the recorded signature)
+
+Conversions run in worker processes (each recycled after a bounded number of
+files), read raw CSVs in chunks filtered to the wanted tickers before parsing,
+and write every output and the state file atomically (temp file + rename). A
+nightly run therefore costs one directory listing per source plus the new day.
+
+Run it with scripts/ingest_daily.py.
+"""
+
+import json
+import os
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .chain_store import OptionsChainStore, DEFAULT_CHAIN_STORE_ROOT
+from .manifest import file_sha256, get_manifest
+from .minute_store import MinuteBarStore, DEFAULT_MINUTE_STORE_ROOT
+from .option_tickers import split_by_underlying
+
+
+DEFAULT_INGEST_STATE_PATH = "/Volumes/VelocityData/rotation_engine/ingest_state.json"
+
+DEFAULT_STOCK_RAW_ROOT = "/Volumes/VelocityData/velocity_om/raw/stock"
+DEFAULT_STOCK_MINUTE_ROOT = "/Volumes/VelocityData/velocity_om/parquet/stock/SPY"
+DEFAULT_OPTION_DAY_ROOT = "/Volumes/VelocityData/polygon_downloads/us_options_opra/day_aggs_v1"
+DEFAULT_OPTION_MINUTE_ROOT = "/Volumes/VelocityData/polygon_downloads/us_options_opra/minute_aggs_v1"
+
+# Raw CSV rows parsed per chunk (bounds worker memory on multi-GB minute files)
+DEFAULT_INGEST_CHUNK_ROWS = 1_000_000
+
+# Files converted by one worker process before it is replaced
+DEFAULT_INGEST_TASKS_PER_WORKER = 8
+
+INGEST_SOURCES = ['stock_minutes', 'option_day', 'option_minute']
+
+STATE_VERSION = 1
+
+_STOCK_COLUMNS = ["ticker", "volume", "open", "close", "high", "low", "window_start"]
+
+
+# ---------------------------------------------------------------------- conversions
+
+def _write_parquet_atomic(df: pd.DataFrame, path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def convert_stock_minutes(
+    path: Path,
+    out_dir: Path,
+    trade_date: date,
+    ticker: str = 'SPY',
+    chunksize: int = DEFAULT_INGEST_CHUNK_ROWS
+) -> int:
+    """
+    One raw stock CSV.gz -> <out_dir>/<YYYY-MM-DD>.parquet with 1-minute OHLCV
+    for `ticker` (ts, open, high, low, close, volume, date).
+
+    A day without rows for the ticker is written as an empty file (SpyDailyBars
+    skips it) so it is not converted again.
+
+    Returns:
+        Minute bars written
+    """
+    chunks = []
+    for chunk in pd.read_csv(path, usecols=_STOCK_COLUMNS, chunksize=chunksize):
+        chunk = chunk[chunk["ticker"] == ticker]
+        if not chunk.empty:
+            chunks.append(chunk)
+
+    bars = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=_STOCK_COLUMNS)
+    bars["ts"] = pd.to_datetime(bars["window_start"].astype("int64"), unit="ns")
+    bars = bars.sort_values("ts")
+    bars["minute"] = bars["ts"].dt.floor("min")
+
+    agg = (
+        bars.groupby("minute", sort=True)
+        .agg(
+            open=("open", "first"),
+            high=("high", "max"),
+            low=("low", "min"),
+            close=("close", "last"),
+            volume=("volume", "sum"),
+        )
+        .reset_index()
+    )
+    agg["date"] = agg["minute"].dt.date
+    agg = agg.rename(columns={"minute": "ts"})
+
+    _write_parquet_atomic(agg, Path(out_dir) / f"{trade_date.isoformat()}.parquet")
+    return len(agg)
+
+
+def read_option_file(
+    path: Path,
+    trade_date: date,
+    underlyings: Iterable[str],
+    chunksize: int = DEFAULT_INGEST_CHUNK_ROWS
+) -> Dict[str, pd.DataFrame]:
+    """
+    Parse the wanted underlyings out of one raw OPRA CSV.gz.
+
+    Chunks are cut down to the underlyings' ticker prefixes as they are read,
+    so peak memory is one chunk plus the kept rows.
+
+    Returns:
+        Dict underlying -> parsed rows with `date` (empty DataFrame if none)
+    """
+    underlyings = list(underlyings)
+    prefixes = tuple(f"O:{u}" for u in underlyings)
+
+    kept = []
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        chunk = chunk[chunk['ticker'].astype(str).str.startswith(prefixes, na=False)]
+        if not chunk.empty:
+            kept.append(chunk)
+
+    if not kept:
+        return {u: pd.DataFrame() for u in underlyings}
+
+    days = split_by_underlying(pd.concat(kept, ignore_index=True), underlyings)
+    for df in days.values():
+        if not df.empty:
+            df['date'] = trade_date
+    return days
+
+
+def convert_option_day(
+    path: Path,
+    store_root: Path,
+    trade_date: date,
+    underlyings: Iterable[str],
+    chunksize: int = DEFAULT_INGEST_CHUNK_ROWS
+) -> int:
+    """One raw day_aggs file -> one chain store partition per underlying. Returns rows written."""
+    days = read_option_file(path, trade_date, underlyings, chunksize)
+    for underlying, df in days.items():
+        OptionsChainStore(str(store_root), underlying=underlying).write_day(trade_date, df)
+    return sum(len(df) for df in days.values())
+
+
+def convert_option_minutes(
+    path: Path,
+    store_root: Path,
+    trade_date: date,
+    underlyings: Iterable[str],
+    chunksize: int = DEFAULT_INGEST_CHUNK_ROWS
+) -> int:
+    """One raw minute_aggs file -> one minute store partition per underlying. Returns rows written."""
+    days = read_option_file(path, trade_date, underlyings, chunksize)
+    for underlying, df in days.items():
+        MinuteBarStore(str(store_root), underlying=underlying).write_day(trade_date, df)
+    return sum(len(df) for df in days.values())
+
+
+def outputs_exist(source: str, out_root: Path, trade_date: date, underlyings: Iterable[str]) -> bool:
+    """True when every derived output of a raw day is present."""
+    if source == 'stock_minutes':
+        return (Path(out_root) / f"{trade_date.isoformat()}.parquet").exists()
+    store_cls = OptionsChainStore if source == 'option_day' else MinuteBarStore
+    return all(store_cls(str(out_root), underlying=u).has_day(trade_date) for u in underlyings)
+
+
+def run_task(task: Dict) -> Dict:
+    """
+    Convert one raw file (runs in a worker process).
+
+    The file is hashed first; when its checksum matches the recorded one and
+    the outputs exist, only the new size/mtime are reported.
+
+    Returns:
+        Task identity plus status ('built' / 'unchanged'), size, mtime_ns,
+        sha256 and rows written
+    """
+    path = Path(task['path'])
+    trade_date = date.fromisoformat(task['date'])
+    stat = path.stat()
+    sha256 = file_sha256(path)
+    result = {
+        'source': task['source'],
+        'date': task['date'],
+        'size': int(stat.st_size),
+        'mtime_ns': int(stat.st_mtime_ns),
+        'sha256': sha256,
+        'rows': None,
+    }
+
+    if (not task['force'] and sha256 == task.get('recorded_sha256')
+            and outputs_exist(task['source'], Path(task['out_root']), trade_date, task['underlyings'])):
+        result['status'] = 'unchanged'
+        return result
+
+    if task['source'] == 'stock_minutes':
+        rows = convert_stock_minutes(path, Path(task['out_root']), trade_date, chunksize=task['chunksize'])
+    elif task['source'] == 'option_day':
+        rows = convert_option_day(path, Path(task['out_root']), trade_date, task['underlyings'], task['chunksize'])
+    else:
+        rows = convert_option_minutes(path, Path(task['out_root']), trade_date, task['underlyings'], task['chunksize'])
+
+    result['status'] = 'built'
+    result['rows'] = rows
+    return result
+
+
+# ---------------------------------------------------------------------- state
+
+class IngestState:
+    """Per-source, per-day record of the raw file each derived output was built from."""
+
+    def __init__(self, path: Optional[str] = None):
+        resolved_path = path or os.environ.get("INGEST_STATE_PATH", DEFAULT_INGEST_STATE_PATH)
+        self.path = Path(resolved_path).expanduser()
+        self.sources: Dict[str, Dict[str, Dict]] = {}
+        if self.path.exists():
+            try:
+                with open(self.path) as f:
+                    data = json.load(f)
+                if data.get('version') == STATE_VERSION:
+                    self.sources = data.get('sources', {})
+            except (OSError, ValueError) as e:
+                print(f"Error loading {self.path}: {e} (starting fresh)")
+
+    def get(self, source: str, trade_date: date) -> Optional[Dict]:
+        return self.sources.get(source, {}).get(trade_date.isoformat())
+
+    def record(self, result: Dict):
+        """Store a task result (an 'unchanged' result keeps the previous row count)."""
+        entries = self.sources.setdefault(result['source'], {})
+        previous = entries.get(result['date']) or {}
+        entries[result['date']] = {
+            'size': result['size'],
+            'mtime_ns': result['mtime_ns'],
+            'sha256': result['sha256'],
+            'rows': result['rows'] if result['rows'] is not None else previous.get('rows'),
+        }
+
+    def forget(self, source: str, day: str):
+        self.sources.get(source, {}).pop(day, None)
+
+    def save(self):
+        """Write the state file atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': STATE_VERSION, 'sources': self.sources}, f)
+        os.replace(tmp_path, self.path)
+
+
+# ---------------------------------------------------------------------- pipeline
+
+class DailyIngest:
+    """Find new or changed raw files across all sources and convert them."""
+
+    def __init__(
+        self,
+        stock_raw_root: Optional[str] = None,
+        stock_minute_root: Optional[str] = None,
+        option_day_root: Optional[str] = None,
+        option_minute_root: Optional[str] = None,
+        chain_store_root: Optional[str] = None,
+        minute_store_root: Optional[str] = None,
+        underlyings: Iterable[str] = ('SPY',),
+        state_path: Optional[str] = None,
+        chunksize: int = DEFAULT_INGEST_CHUNK_ROWS
+    ):
+        """
+        Args:
+            stock_raw_root / option_day_root / option_minute_root: Raw roots
+            stock_minute_root / chain_store_root / minute_store_root: Output roots
+            underlyings: Option roots written to the chain and minute stores
+            state_path: Ingest state file (default INGEST_STATE_PATH / DEFAULT_INGEST_STATE_PATH)
+            chunksize: Raw CSV rows parsed per chunk
+        """
+        def resolve(value, env, default):
+            return Path(value or os.environ.get(env, default)).expanduser()
+
+        # source -> (raw root, manifest nesting, output root)
+        self.sources = {
+            'stock_minutes': (
+                resolve(stock_raw_root, "STOCK_RAW_ROOT", DEFAULT_STOCK_RAW_ROOT), False,
+                resolve(stock_minute_root, "SPY_STOCK_DATA_ROOT", DEFAULT_STOCK_MINUTE_ROOT)
+            ),
+            'option_day': (
+                resolve(option_day_root, "POLYGON_DATA_ROOT", DEFAULT_OPTION_DAY_ROOT), True,
+                resolve(chain_store_root, "POLYGON_CHAIN_STORE_ROOT", DEFAULT_CHAIN_STORE_ROOT)
+            ),
+            'option_minute': (
+                resolve(option_minute_root, "POLYGON_MINUTE_ROOT", DEFAULT_OPTION_MINUTE_ROOT), True,
+                resolve(minute_store_root, "POLYGON_MINUTE_STORE_ROOT", DEFAULT_MINUTE_STORE_ROOT)
+            ),
+        }
+        self.underlyings = list(underlyings)
+        self.state = IngestState(state_path)
+        self.chunksize = chunksize
+
+    def plan(
+        self,
+        sources: Optional[Iterable[str]] = None,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        force: bool = False
+    ) -> List[Dict]:
+        """
+        Tasks for raw files that are new, changed (size/mtime) or missing outputs.
+
+        Raw files that disappeared are dropped from the state (outputs are kept).
+        """
+        tasks = []
+        for source in sources or INGEST_SOURCES:
+            raw_root, nested, out_root = self.sources[source]
+            if not raw_root.exists():
+                print(f"Warning: {source} raw root {raw_root} not found; skipping")
+                continue
+
+            # Full listing: also catches raw files rewritten in place
+            manifest = get_manifest(raw_root, suffix='.csv.gz', nested=nested)
+            manifest.refresh(full=True)
+            signatures = manifest.signatures()
+
+            for day in list(self.state.sources.get(source, {})):
+                if date.fromisoformat(day) not in signatures:
+                    self.state.forget(source, day)
+
+            for trade_date, (size, mtime_ns) in sorted(signatures.items()):
+                if (start is not None and trade_date < start) or (end is not None and trade_date > end):
+                    continue
+                recorded = self.state.get(source, trade_date)
+                if not force and recorded is not None \
+                        and (recorded['size'], recorded['mtime_ns']) == (size, mtime_ns) \
+                        and outputs_exist(source, out_root, trade_date, self.underlyings):
+                    continue
+                tasks.append({
+                    'source': source,
+                    'date': trade_date.isoformat(),
+                    'path': str(manifest.path_for(trade_date)),
+                    'out_root': str(out_root),
+                    'underlyings': self.underlyings,
+                    'recorded_sha256': recorded['sha256'] if recorded else None,
+                    'chunksize': self.chunksize,
+                    'force': force,
+                })
+        return tasks
+
+    def run(
+        self,
+        sources: Optional[Iterable[str]] = None,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        workers: int = 4,
+        force: bool = False,
+        tasks_per_worker: int = DEFAULT_INGEST_TASKS_PER_WORKER,
+        progress: Optional[Callable[[Dict], None]] = print
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Convert everything plan() finds, recording each finished file in the
+        state file (saved as results arrive, so an interrupted run resumes).
+
+        Args:
+            workers: Worker processes (<= 1 converts in this process)
+            tasks_per_worker: Files a worker converts before it is replaced
+            progress: Called with each task result (None to stay quiet)
+
+        Returns:
+            Per-source counts of built / unchanged / failed files
+        """
+        tasks = self.plan(sources, start, end, force)
+        counts = {source: {'built': 0, 'unchanged': 0, 'failed': 0} for source in sources or INGEST_SOURCES}
+
+        def finish(task, result=None, error=None):
+            if error is not None:
+                counts[task['source']]['failed'] += 1
+                if progress:
+                    progress({'source': task['source'], 'date': task['date'], 'status': 'failed', 'error': str(error)})
+                return
+            counts[task['source']][result['status']] += 1
+            self.state.record(result)
+            self.state.save()
+            if progress:
+                progress(result)
+
+        if workers <= 1:
+            for task in tasks:
+                try:
+                    finish(task, run_task(task))
+                except Exception as e:
+                    finish(task, error=e)
+        else:
+            # A fresh pool per batch caps how many files each worker process
+            # converts, so memory held by pandas/pyarrow allocators is returned
+            # (max_tasks_per_child deadlocks on some Python 3.11 releases)
+            batch_size = workers * max(tasks_per_worker, 1)
+            for first in range(0, len(tasks), batch_size):
+                batch = tasks[first:first + batch_size]
+                with ProcessPoolExecutor(max_workers=min(workers, len(batch))) as executor:
+                    futures = {executor.submit(run_task, task): task for task in batch}
+                    for future in as_completed(futures):
+                        try:
+                            finish(futures[future], future.result())
+                        except Exception as e:
+                            finish(futures[future], error=e)
+
+        self.state.save()
+        return counts
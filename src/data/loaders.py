@@ -15,7 +15,15 @@ from datetime import datetime, timedelta, date
 import re
 from typing import Optional, Dict, List
 import warnings
-import yfinance as yf
+
+from .chain_store import OptionsChainStore
+from .option_tickers import attach_parsed_tickers
+from .chain_cache import ChainCache, freeze_frame, get_shared_chain_cache
+from .chain_schema import chain_day_ordinals, compact_chain, compact_columns, expand_chain
+from .spy_daily import SpyDailyBars
+from .manifest import get_manifest
+from .spine import RollingSpine
+from .vix_store import VixStore, download_series, merge_series
 
 warnings.filterwarnings('ignore')
 
@@ -34,7 +42,12 @@ class OptionsDataLoader:
         self,
         data_root: Optional[str] = None,
         minute_data_root: Optional[str] = None,
-        stock_data_root: Optional[str] = None
+        stock_data_root: Optional[str] = None,
+        chain_store_root: Optional[str] = None,
+        chain_cache: Optional[ChainCache] = None,
+        spy_daily_path: Optional[str] = None,
+        vix_store_path: Optional[str] = None,
+        underlying: str = 'SPY'
     ):
         resolved_root = data_root or os.environ.get("POLYGON_DATA_ROOT", DEFAULT_POLYGON_ROOT)
         self.data_root = Path(resolved_root).expanduser()
@@ -49,6 +62,16 @@ class OptionsDataLoader:
         self.minute_data_root = Path(minute_root_resolved).expanduser()
         self.has_minute_data = self.minute_data_root.exists()
 
+        # Coverage manifest (replaces directory walks / per-day exists checks)
+        self.options_manifest = get_manifest(self.data_root)
+
+        # Pre-parsed Parquet chains (optional - falls back to raw CSV.gz per day)
+        self.underlying = underlying
+        self.chain_store = OptionsChainStore(chain_store_root, underlying=underlying)
+
+        # Parsed days are shared process-wide (same entries as PolygonOptionsLoader)
+        self.chain_cache = chain_cache if chain_cache is not None else get_shared_chain_cache()
+
         stock_root_resolved = stock_data_root or os.environ.get("SPY_STOCK_DATA_ROOT", DEFAULT_STOCK_ROOT)
         self.stock_data_root = Path(stock_root_resolved).expanduser()
         if not self.stock_data_root.exists():
@@ -57,31 +80,26 @@ class OptionsDataLoader:
                 "Mount the VelocityData drive and/or set SPY_STOCK_DATA_ROOT."
             )
 
-        stock_files = sorted(
-            [
-                p for p in self.stock_data_root.glob("*.parquet")
-                if re.match(r"\d{4}-\d{2}-\d{2}$", p.stem)
-            ]
-        )
+        # Daily bars derived from the minute parquets (refreshed incrementally)
+        self.stock_manifest = get_manifest(self.stock_data_root, suffix='.parquet', nested=False)
+        self.spy_daily = SpyDailyBars(str(self.stock_data_root), spy_daily_path, manifest=self.stock_manifest)
+        self.spy_daily.refresh()
+        self._stock_dates = self.spy_daily.dates()
 
-        if not stock_files:
+        if not self._stock_dates:
             raise FileNotFoundError(
                 f"No SPY parquet files found under {self.stock_data_root}. "
                 "Ensure minute-level SPY data is exported to this directory."
             )
 
-        self._stock_file_map: Dict[date, Path] = {}
-        for path in stock_files:
-            trade_date = datetime.strptime(path.stem, "%Y-%m-%d").date()
-            self._stock_file_map[trade_date] = path
-
-        self._stock_dates = sorted(self._stock_file_map.keys())
-        self._stock_date_set = set(self._stock_dates)
-
         self._spy_cache = {}
         self._options_cache = {}
-        self._stock_day_cache: Dict[date, Dict[str, float]] = {}
-        self._vix_cache = None
+        self._spy_daily_bars: Optional[pd.DataFrame] = None
+
+        # VIX comes from the local store; downloads (opt-in) are merged into the cache
+        self.vix_store = VixStore(vix_store_path)
+        self._vix_cache: Optional[pd.DataFrame] = None
+        self._vix_covered: List[tuple] = []  # merged (start, end) windows held in _vix_cache
 
     def _parse_option_ticker(self, ticker: str) -> Optional[Dict]:
         """
@@ -115,41 +133,35 @@ class OptionsDataLoader:
         }
 
     def _load_raw_options_day(self, date: datetime) -> pd.DataFrame:
-        """Load raw options data for a single day."""
-        year = date.year
-        month = f"{date.month:02d}"
-        day = f"{date.day:02d}"
-
-        file_path = self.data_root / str(year) / month / f"{year}-{month}-{day}.csv.gz"
+        """
+        Load raw options data for a single day via the shared chain cache.
 
-        if not file_path.exists():
+        Returns a zero-copy view of the frozen cached frame in the compact
+        schema (chain_schema; new columns may be added, values are read-only).
+        """
+        cache_key = ('day_aggs', str(self.data_root), date.date(), self.underlying)
+        return self.chain_cache.get_or_load(
+            cache_key, lambda: compact_chain(self._read_raw_options_day(date))
+        ).copy(deep=False)
+
+    def _read_raw_options_day(self, date: datetime) -> pd.DataFrame:
+        """Read raw options data for a single day (chain store first, then CSV.gz)."""
+        if self.chain_store.available:
+            df = self.chain_store.read_day(date.date())
+            if df is not None:
+                return df
+
+        file_path = self.options_manifest.path_for(date.date())
+        if file_path is None:
             return pd.DataFrame()
 
         # Read compressed CSV
         df = pd.read_csv(file_path, compression='gzip')
 
-        # Parse option tickers
-        parsed = df['ticker'].apply(self._parse_option_ticker)
-
-        # Filter out None values (unparseable tickers)
-        valid_mask = parsed.notna()
-        parsed_series = parsed[valid_mask].reset_index(drop=True)
-        df = df[valid_mask].reset_index(drop=True)
-
-        if len(parsed_series) == 0:
-            return pd.DataFrame()
-
-        parsed_df = pd.DataFrame(parsed_series.tolist())
-
-        # Filter for SPY only
-        if 'underlying' in parsed_df.columns:
-            spy_mask = parsed_df['underlying'] == 'SPY'
-            df = df[spy_mask].reset_index(drop=True)
-            parsed_df = parsed_df[spy_mask].reset_index(drop=True)
+        # Parse option tickers (vectorized, underlying filtered before parsing)
+        df = attach_parsed_tickers(df, underlying=self.underlying)
 
-            # Merge parsed data
-            df = pd.concat([df, parsed_df], axis=1)
-        else:
+        if df.empty:
             return pd.DataFrame()
 
         # Add trade date
@@ -173,11 +185,14 @@ class OptionsDataLoader:
         Args:
             date: Date to load
             filter_garbage: Remove bad quotes (negative prices, invalid spreads, etc.)
+
+        Cached chains are compact and read-only; each call expands one
+        (price columns are zero-copy views).
         """
         # Check cache
         cache_key = (date.date(), filter_garbage)
         if cache_key in self._options_cache:
-            return self._options_cache[cache_key].copy()
+            return self._options_cache[cache_key].copy(deep=False)
 
         df = self._load_raw_options_day(date)
 
@@ -197,7 +212,7 @@ class OptionsDataLoader:
         df['ask'] = df['mid'] * 1.01  # 1% above mid
 
         # Calculate DTE (days to expiration)
-        df['dte'] = (pd.to_datetime(df['expiry']) - pd.to_datetime(df['date'])).dt.days
+        df['dte'] = chain_day_ordinals(df['expiry']) - chain_day_ordinals(df['date'])
 
         if filter_garbage:
             df = self._filter_bad_quotes(df)
@@ -209,12 +224,12 @@ class OptionsDataLoader:
             'volume', 'transactions'
         ]
 
-        df = df[[c for c in columns if c in df.columns]].copy()
+        # Cache compact, hand out the API layout
+        df = compact_chain(df)
+        df = freeze_frame(df[[c for c in compact_columns(columns) if c in df.columns]])
+        self._options_cache[cache_key] = df
 
-        # Cache result
-        self._options_cache[cache_key] = df.copy()
-
-        return df
+        return expand_chain(df)
 
     def _filter_bad_quotes(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -229,21 +244,28 @@ class OptionsDataLoader:
 
         initial_count = len(df)
 
+        close = df['close'].to_numpy()
+        bid = df['bid'].to_numpy()
+        ask = df['ask'].to_numpy()
+        mid = df['mid'].to_numpy()
+
         # Remove negative prices
-        df = df[df['close'] > 0].copy()
-        df = df[(df['bid'] > 0) & (df['ask'] > 0)].copy()
+        keep = (close > 0) & (bid > 0) & (ask > 0)
 
         # Remove inverted markets
-        df = df[df['ask'] >= df['bid']].copy()
+        keep &= ask >= bid
 
         # Remove extremely wide spreads (>20% unless very cheap)
-        spread_pct = (df['ask'] - df['bid']) / df['mid']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            spread_pct = (ask - bid) / mid
         # Allow wider spreads for options < $0.50
-        wide_spread_mask = (spread_pct > 0.20) & (df['mid'] > 0.50)
-        df = df[~wide_spread_mask].copy()
+        keep &= ~((spread_pct > 0.20) & (mid > 0.50))
 
         # Remove options with no volume (stale quotes)
-        df = df[df['volume'] > 0].copy()
+        keep &= df['volume'].to_numpy() > 0
+
+        # One row selection for all rules
+        df = df.iloc[np.flatnonzero(keep)]
 
         filtered_count = len(df)
         if initial_count > 0:
@@ -254,13 +276,15 @@ class OptionsDataLoader:
 
     def load_spy_ohlcv(self, start_date: datetime, end_date: datetime) -> pd.DataFrame:
         """
-        Load SPY OHLCV data from local minute-level parquet exports.
+        Load SPY OHLCV data from the consolidated daily-bar table
+        (derived from the local minute-level parquet exports).
 
         Returns DataFrame with: date, open, high, low, close, volume
+        (zero-copy view of a read-only cached frame)
         """
         cache_key = (start_date.date(), end_date.date())
         if cache_key in self._spy_cache:
-            return self._spy_cache[cache_key].copy()
+            return self._spy_cache[cache_key].copy(deep=False)
 
         start_day = start_date.date()
         end_day = end_date.date()
@@ -273,41 +297,33 @@ class OptionsDataLoader:
                 f"Requested range {start_day} – {end_day} exceeds coverage."
             )
 
-        rows = []
-        for trade_day in self._stock_dates:
-            if trade_day < start_day:
-                continue
-            if trade_day > end_day:
-                break
-            day_data = self._load_spy_day(trade_day)
-            if day_data is not None:
-                rows.append(day_data)
+        if self._spy_daily_bars is None:
+            # Already refreshed in __init__
+            self._spy_daily_bars = freeze_frame(self.spy_daily.load(refresh=False))
+
+        bars = self._spy_daily_bars
+        in_range = (bars['date'] >= start_day) & (bars['date'] <= end_day)
+        spy = bars[in_range].reset_index(drop=True)
 
-        if not rows:
+        if spy.empty:
             raise ValueError(f"No SPY data found between {start_day} and {end_day}")
 
-        spy = pd.DataFrame(rows)
-        self._spy_cache[cache_key] = spy.copy()
-        return spy
+        spy = freeze_frame(spy)
+        self._spy_cache[cache_key] = spy
+        return spy.copy(deep=False)
 
-    def get_data_coverage(self) -> Dict[str, List[str]]:
-        """Return available data dates."""
-        dates = []
-        for year_dir in sorted(self.data_root.glob('*')):
-            if not year_dir.is_dir():
-                continue
-            for month_dir in sorted(year_dir.glob('*')):
-                if not month_dir.is_dir():
-                    continue
-                for file_path in sorted(month_dir.glob('*.csv.gz')):
-                    date_str = file_path.name.replace('.csv.gz', '')
-                    dates.append(date_str)
+    def refresh_stock_data(self) -> Dict[str, int]:
+        """Pick up SPY minute files exported since this loader was created."""
+        counts = self.spy_daily.refresh()
+        if counts['added'] or counts['updated'] or counts['removed']:
+            self._stock_dates = self.spy_daily.dates()
+            self._spy_daily_bars = None
+            self._spy_cache = {}
+        return counts
 
-        return {
-            'start': dates[0] if dates else None,
-            'end': dates[-1] if dates else None,
-            'count': len(dates)
-        }
+    def get_data_coverage(self) -> Dict[str, List[str]]:
+        """Return available data dates (from the coverage manifest, no directory walk)."""
+        return self.options_manifest.coverage()
 
     def get_spy_stock_coverage(self) -> Dict[str, date]:
         """Return coverage window for SPY stock data."""
@@ -317,72 +333,95 @@ class OptionsDataLoader:
             'count': len(self._stock_dates)
         }
 
-    def _load_spy_day(self, trade_day: date) -> Optional[Dict[str, float]]:
-        """Load single-day OHLCV from minute parquet."""
-        if trade_day in self._stock_day_cache:
-            return self._stock_day_cache[trade_day]
-
-        file_path = self._stock_file_map.get(trade_day)
-        if file_path is None or not file_path.exists():
-            return None
-
-        df = pd.read_parquet(file_path)
-        if df.empty:
-            return None
-
-        df = df.sort_values('ts')
-        day_record = {
-            'date': trade_day,
-            'open': float(df.iloc[0]['open']),
-            'high': float(df['high'].max()),
-            'low': float(df['low'].min()),
-            'close': float(df.iloc[-1]['close']),
-            'volume': float(df['volume'].sum())
-        }
-
-        self._stock_day_cache[trade_day] = day_record
-        return day_record
-
-    def load_vix(self, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+    def load_vix(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        allow_download: bool = False,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
         """
-        Load VIX (CBOE Volatility Index) from yfinance.
+        Load VIX (CBOE Volatility Index) daily closes.
 
         VIX represents the 30-day forward-looking implied volatility of S&P 500 index options.
 
+        Served from the local VIX store (scripts/import_vix.py). Only when
+        allow_download=True and the store does not cover the window are the
+        missing days fetched from yfinance; they are merged into the cache and
+        the store, so later (wider) requests reuse them.
+
         Returns DataFrame with: date, vix_close (30-day ATM IV as %)
+        [plus vix9d_close/vix3m_close/vvix_close if requested in `columns`]
         """
-        # Check cache
-        cache_key = (start_date.date(), end_date.date())
-        if self._vix_cache is not None:
-            cached_start = self._vix_cache['date'].min()
-            cached_end = self._vix_cache['date'].max()
-            if start_date.date() >= cached_start and end_date.date() <= cached_end:
-                mask = (self._vix_cache['date'] >= start_date.date()) & (self._vix_cache['date'] <= end_date.date())
-                return self._vix_cache[mask].copy()
-
-        # Download VIX data
-        # Add buffer to handle timezone/trading day alignment
-        vix_ticker = yf.Ticker("^VIX")
-        vix_df = vix_ticker.history(
-            start=(start_date - timedelta(days=5)).strftime('%Y-%m-%d'),
-            end=(end_date + timedelta(days=1)).strftime('%Y-%m-%d')
-        )
-
-        if vix_df.empty:
-            raise ValueError(f"No VIX data available for {start_date.date()} to {end_date.date()}")
+        start, end = start_date.date(), end_date.date()
+        columns = columns or ['vix_close']
+
+        if self._vix_cache is None:
+            self._vix_cache = self.vix_store.load()
+            coverage = self.vix_store.coverage()
+            if coverage is not None:
+                self._add_vix_window(*coverage)
+
+        if allow_download:
+            for gap_start, gap_end in self._vix_gaps(start, end):
+                # Buffer handles timezone/trading day alignment
+                downloaded = [
+                    download_series(column, gap_start - timedelta(days=5), gap_end + timedelta(days=1))
+                    for column in columns
+                ]
+                fetched = downloaded[0]
+                for extra in downloaded[1:]:
+                    fetched = fetched.merge(extra, on='date', how='outer')
+                if fetched.empty:
+                    continue
+                self._vix_cache = merge_series(self._vix_cache, fetched)
+                self._add_vix_window(gap_start, gap_end)
+                try:
+                    self.vix_store.upsert(fetched)
+                except OSError as e:
+                    print(f"Warning: could not update VIX store {self.vix_store.path}: {e}")
 
-        # Normalize to match SPY format
-        vix_df = vix_df.reset_index()
-        vix_df['date'] = pd.to_datetime(vix_df['Date']).dt.date
-        vix_df = vix_df.rename(columns={'Close': 'vix_close'})
-        vix_df = vix_df[['date', 'vix_close']].copy()
+        cache = self._vix_cache.reindex(columns=['date'] + columns)
+        mask = (cache['date'] >= start) & (cache['date'] <= end)
+        vix_df = cache[mask].dropna(subset=columns, how='all').reset_index(drop=True)
 
-        # Cache it
-        self._vix_cache = vix_df
+        if vix_df.empty:
+            raise ValueError(
+                f"No VIX data available for {start} to {end}. "
+                "Import it with scripts/import_vix.py or pass allow_download=True."
+            )
 
-        # Return requested range
-        mask = (vix_df['date'] >= start_date.date()) & (vix_df['date'] <= end_date.date())
-        return vix_df[mask].copy()
+        return vix_df
+
+    def _add_vix_window(self, start: date, end: date):
+        """Record [start, end] as cached, merging overlapping/adjacent windows."""
+        windows = sorted(self._vix_covered + [(start, end)])
+        merged = [windows[0]]
+        for lo, hi in windows[1:]:
+            last_lo, last_hi = merged[-1]
+            if lo <= last_hi + timedelta(days=1):
+                merged[-1] = (last_lo, max(last_hi, hi))
+            else:
+                merged.append((lo, hi))
+        self._vix_covered = merged
+
+    def _vix_gaps(self, start: date, end: date) -> List[tuple]:
+        """Sub-windows of [start, end] not yet held in the VIX cache."""
+        gaps = []
+        cursor = start
+        for lo, hi in self._vix_covered:
+            if hi < cursor:
+                continue
+            if lo > end:
+                break
+            if lo > cursor:
+                gaps.append((cursor, lo - timedelta(days=1)))
+            cursor = hi + timedelta(days=1)
+            if cursor > end:
+                break
+        if cursor <= end:
+            gaps.append((cursor, end))
+        return gaps
 
 
 class DataSpine:
@@ -392,9 +431,16 @@ class DataSpine:
     Combines SPY OHLCV + Options chain + Derived features.
     """
 
-    def __init__(self, data_root: str = "/Volumes/VelocityData/polygon_downloads/us_options_opra/day_aggs_v1"):
-        self.loader = OptionsDataLoader(data_root)
+    def __init__(
+        self,
+        data_root: str = "/Volumes/VelocityData/polygon_downloads/us_options_opra/day_aggs_v1",
+        loader: Optional[OptionsDataLoader] = None
+    ):
+        self.loader = loader if loader is not None else OptionsDataLoader(data_root)
         self._spine_cache = {}
+        self._rolling: Optional[RollingSpine] = None
+        # Latest target that triggered a stock-data refresh
+        self._refreshed_through: Optional[date] = None
 
     def build_spine(self, start_date: datetime, end_date: datetime, include_vix: bool = True) -> pd.DataFrame:
         """
@@ -432,7 +478,8 @@ class DataSpine:
         # Load VIX data and merge
         if include_vix:
             try:
-                vix_df = self.loader.load_vix(adj_start, adj_end)
+                # Local store only - never block the spine on the network
+                vix_df = self.loader.load_vix(adj_start, adj_end, allow_download=False)
                 spy_df = spy_df.merge(vix_df, on='date', how='left')
             except Exception as e:
                 # VIX optional - warn but don't fail
@@ -455,24 +502,27 @@ class DataSpine:
             'options': Options chain (DataFrame) [if include_options=True]
         }
         """
-        # Get SPY data with features
-        # Need history for features (50 days for MA50) + buffer
-        spine_df = self.build_spine(
-            date - timedelta(days=100),
-            date + timedelta(days=1)  # Include target date
-        )
-
-        if spine_df.empty:
-            return {'spy': None, 'options': None}
-
-        # Get this day's SPY data
-        day_spy = spine_df[spine_df['date'] == date.date()]
-
-        if day_spy.empty:
+        # Featured rows come from the rolling spine (built once, extended on demand)
+        if self._rolling is None:
+            self._rolling = RollingSpine(self.loader)
+            self._rolling.extend()
+
+        target = date.date()
+        past_spine = self._rolling.last_date is None or target > self._rolling.last_date
+        if past_spine and (self._refreshed_through is None or target > self._refreshed_through):
+            # Past the spine: pick up newly exported days, then append them.
+            # Weekends, holidays and dates beyond the data stay past the spine;
+            # asking again for them (or earlier days) does not rescan.
+            self._refreshed_through = target
+            self.loader.refresh_stock_data()
+            self._rolling.extend(target)
+
+        day_spy = self._rolling.row(target)
+        if day_spy is None:
             return {'spy': None, 'options': None}
 
         result = {
-            'spy': day_spy.iloc[0] if len(day_spy) > 0 else None
+            'spy': day_spy
         }
 
         if include_options:
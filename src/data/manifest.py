@@ -0,0 +1,367 @@
+"""
+Persistent coverage manifest for date-partitioned data roots.
+
+Coverage queries and per-day file-existence checks used to walk the data
+roots (glob over every year/month directory, or an exists() per lookup). On
+network-mounted or spinning storage that walk dominates startup. A manifest
+records, per root, one entry per trading day:
+
+    date -> {path, size, mtime_ns, rows, sha256}
+
+It is refreshed incrementally: directory mtimes are recorded, and only
+directories whose mtime changed are listed again (adding, removing or renaming
+a file changes its directory's mtime). A lookup that misses re-stats just that
+day's directory, so files added after the refresh are still found. Row counts and checksums are filled in
+by detailed refreshes (scripts/build_data_manifest.py) for new or changed
+files only.
+
+Manifests are JSON files under DEFAULT_MANIFEST_DIR (or DATA_MANIFEST_DIR),
+one per root. Loaders share one in-memory manifest per root via get_manifest().
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pyarrow.parquet as pq
+
+
+DEFAULT_MANIFEST_DIR = "~/.cache/rotation_engine/manifests"
+
+MANIFEST_VERSION = 1
+
+_CHUNK_BYTES = 1 << 20
+
+
+def count_rows(path: Path) -> int:
+    """Data rows in a CSV.gz (lines minus header) or Parquet file."""
+    if path.name.endswith('.parquet'):
+        return int(pq.ParquetFile(path).metadata.num_rows)
+
+    lines = 0
+    last = b'\n'
+    with gzip.open(path, 'rb') as f:
+        while True:
+            chunk = f.read(_CHUNK_BYTES)
+            if not chunk:
+                break
+            lines += chunk.count(b'\n')
+            last = chunk[-1:]
+    if last != b'\n':
+        lines += 1  # final line without trailing newline
+    return max(lines - 1, 0)
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(_CHUNK_BYTES)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DataManifest:
+    """
+    Manifest of one date-partitioned root.
+
+    Layouts:
+        nested=True:  <root>/<YYYY>/<MM>/<YYYY-MM-DD><suffix>   (Polygon day/minute aggs)
+        nested=False: <root>/<YYYY-MM-DD><suffix>               (SPY stock minute parquets)
+    """
+
+    def __init__(
+        self,
+        root: str,
+        suffix: str = '.csv.gz',
+        nested: bool = True,
+        manifest_path: Optional[str] = None
+    ):
+        self.root = Path(root).expanduser()
+        self.suffix = suffix
+        self.nested = nested
+
+        if manifest_path is None:
+            manifest_dir = Path(os.environ.get("DATA_MANIFEST_DIR", DEFAULT_MANIFEST_DIR)).expanduser()
+            root_id = hashlib.sha1(str(self.root.resolve()).encode()).hexdigest()[:12]
+            manifest_path = manifest_dir / f"{self.root.name}-{root_id}.json"
+        self.manifest_path = Path(manifest_path).expanduser()
+
+        self._entries: Dict[str, Dict] = {}   # ISO date -> entry
+        self._dirs: Dict[str, int] = {}       # relative dir -> mtime_ns
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._fresh = False
+
+    # ------------------------------------------------------------------ persistence
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.manifest_path.exists():
+            return
+        try:
+            with open(self.manifest_path) as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error loading {self.manifest_path}: {e} (rebuilding)")
+            return
+        if data.get('version') != MANIFEST_VERSION or data.get('root') != str(self.root):
+            return
+        self._entries = data.get('entries', {})
+        self._dirs = data.get('dirs', {})
+
+    def save(self):
+        """Write the manifest atomically; an unwritable location keeps it in memory only."""
+        with self._lock:
+            data = {
+                'version': MANIFEST_VERSION,
+                'root': str(self.root),
+                'suffix': self.suffix,
+                'nested': self.nested,
+                'dirs': self._dirs,
+                'entries': self._entries,
+            }
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.manifest_path.with_name(self.manifest_path.name + '.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as e:
+            print(f"Warning: could not write manifest {self.manifest_path}: {e}")
+
+    # ------------------------------------------------------------------ refresh
+
+    def _leaf_dirs(self) -> List[Tuple[str, Path]]:
+        """Directories that hold data files (relative name, path)."""
+        if not self.nested:
+            return [('.', self.root)]
+
+        leaves = []
+        for year_dir in sorted(self.root.iterdir()):
+            if not year_dir.is_dir() or not year_dir.name.isdigit():
+                continue
+            for month_dir in sorted(year_dir.iterdir()):
+                if month_dir.is_dir() and month_dir.name.isdigit():
+                    leaves.append((f"{year_dir.name}/{month_dir.name}", month_dir))
+        return leaves
+
+    def _scan_dir(self, rel_dir: str, path: Path) -> Dict[str, Dict]:
+        """Stat the data files in one directory."""
+        found = {}
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name
+                if not entry.is_file() or not name.endswith(self.suffix):
+                    continue
+                day = name[:-len(self.suffix)]
+                try:
+                    date.fromisoformat(day)
+                except ValueError:
+                    continue
+                stat = entry.stat()
+                found[day] = {
+                    'path': name if rel_dir == '.' else f"{rel_dir}/{name}",
+                    'size': int(stat.st_size),
+                    'mtime_ns': int(stat.st_mtime_ns),
+                }
+        return found
+
+    def refresh(self, detail: bool = False, full: bool = False) -> Dict[str, int]:
+        """
+        Bring the manifest up to date with the root.
+
+        Args:
+            detail: Also compute row counts and SHA-256 checksums for entries
+                that lack them (new or changed files)
+            full: Re-list every directory instead of only those whose mtime changed
+                (catches files rewritten in place)
+
+        Returns:
+            Counts of added/updated/removed entries and directories scanned
+        """
+        with self._lock:
+            self._load()
+            counts = {'added': 0, 'updated': 0, 'removed': 0, 'dirs_scanned': 0}
+
+            if not self.root.exists():
+                counts['removed'] = len(self._entries)
+                changed = bool(self._entries or self._dirs)
+                self._entries, self._dirs = {}, {}
+                self._fresh = True
+                if changed:
+                    self.save()
+                return counts
+
+            leaves = self._leaf_dirs()
+            live_dirs = {rel for rel, _ in leaves}
+            changed = False
+
+            # Directories that vanished take their entries with them
+            for rel in [d for d in self._dirs if d not in live_dirs]:
+                del self._dirs[rel]
+                changed = True
+            for day, entry in list(self._entries.items()):
+                if self._entry_dir(entry) not in live_dirs:
+                    del self._entries[day]
+                    counts['removed'] += 1
+                    changed = True
+
+            for rel, path in leaves:
+                mtime_ns = int(path.stat().st_mtime_ns)
+                if not full and self._dirs.get(rel) == mtime_ns:
+                    continue
+                self._rescan_dir(rel, path, mtime_ns, counts)
+                changed = True
+
+            if detail:
+                for entry in self._entries.values():
+                    if entry.get('sha256') is None or entry.get('rows') is None:
+                        path = self.root / entry['path']
+                        entry['rows'] = count_rows(path)
+                        entry['sha256'] = file_sha256(path)
+                        changed = True
+
+            self._fresh = True
+            if changed:
+                self.save()
+            return counts
+
+    def _rescan_dir(self, rel: str, path: Path, mtime_ns: int, counts: Dict[str, int]):
+        """Re-list one directory and reconcile its entries."""
+        counts['dirs_scanned'] += 1
+        found = self._scan_dir(rel, path)
+
+        for day, entry in list(self._entries.items()):
+            if self._entry_dir(entry) == rel and day not in found:
+                del self._entries[day]
+                counts['removed'] += 1
+
+        for day, stat in found.items():
+            previous = self._entries.get(day)
+            if previous is None:
+                self._entries[day] = stat
+                counts['added'] += 1
+            elif (previous['size'], previous['mtime_ns']) != (stat['size'], stat['mtime_ns']):
+                self._entries[day] = stat
+                counts['updated'] += 1
+
+        self._dirs[rel] = mtime_ns
+
+    def _recheck_dir(self, trade_date: date) -> bool:
+        """
+        On a miss, stat the date's directory and rescan it if it changed since
+        the last refresh (one stat instead of trusting a stale manifest).
+        """
+        rel = f"{trade_date.year}/{trade_date.month:02d}" if self.nested else '.'
+        path = self.root / rel if self.nested else self.root
+        try:
+            mtime_ns = int(path.stat().st_mtime_ns)
+        except OSError:
+            return False
+        if self._dirs.get(rel) == mtime_ns:
+            return False
+
+        counts = {'added': 0, 'updated': 0, 'removed': 0, 'dirs_scanned': 0}
+        self._rescan_dir(rel, path, mtime_ns, counts)
+        self.save()
+        return True
+
+    def _lookup(self, trade_date: date) -> Optional[Dict]:
+        self._ensure_fresh()
+        day = trade_date.isoformat()
+        entry = self._entries.get(day)
+        if entry is None and self._recheck_dir(trade_date):
+            entry = self._entries.get(day)
+        return entry
+
+    @staticmethod
+    def _entry_dir(entry: Dict) -> str:
+        parent = entry['path'].rsplit('/', 1)
+        return parent[0] if len(parent) == 2 else '.'
+
+    def _ensure_fresh(self):
+        """Refresh once per process before the first query."""
+        if not self._fresh:
+            self.refresh()
+
+    # ------------------------------------------------------------------ queries
+
+    def dates(self) -> List[date]:
+        """All dates with a file, sorted."""
+        with self._lock:
+            self._ensure_fresh()
+            return [date.fromisoformat(day) for day in sorted(self._entries)]
+
+    def has_date(self, trade_date: date) -> bool:
+        with self._lock:
+            return self._lookup(trade_date) is not None
+
+    def path_for(self, trade_date: date) -> Optional[Path]:
+        """File for a date, or None if there is no such day."""
+        with self._lock:
+            entry = self._lookup(trade_date)
+        return self.root / entry['path'] if entry is not None else None
+
+    def entry(self, trade_date: date) -> Optional[Dict]:
+        """Manifest record (path, size, mtime_ns, rows, sha256) for a date."""
+        with self._lock:
+            entry = self._lookup(trade_date)
+            return dict(entry) if entry is not None else None
+
+    def signatures(self) -> Dict[date, Tuple[int, int]]:
+        """(size, mtime_ns) per date - what incremental consumers compare against."""
+        with self._lock:
+            self._ensure_fresh()
+            return {
+                date.fromisoformat(day): (entry['size'], entry['mtime_ns'])
+                for day, entry in self._entries.items()
+            }
+
+    def coverage(self) -> Dict:
+        """First/last date (ISO strings) and number of days."""
+        with self._lock:
+            self._ensure_fresh()
+            days = sorted(self._entries)
+        return {
+            'start': days[0] if days else None,
+            'end': days[-1] if days else None,
+            'count': len(days)
+        }
+
+    def verify(self, trade_date: date) -> bool:
+        """Recompute a day's checksum and compare it with the manifest."""
+        entry = self.entry(trade_date)
+        if entry is None or entry.get('sha256') is None:
+            return False
+        return file_sha256(self.root / entry['path']) == entry['sha256']
+
+
+_manifests: Dict[Tuple[str, str, bool], DataManifest] = {}
+_manifests_lock = threading.Lock()
+
+
+def get_manifest(root, suffix: str = '.csv.gz', nested: bool = True) -> DataManifest:
+    """Process-wide manifest for a root (shared by every loader on that root)."""
+    key = (str(Path(root).expanduser()), suffix, nested)
+    with _manifests_lock:
+        manifest = _manifests.get(key)
+        if manifest is None:
+            manifest = DataManifest(key[0], suffix=suffix, nested=nested)
+            _manifests[key] = manifest
+        return manifest
+
+
+def reset_manifests():
+    """Forget the process-wide manifests (next use reloads from disk and refreshes)."""
+    with _manifests_lock:
+        _manifests.clear()
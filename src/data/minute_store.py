@@ -0,0 +1,178 @@
+"""
+Per-contract minute-bar store.
+
+A Polygon minute_aggs file holds every OPRA contract's minute bars for a day.
+Fetching one contract's intraday path used to parse the whole file. This store
+keeps the SPY slice as one Parquet file per day with rows sorted by contract
+(then by minute):
+
+    <store_root>/<UNDERLYING>/<YYYY>/<MM>/<YYYY-MM-DD>.parquet
+
+Row groups are small and carry min/max statistics on `contract_key`
+(contract_index.contract_key), so they act as the offset index: reading one
+contract only decodes the row groups that contain it.
+
+Build it with scripts/build_minute_bar_store.py. PolygonOptionsLoader reads
+it when present and falls back to the raw CSV.gz otherwise.
+"""
+
+import os
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pathlib import Path
+from datetime import date
+from typing import Optional, List
+
+from .contract_index import contract_key, contract_keys
+
+
+DEFAULT_MINUTE_STORE_ROOT = "/Volumes/VelocityData/rotation_engine/chain_store/minute_aggs"
+
+# Rows per Parquet row group (one contract has at most ~390 bars per session)
+DEFAULT_MINUTE_ROW_GROUP_SIZE = 16_384
+
+MINUTE_STORE_COLUMNS = [
+    'contract_key', 'ticker', 'underlying', 'expiry', 'strike', 'option_type',
+    'window_start', 'open', 'high', 'low', 'close',
+    'volume', 'transactions'
+]
+
+MINUTE_BAR_COLUMNS = ['window_start', 'open', 'high', 'low', 'close', 'volume']
+
+
+class MinuteBarStore:
+    """Date-partitioned Parquet dataset of minute bars sorted by contract."""
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        underlying: str = 'SPY',
+        row_group_size: int = DEFAULT_MINUTE_ROW_GROUP_SIZE
+    ):
+        resolved_root = root or os.environ.get("POLYGON_MINUTE_STORE_ROOT", DEFAULT_MINUTE_STORE_ROOT)
+        self.root = Path(resolved_root).expanduser()
+        self.underlying = underlying
+        self.row_group_size = row_group_size
+
+    @property
+    def available(self) -> bool:
+        """True when the store root exists (store is optional)."""
+        return self.root.exists()
+
+    def partition_path(self, trade_date: date) -> Path:
+        """Path of the Parquet partition for a trade date."""
+        year = trade_date.year
+        month = f"{trade_date.month:02d}"
+        day = f"{trade_date.day:02d}"
+        return self.root / self.underlying / str(year) / month / f"{year}-{month}-{day}.parquet"
+
+    def has_day(self, trade_date: date) -> bool:
+        """Check whether a partition exists for this date."""
+        return self.partition_path(trade_date).exists()
+
+    def read_day(self, trade_date: date) -> Optional[pd.DataFrame]:
+        """
+        Read every contract's minute bars for a day.
+
+        Returns:
+            DataFrame in the raw-parser layout (+ contract_key, date), or None
+            when the partition is missing so callers can fall back.
+        """
+        path = self.partition_path(trade_date)
+        if not path.exists():
+            return None
+
+        try:
+            df = pd.read_parquet(path)
+        except Exception as e:
+            print(f"Error loading {path}: {e}")
+            return None
+
+        if df.empty:
+            return pd.DataFrame()
+
+        df['date'] = trade_date
+        return df
+
+    def read_contract(
+        self,
+        trade_date: date,
+        strike: float,
+        expiry: date,
+        option_type: str,
+        columns: Optional[List[str]] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Read one contract's minute bars for a day (only its row groups are decoded).
+
+        Returns:
+            DataFrame with `columns` (default window_start/open/high/low/close/volume)
+            sorted by window_start - empty if the contract did not trade, or None
+            when the partition is missing.
+        """
+        path = self.partition_path(trade_date)
+        if not path.exists():
+            return None
+
+        key = contract_key(strike, expiry, option_type.lower())
+        if key is None:
+            return pd.DataFrame(columns=columns or MINUTE_BAR_COLUMNS)
+
+        try:
+            table = pq.read_table(
+                path,
+                columns=columns or MINUTE_BAR_COLUMNS,
+                filters=[('contract_key', '=', key)]
+            )
+        except Exception as e:
+            print(f"Error loading {path}: {e}")
+            return None
+
+        return table.to_pandas()
+
+    def write_day(self, trade_date: date, df: pd.DataFrame) -> Path:
+        """
+        Write one day's parsed minute bars atomically, sorted by (contract, minute).
+
+        An empty frame is still written so days with no contracts are not
+        re-parsed from raw on every read.
+        """
+        path = self.partition_path(trade_date)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if df.empty:
+            out = pd.DataFrame({col: pd.Series(dtype='int64' if col == 'contract_key' else 'object')
+                                for col in MINUTE_STORE_COLUMNS})
+        else:
+            out = df.copy(deep=False)
+            out['contract_key'] = contract_keys(out)
+            out = out[out['contract_key'] >= 0]
+            out = out.sort_values(['contract_key', 'window_start'], kind='stable')
+            out = out[[c for c in MINUTE_STORE_COLUMNS if c in out.columns]].reset_index(drop=True)
+
+        # Write to a temp file then rename so readers never see a partial partition
+        tmp_path = path.with_name(path.name + '.tmp')
+        pq.write_table(
+            pa.Table.from_pandas(out, preserve_index=False),
+            tmp_path,
+            row_group_size=self.row_group_size
+        )
+        os.replace(tmp_path, path)
+
+        return path
+
+    def list_dates(self) -> List[date]:
+        """All dates with a partition, sorted."""
+        base = self.root / self.underlying
+        if not base.exists():
+            return []
+
+        dates = []
+        for path in base.glob('*/*/*.parquet'):
+            try:
+                dates.append(date.fromisoformat(path.stem))
+            except ValueError:
+                continue
+
+        return sorted(dates)
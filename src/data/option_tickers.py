@@ -0,0 +1,118 @@
+"""
+Vectorized OCC option ticker parsing.
+
+Polygon option tickers follow O:[underlying][YYMMDD][C/P][strike*1000],
+e.g. O:SPY240119C00450000. Full OPRA files hold millions of them per day,
+so parsing row by row in Python dominates load time. This parser works on
+the whole ticker column at once and drops unwanted underlyings before any
+regex or date work.
+
+Roots have any length (QQQ, IWM, SPXW, adjusted roots like SPY1): the
+date/type/strike tail is fixed-width, so the root is whatever precedes it.
+Several underlyings can be extracted from one file in a single pass
+(split_by_underlying).
+"""
+
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from typing import Dict, Iterable, Tuple, Union
+
+
+PARSED_COLUMNS = ['underlying', 'expiry', 'strike', 'option_type']
+
+_TICKER_PATTERN = r"^O:(.+)(\d{6})([CP])(\d{8})$"
+
+
+def _roots(underlying: Union[str, Iterable[str]]) -> Tuple[str, ...]:
+    return (underlying,) if isinstance(underlying, str) else tuple(underlying)
+
+
+def parse_option_tickers(tickers: pd.Series, underlying: Union[str, Iterable[str]] = 'SPY') -> pd.DataFrame:
+    """
+    Parse a column of Polygon option tickers for one or more underlyings.
+
+    Args:
+        tickers: Series of ticker strings (any index)
+        underlying: Underlying root to keep (e.g. 'SPY'), or several roots
+
+    Returns:
+        DataFrame with columns underlying, expiry (datetime.date), strike (float),
+        option_type ('call'/'put'), indexed by the positions in `tickers` that
+        parsed successfully. Unparseable tickers and other roots are dropped.
+    """
+    roots = _roots(underlying)
+    tickers = tickers.astype(str)
+
+    # Cheap prefix filter first - typically keeps a few percent of OPRA rows
+    prefixes = tuple(f"O:{root}" for root in roots)
+    candidates = tickers[tickers.str.startswith(prefixes, na=False)]
+    if candidates.empty:
+        return pd.DataFrame(columns=PARSED_COLUMNS)
+
+    parts = candidates.str.extract(_TICKER_PATTERN)
+    parts = parts.dropna()
+    # Prefix matches can be longer roots (SPYG for SPY)
+    parts = parts[parts[0].isin(roots)]
+    if parts.empty:
+        return pd.DataFrame(columns=PARSED_COLUMNS)
+
+    # Few distinct expiries per day - parse each once, then map
+    date_strs = parts[1]
+    expiry_map = {}
+    for date_str in date_strs.unique():
+        try:
+            expiry_map[date_str] = datetime.strptime(date_str, '%y%m%d').date()
+        except ValueError:
+            expiry_map[date_str] = None
+    expiry = date_strs.map(expiry_map)
+
+    valid = expiry.notna()
+    parts = parts[valid]
+    expiry = expiry[valid]
+
+    strike = parts[3].astype(np.int64).to_numpy() / 1000.0
+    option_type = np.where(parts[2].to_numpy() == 'C', 'call', 'put')
+
+    return pd.DataFrame({
+        'underlying': parts[0].to_numpy(dtype=object),
+        'expiry': expiry.to_numpy(dtype=object),
+        'strike': strike,
+        'option_type': option_type.astype(object)
+    }, index=parts.index)
+
+
+def attach_parsed_tickers(df: pd.DataFrame, underlying: Union[str, Iterable[str]] = 'SPY') -> pd.DataFrame:
+    """
+    Keep rows of a raw Polygon frame whose ticker parses, with parsed columns appended.
+
+    Returns an empty DataFrame when nothing parses.
+    """
+    parsed = parse_option_tickers(df['ticker'], underlying=underlying)
+    if parsed.empty:
+        return pd.DataFrame()
+
+    rows = df.loc[parsed.index].reset_index(drop=True)
+    return pd.concat([rows, parsed.reset_index(drop=True)], axis=1)
+
+
+def split_by_underlying(df: pd.DataFrame, underlyings: Iterable[str]) -> Dict[str, pd.DataFrame]:
+    """
+    Parse a raw Polygon frame once and split it per underlying.
+
+    Returns:
+        Dict underlying -> parsed rows (raw columns + PARSED_COLUMNS, in file
+        order); an empty DataFrame for roots with no rows
+    """
+    roots = _roots(underlyings)
+    parsed = attach_parsed_tickers(df, underlying=roots)
+    if parsed.empty:
+        return {root: pd.DataFrame() for root in roots}
+    if len(roots) == 1:
+        return {roots[0]: parsed}
+
+    groups = parsed.groupby('underlying', sort=False).indices
+    return {
+        root: parsed.iloc[groups[root]].reset_index(drop=True) if root in groups else pd.DataFrame()
+        for root in roots
+    }
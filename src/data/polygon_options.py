@@ -9,9 +9,22 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from datetime import datetime, date
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, Iterable, List, Tuple
 import gzip
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+
+from src.data.chain_arena import ChainArena
+from src.data.chain_store import OptionsChainStore
+from src.data.minute_store import MinuteBarStore
+from src.data.manifest import get_manifest
+from src.data.option_tickers import split_by_underlying
+from src.data.contract_index import (
+    ContractIndex, DayChain, SpreadOverlay, expiry_ordinal, garbage_mask, quote_mask
+)
+from src.data.chain_cache import ChainCache, freeze_frame, get_shared_chain_cache
+from src.data.chain_schema import (
+    chain_day_ordinals, chain_strikes, compact_chain, compact_columns, expand_chain
+)
 
 # Import execution model for realistic spread calculation
 # Delay import to avoid circular dependency
@@ -23,6 +36,25 @@ if TYPE_CHECKING:
 DEFAULT_POLYGON_ROOT = "/Volumes/VelocityData/polygon_downloads/us_options_opra/day_aggs_v1"
 DEFAULT_POLYGON_MINUTE_ROOT = "/Volumes/VelocityData/polygon_downloads/us_options_opra/minute_aggs_v1"
 
+# Underlyings extracted from each raw OPRA file read (comma-separated via
+# POLYGON_EXTRACT_UNDERLYINGS); the loader's own underlying is always included
+DEFAULT_EXTRACT_UNDERLYINGS: List[str] = []
+
+# Spot-independent columns kept per cached day (bid/ask come from the overlay)
+BASE_CHAIN_COLUMNS = [
+    'date', 'expiry', 'strike', 'option_type', 'dte',
+    'open', 'high', 'low', 'close', 'mid',
+    'volume', 'transactions'
+]
+
+# load_day / get_chain output (chain + modeled bid/ask)
+LOAD_DAY_COLUMNS = [
+    'date', 'expiry', 'strike', 'option_type', 'dte',
+    'open', 'high', 'low', 'close',
+    'mid', 'bid', 'ask',
+    'volume', 'transactions'
+]
+
 
 class PolygonOptionsLoader:
     """
@@ -36,8 +68,22 @@ class PolygonOptionsLoader:
         self,
         data_root: Optional[str] = None,
         minute_data_root: Optional[str] = None,
-        execution_model: Optional["ExecutionModel"] = None
+        execution_model: Optional["ExecutionModel"] = None,
+        chain_store_root: Optional[str] = None,
+        chain_cache: Optional[ChainCache] = None,
+        minute_store_root: Optional[str] = None,
+        underlying: str = 'SPY',
+        extract_underlyings: Optional[Iterable[str]] = None,
+        chain_arena_root: Optional[str] = None
     ):
+        """
+        Args:
+            underlying: Option root this loader serves (e.g. 'SPY', 'QQQ')
+            extract_underlyings: Other roots to parse from the same raw file
+                read; their days go straight into the shared chain cache
+            chain_arena_root: Shared memory-mapped day chains (used when the
+                root exists; default POLYGON_CHAIN_ARENA_ROOT)
+        """
         resolved_root = data_root or os.environ.get("POLYGON_DATA_ROOT", DEFAULT_POLYGON_ROOT)
         self.data_root = Path(resolved_root).expanduser()
         if not self.data_root.exists():
@@ -51,8 +97,33 @@ class PolygonOptionsLoader:
         self.minute_data_root = Path(minute_root_resolved).expanduser()
         self.has_minute_data = self.minute_data_root.exists()
 
-        self._date_cache: Dict[date, pd.DataFrame] = {}
-        self._minute_cache: Dict[date, pd.DataFrame] = {}
+        self.underlying = underlying
+        if extract_underlyings is None:
+            configured = os.environ.get("POLYGON_EXTRACT_UNDERLYINGS")
+            extract_underlyings = configured.split(',') if configured else DEFAULT_EXTRACT_UNDERLYINGS
+        self.extract_underlyings = list(dict.fromkeys(
+            [underlying] + [u.strip() for u in extract_underlyings if u.strip()]
+        ))
+
+        # Coverage manifests (replace per-day exists checks on the raw roots)
+        self.day_manifest = get_manifest(self.data_root)
+        self.minute_manifest = get_manifest(self.minute_data_root)
+
+        # Pre-parsed Parquet chains (optional - falls back to raw CSV.gz per day)
+        self.chain_store = OptionsChainStore(chain_store_root, underlying=underlying)
+
+        # Day chains mapped read-only and shared across processes (optional)
+        self.chain_arena = ChainArena(chain_arena_root, underlying=underlying)
+
+        # Minute bars sorted by contract (optional - falls back to raw CSV.gz per day)
+        self.minute_store = MinuteBarStore(minute_store_root, underlying=underlying)
+
+        # Parsed days are shared process-wide unless a cache is injected
+        self.chain_cache = chain_cache if chain_cache is not None else get_shared_chain_cache()
+
+        # Bid/ask overlays per (date, spot, RV) - small arrays, bounded LRU
+        self._overlay_cache: "OrderedDict[tuple, SpreadOverlay]" = OrderedDict()
+        self.overlay_cache_size = 64
 
         # Execution model for realistic spread calculation (lazy import)
         if execution_model is None:
@@ -115,20 +186,65 @@ class PolygonOptionsLoader:
             'option_type': 'call' if opt_type == 'C' else 'put'
         }
 
-    def _load_day_raw(self, trade_date: date) -> pd.DataFrame:
+    def _take_day_raw(self, trade_date: date) -> pd.DataFrame:
+        """
+        Parsed day for building its DayChain. The DayChain is what gets cached,
+        so a raw entry already in the cache (e.g. put by a sibling read) is
+        taken out of it, and a fresh read is not cached.
         """
-        Load raw Polygon data for a single day.
+        df = self.chain_cache.pop(self._cache_key('day_aggs', trade_date))
+        if df is None:
+            df = freeze_frame(compact_chain(self._read_day(trade_date)))
+        return df
+
+    def _cache_key(self, kind: str, trade_date: date, underlying: Optional[str] = None) -> tuple:
+        """Shared chain cache key: (kind, raw root, date, underlying)."""
+        root = self.minute_data_root if kind == 'minute_aggs' else self.data_root
+        return (kind, str(root), trade_date, underlying or self.underlying)
+
+    def _read_day(self, trade_date: date) -> pd.DataFrame:
+        """
+        Read one day from the chain store, falling back to raw CSV.gz (uncached).
+
+        A raw read also parses the other extract_underlyings from the same
+        file and puts their days in the shared chain cache.
+        """
+        if self.chain_store.available:
+            df = self.chain_store.read_day(trade_date)
+            if df is not None:
+                return df
+
+        if len(self.extract_underlyings) == 1:
+            return self.read_raw_day(trade_date)
+
+        days = self.read_raw_day_multi(trade_date, self.extract_underlyings)
+        for underlying, df in days.items():
+            if underlying != self.underlying:
+                self.chain_cache.put(self._cache_key('day_aggs', trade_date, underlying), compact_chain(df))
+        return days[self.underlying]
+
+    def read_raw_day(self, trade_date: date) -> pd.DataFrame:
+        """
+        Parse a single day straight from the Polygon CSV.gz (bypasses the chain store).
 
         Returns DataFrame with parsed option info + OHLC data.
         """
-        year = trade_date.year
-        month = f"{trade_date.month:02d}"
-        day = f"{trade_date.day:02d}"
+        return self.read_raw_day_multi(trade_date, [self.underlying])[self.underlying]
 
-        file_path = self.data_root / str(year) / month / f"{year}-{month}-{day}.csv.gz"
+    def read_raw_day_multi(self, trade_date: date, underlyings: Iterable[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Parse several underlyings from one read of a day's Polygon CSV.gz.
 
-        if not file_path.exists():
-            return pd.DataFrame()
+        Returns:
+            Dict underlying -> parsed day (empty DataFrame when it has no rows)
+        """
+        return self._read_raw_file(self.day_manifest.path_for(trade_date), trade_date, underlyings)
+
+    @staticmethod
+    def _read_raw_file(file_path: Optional[Path], trade_date: date, underlyings: Iterable[str]) -> Dict[str, pd.DataFrame]:
+        underlyings = list(underlyings)
+        if file_path is None:
+            return {u: pd.DataFrame() for u in underlyings}
 
         # Read compressed CSV
         try:
@@ -136,89 +252,164 @@ class PolygonOptionsLoader:
                 df = pd.read_csv(f)
         except Exception as e:
             print(f"Error loading {file_path}: {e}")
-            return pd.DataFrame()
+            return {u: pd.DataFrame() for u in underlyings}
 
-        # Parse tickers
-        parsed = df['ticker'].apply(self._parse_option_ticker)
+        # Parse tickers once (vectorized), split per underlying
+        days = split_by_underlying(df, underlyings)
+        for result in days.values():
+            if not result.empty:
+                result['date'] = trade_date
 
-        # Filter valid parsed tickers (SPY options only)
-        valid_mask = parsed.notna()
+        return days
 
-        if not valid_mask.any():
-            return pd.DataFrame()
+    def _load_day_chain(self, trade_date: date) -> DayChain:
+        """
+        Spot-independent chain for a date (dte + mid added) and its contract index.
 
-        parsed_series = parsed[valid_mask].reset_index(drop=True)
-        df = df[valid_mask].reset_index(drop=True)
+        Built once per date and kept in the shared chain cache.
+        """
+        cache_key = self._cache_key('day_chain', trade_date)
+        return self.chain_cache.get_or_load(cache_key, lambda: self._build_day_chain(trade_date))
 
-        # Convert parsed dicts to DataFrame
-        parsed_df = pd.DataFrame(parsed_series.tolist())
+    def _build_day_chain(self, trade_date: date) -> DayChain:
+        use_arena = self.chain_arena.available
+        if use_arena:
+            day_chain = self._map_arena_day(trade_date)
+            if day_chain is not None:
+                return day_chain
 
-        # Merge with price data
-        result = pd.concat([df, parsed_df], axis=1)
-        result['date'] = trade_date
+        # Parsed chain is frozen - add columns on a zero-copy view
+        df = self._take_day_raw(trade_date).copy(deep=False)
 
-        return result
+        if df.empty:
+            return DayChain(frame=df, index=ContractIndex(df))
+
+        df = self._prepare_chain_frame(df)
+
+        if use_arena:
+            # Publish the day, then serve the mapped copy other processes share
+            try:
+                self.chain_arena.write_day(trade_date, df)
+            except OSError as e:
+                print(f"Warning: could not publish {trade_date} to chain arena: {e}")
+            else:
+                day_chain = self._map_arena_day(trade_date)
+                if day_chain is not None:
+                    return day_chain
+
+        return DayChain(frame=freeze_frame(df), index=ContractIndex(df))
+
+    def _map_arena_day(self, trade_date: date) -> Optional[DayChain]:
+        """Day chain backed by the arena mapping (only the index is private)."""
+        arena_day = self.chain_arena.read_day(trade_date)
+        if arena_day is None:
+            return None
 
-    def load_day(self, trade_date: date, spot_price: Optional[float] = None, rv_20: Optional[float] = None) -> pd.DataFrame:
-        """
-        Load options data for a specific date with caching.
+        frame = freeze_frame(arena_day.frame)
+        index = ContractIndex(frame)
+        shared = arena_day.shared_nbytes(arena_day.column_arrays() + list(index.columns.values()))
+        return DayChain(frame=frame, index=index, shared_nbytes=shared)
 
-        Args:
-            trade_date: Trading date
-            spot_price: SPY spot price (required for realistic spread calculation)
-            rv_20: 20-day realized volatility (for VIX proxy, optional)
+    @staticmethod
+    def _prepare_chain_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """Add dte and mid to a parsed chain and keep BASE_CHAIN_COLUMNS (compact schema)."""
+        # Calculate DTE
+        df['dte'] = chain_day_ordinals(df['expiry']) - chain_day_ordinals(df['date'])
 
-        Returns DataFrame with:
-            - date, expiry, strike, option_type
-            - open, high, low, close
-            - volume, transactions
-            - bid, ask, mid (computed using ExecutionModel)
-        """
-        # Check cache (don't cache if spot_price provided - spreads change with spot)
+        # Use close as theoretical mid price
+        df['mid'] = df['close']
+
+        df = compact_chain(df)
+        return df[[c for c in compact_columns(BASE_CHAIN_COLUMNS) if c in df.columns]].reset_index(drop=True)
+
+    def _get_spread_overlay(
+        self,
+        trade_date: date,
+        day_chain: DayChain,
+        spot_price: Optional[float],
+        rv_20: Optional[float]
+    ) -> SpreadOverlay:
+        """Modeled bid/ask for a day under (spot, RV), memoized per loader."""
         cache_key = (trade_date, spot_price, rv_20)
-        if cache_key in self._date_cache:
-            return self._date_cache[cache_key].copy()
+        overlay = self._overlay_cache.get(cache_key)
+        if overlay is not None:
+            self._overlay_cache.move_to_end(cache_key)
+            return overlay
+
+        overlay = self._compute_spread_overlay(trade_date, day_chain.frame, spot_price, rv_20)
 
-        # Load from disk
-        df = self._load_day_raw(trade_date)
+        self._overlay_cache[cache_key] = overlay
+        while len(self._overlay_cache) > self.overlay_cache_size:
+            self._overlay_cache.popitem(last=False)
 
+        return overlay
+
+    def _compute_spread_overlay(
+        self,
+        trade_date: date,
+        df: pd.DataFrame,
+        spot_price: Optional[float],
+        rv_20: Optional[float]
+    ) -> SpreadOverlay:
+        """Compute bid/ask arrays for a chain using the ExecutionModel."""
         if df.empty:
-            self._date_cache[cache_key] = df
-            return df
+            empty = np.zeros(0)
+            return SpreadOverlay(bid=empty, ask=empty, valid=np.zeros(0, dtype=bool))
+
+        bid, ask = self.model_bid_ask(
+            df['mid'].to_numpy(dtype=float),
+            chain_strikes(df),
+            df['dte'].to_numpy(),
+            spot_price=spot_price,
+            rv_20=rv_20,
+            trade_date=trade_date
+        )
+        valid = quote_mask(df['close'].to_numpy(), bid, ask, df['volume'].to_numpy())
+        for values in (bid, ask, valid):
+            values.flags.writeable = False
 
-        # Calculate DTE
-        df['dte'] = (pd.to_datetime(df['expiry']) - pd.to_datetime(df['date'])).dt.days
+        return SpreadOverlay(bid=bid, ask=ask, valid=valid)
 
-        # Use close as theoretical mid price
-        df['mid'] = df['close']
+    def model_bid_ask(
+        self,
+        mid: np.ndarray,
+        strike: np.ndarray,
+        dte: np.ndarray,
+        spot_price: Optional[float] = None,
+        rv_20: Optional[float] = None,
+        trade_date: Optional[date] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Modeled bid/ask arrays for contracts with the given mid/strike/DTE.
+
+        The spread model behind load_day, usable on any set of rows (a whole
+        chain, or one contract's path from a ContractPanel).
+        spot_price/rv_20 may be scalars or per-row arrays.
+        """
+        mid = np.asarray(mid, dtype=float)
 
         # Calculate realistic bid/ask spreads using ExecutionModel
         if spot_price is not None:
             # Import helper functions (lazy to avoid circular import)
-            from src.trading.execution import calculate_moneyness, get_vix_proxy
+            from src.trading.execution import get_vix_proxy
 
-            # Calculate moneyness for each option
-            df['moneyness'] = df['strike'].apply(lambda s: calculate_moneyness(s, spot_price))
+            # Moneyness: abs(strike - spot) / spot
+            moneyness = np.abs(np.asarray(strike, dtype=float) - spot_price) / spot_price
 
             # Get VIX proxy if RV available
             vix_level = get_vix_proxy(rv_20) if rv_20 is not None else 20.0
 
-            # Calculate spread for each option using ExecutionModel
-            df['spread_dollars'] = df.apply(
-                lambda row: self.execution_model.get_spread(
-                    mid_price=row['mid'],
-                    moneyness=row['moneyness'],
-                    dte=row['dte'],
-                    vix_level=vix_level,
-                    is_strangle=False  # Conservative: assume straddle spreads (wider)
-                ),
-                axis=1
+            # Calculate spread for all rows using ExecutionModel
+            spread_dollars = self.execution_model.get_spread_array(
+                mid_price=mid,
+                moneyness=moneyness,
+                dte=np.asarray(dte),
+                vix_level=vix_level,
+                is_strangle=False  # Conservative: assume straddle spreads (wider)
             )
 
             # Apply spreads: bid = mid - half_spread, ask = mid + half_spread
-            half_spread = df['spread_dollars'] / 2.0
-            df['bid'] = (df['mid'] - half_spread).clip(lower=0.005)
-            df['ask'] = df['mid'] + half_spread
+            half_spread = spread_dollars / 2.0
 
         else:
             # Fallback to simple 2% spread if spot_price not provided
@@ -229,24 +420,95 @@ class PolygonOptionsLoader:
                 "Pass spot_price for realistic spread modeling."
             )
             spread_pct = 0.02
-            half_spread = df['mid'] * spread_pct / 2
-            df['bid'] = (df['mid'] - half_spread).clip(lower=0.005)
-            df['ask'] = df['mid'] + half_spread
+            half_spread = mid * spread_pct / 2
+
+        bid = np.maximum(mid - half_spread, 0.005)
+        ask = mid + half_spread
 
-        # Select columns
-        columns = [
-            'date', 'expiry', 'strike', 'option_type', 'dte',
-            'open', 'high', 'low', 'close',
-            'mid', 'bid', 'ask',
-            'volume', 'transactions'
-        ]
+        return bid, ask
 
-        df = df[[c for c in columns if c in df.columns]].copy()
+    def load_day(self, trade_date: date, spot_price: Optional[float] = None, rv_20: Optional[float] = None) -> pd.DataFrame:
+        """
+        Load options data for a specific date with caching.
 
-        # Cache result
-        self._date_cache[cache_key] = df.copy()
+        The parsed chain is cached once per date; bid/ask for each
+        (spot_price, rv_20) input is a separately memoized overlay.
 
-        return df
+        Args:
+            trade_date: Trading date
+            spot_price: SPY spot price (required for realistic spread calculation)
+            rv_20: 20-day realized volatility (for VIX proxy, optional)
+
+        Returns DataFrame with:
+            - date, expiry, strike, option_type
+            - open, high, low, close
+            - volume, transactions
+            - bid, ask, mid (computed using ExecutionModel)
+
+        Price columns are zero-copy views over the cached (compact) chain and
+        read-only; copy() before modifying values in place. Dates, strikes and
+        option types are expanded from the compact schema per call.
+        """
+        day_chain = self._load_day_chain(trade_date)
+
+        if day_chain.frame.empty:
+            return pd.DataFrame()
+
+        overlay = self._get_spread_overlay(trade_date, day_chain, spot_price, rv_20)
+
+        df = expand_chain(day_chain.frame)
+        df['bid'] = overlay.bid
+        df['ask'] = overlay.ask
+
+        return df[[c for c in LOAD_DAY_COLUMNS if c in df.columns]]
+
+    def get_contract_index(self, trade_date: date) -> ContractIndex:
+        """
+        Get the (expiry, option_type, strike) lookup index for a day.
+
+        Built once per date and cached with the parsed chain.
+        """
+        return self._load_day_chain(trade_date).index
+
+    def prefetch_day(self, trade_date: date):
+        """
+        Load a day's chain into the chain cache (for background prefetch).
+
+        Safe to call from worker threads; see src/data/prefetch.py.
+        """
+        self._load_day_chain(trade_date)
+
+    def get_option_quote(
+        self,
+        trade_date: date,
+        strike: float,
+        expiry: date,
+        option_type: str,
+        spot_price: Optional[float] = None,
+        rv_20: Optional[float] = None,
+        filter_garbage: bool = True
+    ) -> Optional[Dict]:
+        """
+        Get full quote (bid/ask/mid/close/volume) for a specific contract in one lookup.
+
+        Args:
+            trade_date: Trading date
+            strike: Strike price (matched to the cent)
+            expiry: Expiration date
+            option_type: 'call' or 'put'
+            spot_price: SPY spot price (for realistic spreads)
+            rv_20: 20-day realized volatility (for VIX proxy)
+            filter_garbage: Skip garbage quotes (zero volume, inverted, non-positive)
+
+        Returns:
+            Dict with strike, expiry, option_type, open/high/low/close, mid, bid, ask,
+            volume - or None if not found
+        """
+        quotes = self.get_option_quotes_bulk(
+            trade_date, [(strike, expiry, option_type)],
+            spot_price=spot_price, rv_20=rv_20, filter_garbage=filter_garbage
+        )
+        return quotes.get((strike, expiry, option_type))
 
     def get_option_price(
         self,
@@ -273,28 +535,16 @@ class PolygonOptionsLoader:
         Returns:
             Price or None if not found
         """
-        df = self.load_day(trade_date, spot_price=spot_price, rv_20=rv_20)
-
-        if df.empty:
-            return None
-
-        # Filter garbage quotes before lookup
-        df = self._filter_garbage(df)
-
-        # Filter for exact match (use numpy.isclose for float comparison)
-        mask = (
-            (np.abs(df['strike'] - strike) < 0.01) &  # Within 1 cent
-            (df['expiry'] == expiry) &
-            (df['option_type'] == option_type)
+        # Garbage quotes are excluded by the index lookup
+        quote = self.get_option_quote(
+            trade_date, strike, expiry, option_type,
+            spot_price=spot_price, rv_20=rv_20
         )
 
-        matches = df[mask]
-
-        if len(matches) == 0:
+        if quote is None:
             return None
 
-        # Return first match (should be unique)
-        return float(matches.iloc[0][price_type])
+        return quote[price_type]
 
     def find_closest_contract(
         self,
@@ -307,31 +557,32 @@ class PolygonOptionsLoader:
         spot_price: Optional[float] = None,
         rv_20: Optional[float] = None
     ) -> Optional[Dict]:
-        """Find the closest-available contract when exact match missing."""
-        df = self.load_day(trade_date, spot_price=spot_price, rv_20=rv_20)
+        """
+        Find the closest-available contract when exact match missing.
 
-        if df.empty:
-            return None
+        Nearest expiry first, then nearest strike (ties go to the first row in
+        chain order). Uses the day's sorted search arrays - no chain scan.
+        """
+        day_chain = self._load_day_chain(trade_date)
 
-        subset = df[df['option_type'] == option_type].copy()
-        if subset.empty:
+        if day_chain.frame.empty:
             return None
 
-        subset['expiry_date'] = pd.to_datetime(subset['expiry']).dt.date
-        subset['expiry_diff'] = subset['expiry_date'].apply(lambda d: abs((d - expiry).days))
-        subset['strike_diff'] = (subset['strike'] - strike).abs()
-        subset = subset.sort_values(['expiry_diff', 'strike_diff'])
+        match = day_chain.index.nearest(strike, expiry, option_type)
+        if match is None:
+            return None
 
-        best = subset.iloc[0]
-        if best['expiry_diff'] > max_expiry_diff or best['strike_diff'] > max_strike_diff:
+        pos, expiry_diff, strike_diff = match
+        if expiry_diff > max_expiry_diff or strike_diff > max_strike_diff:
             return None
 
+        overlay = self._get_spread_overlay(trade_date, day_chain, spot_price, rv_20)
         return {
-            'strike': float(best['strike']),
-            'expiry': best['expiry_date'],
-            'bid': float(best['bid']),
-            'ask': float(best['ask']),
-            'mid': float(best['mid'])
+            'strike': float(day_chain.index.strikes[pos]),
+            'expiry': date.fromordinal(expiry_ordinal(day_chain.index.expiries[pos])),
+            'bid': float(overlay.bid[pos]),
+            'ask': float(overlay.ask[pos]),
+            'mid': float(day_chain.index.columns['mid'][pos])
         }
 
     def get_option_prices_bulk(
@@ -355,24 +606,40 @@ class PolygonOptionsLoader:
         Returns:
             Dict mapping (strike, expiry, option_type) -> price
         """
-        df = self.load_day(trade_date, spot_price=spot_price, rv_20=rv_20)
+        quotes = self.get_option_quotes_bulk(
+            trade_date, contracts,
+            spot_price=spot_price, rv_20=rv_20, filter_garbage=False
+        )
 
-        if df.empty:
-            return {}
+        return {contract: quote[price_type] for contract, quote in quotes.items()}
 
-        result = {}
+    def get_option_quotes_bulk(
+        self,
+        trade_date: date,
+        contracts: list,  # List of (strike, expiry, option_type) tuples
+        spot_price: Optional[float] = None,
+        rv_20: Optional[float] = None,
+        filter_garbage: bool = True
+    ) -> Dict[Tuple[float, date, str], Dict]:
+        """
+        Get full quotes for multiple contracts with one index lookup each.
 
-        for strike, expiry, option_type in contracts:
-            mask = (
-                (df['strike'] == strike) &
-                (df['expiry'] == expiry) &
-                (df['option_type'] == option_type)
-            )
+        Returns:
+            Dict mapping (strike, expiry, option_type) -> quote dict
+            (contracts not found are omitted)
+        """
+        day_chain = self._load_day_chain(trade_date)
+        if day_chain.frame.empty:
+            return {}
 
-            matches = df[mask]
+        overlay = self._get_spread_overlay(trade_date, day_chain, spot_price, rv_20)
+        valid = overlay.valid if filter_garbage else None
 
-            if len(matches) > 0:
-                result[(strike, expiry, option_type)] = matches.iloc[0][price_type]
+        result = {}
+        for strike, expiry, option_type in contracts:
+            pos = day_chain.index.find(strike, expiry, option_type, valid=valid)
+            if pos is not None:
+                result[(strike, expiry, option_type)] = day_chain.index.quote(pos, overlay)
 
         return result
 
@@ -384,11 +651,21 @@ class PolygonOptionsLoader:
         max_dte: Optional[int] = None,
         filter_garbage: bool = True,
         spot_price: Optional[float] = None,
-        rv_20: Optional[float] = None
+        rv_20: Optional[float] = None,
+        option_type: Optional[str] = None,
+        min_strike: Optional[float] = None,
+        max_strike: Optional[float] = None,
+        max_moneyness: Optional[float] = None,
+        min_volume: Optional[float] = None
     ) -> pd.DataFrame:
         """
         Get options chain for a specific date, optionally filtered.
 
+        Predicates are pushed into the read: expiry/DTE select a sorted range
+        of the cached day, or prune Parquet row groups when the day is read
+        from the chain store. Only matching rows are materialized (and get
+        bid/ask computed).
+
         Args:
             trade_date: Trading date
             expiry: Specific expiry (optional)
@@ -397,29 +674,110 @@ class PolygonOptionsLoader:
             filter_garbage: Remove bad quotes
             spot_price: SPY spot price (for realistic spreads)
             rv_20: 20-day realized volatility (for VIX proxy)
+            option_type: 'call' or 'put'
+            min_strike: Minimum strike
+            max_strike: Maximum strike
+            max_moneyness: Maximum abs(strike - spot) / spot (needs spot_price)
+            min_volume: Minimum daily volume
 
         Returns:
-            Filtered options chain
+            Filtered options chain (load_day columns)
         """
-        df = self.load_day(trade_date, spot_price=spot_price, rv_20=rv_20)
-
-        if df.empty:
-            return df
-
-        # Apply filters
+        if max_moneyness is not None:
+            if spot_price is None:
+                raise ValueError("max_moneyness requires spot_price")
+            band_lo = spot_price * (1.0 - max_moneyness)
+            band_hi = spot_price * (1.0 + max_moneyness)
+            min_strike = band_lo if min_strike is None else max(min_strike, band_lo)
+            max_strike = band_hi if max_strike is None else min(max_strike, band_hi)
+
+        # Expiry and DTE bounds as one expiry-ordinal range
+        first_expiry = trade_date.toordinal() + min_dte if min_dte is not None else None
+        last_expiry = trade_date.toordinal() + max_dte if max_dte is not None else None
         if expiry is not None:
-            df = df[df['expiry'] == expiry].copy()
+            exact = expiry_ordinal(expiry)
+            first_expiry = exact if first_expiry is None else max(first_expiry, exact)
+            last_expiry = exact if last_expiry is None else min(last_expiry, exact)
+
+        overlay = None
+        if (self._day_chain_cached(trade_date) or self.chain_arena.has_day(trade_date)
+                or not self.chain_store.has_day(trade_date)):
+            day_chain = self._load_day_chain(trade_date)
+            frame = day_chain.frame
+            if frame.empty:
+                return pd.DataFrame()
+            rows = day_chain.index.rows_in_expiry_range(first_expiry, last_expiry)
+            overlay = self._overlay_cache.get((trade_date, spot_price, rv_20))
+        else:
+            frame = self._read_chain_pushdown(trade_date, first_expiry, last_expiry, min_strike, max_strike)
+            if frame.empty:
+                return pd.DataFrame()
+            rows = np.arange(len(frame))
+
+        keep = np.ones(len(rows), dtype=bool)
+        if option_type is not None:
+            keep &= (frame['option_type'] == option_type).to_numpy()[rows]
+        if min_strike is not None or max_strike is not None:
+            strikes = chain_strikes(frame)[rows]
+            if min_strike is not None:
+                keep &= strikes >= min_strike
+            if max_strike is not None:
+                keep &= strikes <= max_strike
+        if min_volume is not None:
+            keep &= frame['volume'].to_numpy()[rows] >= min_volume
+        rows = rows[keep]
+
+        # Bid/ask for the surviving rows only (reuse a memoized overlay if there is one)
+        if overlay is not None:
+            bid, ask = overlay.bid[rows], overlay.ask[rows]
+        else:
+            bid, ask = self.model_bid_ask(
+                frame['mid'].to_numpy(dtype=float)[rows],
+                chain_strikes(frame)[rows],
+                frame['dte'].to_numpy()[rows],
+                spot_price=spot_price,
+                rv_20=rv_20,
+                trade_date=trade_date
+            )
 
-        if min_dte is not None:
-            df = df[df['dte'] >= min_dte].copy()
+        if filter_garbage:
+            valid = quote_mask(frame['close'].to_numpy()[rows], bid, ask, frame['volume'].to_numpy()[rows])
+            rows, bid, ask = rows[valid], bid[valid], ask[valid]
 
-        if max_dte is not None:
-            df = df[df['dte'] <= max_dte].copy()
+        df = expand_chain(frame.iloc[rows])
+        df['bid'] = bid
+        df['ask'] = ask
+        return df[[c for c in LOAD_DAY_COLUMNS if c in df.columns]]
 
-        if filter_garbage:
-            df = self._filter_garbage(df)
+    def _day_chain_cached(self, trade_date: date) -> bool:
+        return self._cache_key('day_chain', trade_date) in self.chain_cache
 
-        return df
+    def _read_chain_pushdown(
+        self,
+        trade_date: date,
+        first_expiry: Optional[int],
+        last_expiry: Optional[int],
+        min_strike: Optional[float],
+        max_strike: Optional[float]
+    ) -> pd.DataFrame:
+        """
+        Read only the matching contracts of a day from the chain store
+        (row groups pruned by expiry/strike statistics; not cached).
+        """
+        filters = []
+        if first_expiry is not None:
+            filters.append(('expiry', '>=', date.fromordinal(first_expiry)))
+        if last_expiry is not None:
+            filters.append(('expiry', '<=', date.fromordinal(last_expiry)))
+        if min_strike is not None:
+            filters.append(('strike', '>=', float(min_strike)))
+        if max_strike is not None:
+            filters.append(('strike', '<=', float(max_strike)))
+
+        df = self.chain_store.read_day(trade_date, filters=filters or None)
+        if df is None or df.empty:
+            return pd.DataFrame()
+        return self._prepare_chain_frame(df)
 
     def _filter_garbage(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -431,17 +789,8 @@ class PolygonOptionsLoader:
         if df.empty:
             return df
 
-        # Remove zero/negative prices
-        df = df[df['close'] > 0].copy()
-        df = df[(df['bid'] > 0) & (df['ask'] > 0)].copy()
-
-        # Remove inverted markets
-        df = df[df['ask'] >= df['bid']].copy()
-
-        # Remove zero volume (stale quotes)
-        df = df[df['volume'] > 0].copy()
-
-        return df
+        # Single combined mask (one filtered frame instead of one per rule)
+        return df.iloc[np.flatnonzero(garbage_mask(df))]
 
     def load_minute_bars(
         self,
@@ -463,6 +812,12 @@ class PolygonOptionsLoader:
             DataFrame with columns: timestamp, open, high, low, close, volume
             Empty DataFrame if no data available
         """
+        # Minute store: read only this contract's rows
+        if self.minute_store.available:
+            bars = self.minute_store.read_contract(trade_date, strike, expiry, option_type)
+            if bars is not None:
+                return self._format_minute_bars(bars)
+
         if not self.has_minute_data:
             return pd.DataFrame()
 
@@ -472,80 +827,64 @@ class PolygonOptionsLoader:
         if all_minute_bars.empty:
             return pd.DataFrame()
 
-        # Filter to this specific option
+        # Filter to this specific option (row positions into the cached day)
         mask = (
             (all_minute_bars['strike'] == strike) &
             (all_minute_bars['expiry'] == expiry) &
             (all_minute_bars['option_type'] == option_type.lower())
         )
+        rows = np.flatnonzero(mask.to_numpy())
 
-        option_bars = all_minute_bars[mask].copy()
-
-        if option_bars.empty:
+        if len(rows) == 0:
             return pd.DataFrame()
 
-        # Convert window_start (nanoseconds) to datetime
-        option_bars['timestamp'] = pd.to_datetime(option_bars['window_start'], unit='ns')
+        # Gather only the needed columns
+        return self._format_minute_bars(pd.DataFrame({
+            col: all_minute_bars[col].to_numpy()[rows]
+            for col in ['window_start', 'open', 'high', 'low', 'close', 'volume']
+        }))
 
-        # Select and order columns
-        result = option_bars[['timestamp', 'open', 'high', 'low', 'close', 'volume']].copy()
-        result = result.sort_values('timestamp').reset_index(drop=True)
+    @staticmethod
+    def _format_minute_bars(bars: pd.DataFrame) -> pd.DataFrame:
+        """window_start (nanoseconds) -> timestamp; columns ordered, sorted by time."""
+        if bars.empty:
+            return pd.DataFrame()
 
-        return result
+        result = pd.DataFrame({
+            'timestamp': pd.to_datetime(bars['window_start'].to_numpy(), unit='ns'),
+            **{col: bars[col].to_numpy() for col in ['open', 'high', 'low', 'close', 'volume']}
+        })
+        return result.sort_values('timestamp').reset_index(drop=True)
 
     def _load_minute_bars_raw(self, trade_date: date) -> pd.DataFrame:
         """
         Load raw minute bars for all options on a specific date.
 
         Returns DataFrame with parsed option info + OHLC minute data.
-        Cached to avoid repeated disk reads.
+        Cached in the shared chain cache to avoid repeated disk reads
+        (shared and read-only - do not mutate).
         """
-        # Check cache
-        if trade_date in self._minute_cache:
-            return self._minute_cache[trade_date].copy()
-
-        year = trade_date.year
-        month = f"{trade_date.month:02d}"
-        day = f"{trade_date.day:02d}"
-
-        file_path = self.minute_data_root / str(year) / month / f"{year}-{month}-{day}.csv.gz"
-
-        if not file_path.exists():
-            self._minute_cache[trade_date] = pd.DataFrame()
-            return pd.DataFrame()
-
-        # Read compressed CSV
-        try:
-            with gzip.open(file_path, 'rt') as f:
-                df = pd.read_csv(f)
-        except Exception as e:
-            print(f"Error loading {file_path}: {e}")
-            self._minute_cache[trade_date] = pd.DataFrame()
-            return pd.DataFrame()
-
-        # Parse tickers
-        parsed = df['ticker'].apply(self._parse_option_ticker)
-
-        # Filter valid parsed tickers (SPY options only)
-        valid_mask = parsed.notna()
-
-        if not valid_mask.any():
-            self._minute_cache[trade_date] = pd.DataFrame()
-            return pd.DataFrame()
+        cache_key = self._cache_key('minute_aggs', trade_date)
+        return self.chain_cache.get_or_load(
+            cache_key, lambda: self._read_minute_bars_day(trade_date)
+        )
 
-        parsed_series = parsed[valid_mask].reset_index(drop=True)
-        df = df[valid_mask].reset_index(drop=True)
+    def _read_minute_bars_day(self, trade_date: date) -> pd.DataFrame:
+        """Read one day of minute aggregates from the minute store, falling back to raw CSV.gz (uncached)."""
+        if self.minute_store.available:
+            df = self.minute_store.read_day(trade_date)
+            if df is not None:
+                return df
 
-        # Convert parsed dicts to DataFrame
-        parsed_df = pd.DataFrame(parsed_series.tolist())
+        return self.read_raw_minute_bars_day(trade_date)
 
-        # Merge with price data
-        result = pd.concat([df, parsed_df], axis=1)
-        result['date'] = trade_date
+    def read_raw_minute_bars_day(self, trade_date: date) -> pd.DataFrame:
+        """Parse one day of minute aggregates straight from the Polygon CSV.gz (bypasses the minute store)."""
+        return self.read_raw_minute_bars_multi(trade_date, [self.underlying])[self.underlying]
 
-        # Cache and return
-        self._minute_cache[trade_date] = result
-        return result.copy()
+    def read_raw_minute_bars_multi(self, trade_date: date, underlyings: Iterable[str]) -> Dict[str, pd.DataFrame]:
+        """Parse several underlyings from one read of a day's minute CSV.gz (underlying -> bars)."""
+        return self._read_raw_file(self.minute_manifest.path_for(trade_date), trade_date, underlyings)
 
     def resample_to_15min(self, minute_bars: pd.DataFrame) -> pd.DataFrame:
         """
@@ -582,6 +921,17 @@ class PolygonOptionsLoader:
         return resampled
 
     def clear_cache(self):
-        """Clear the date cache."""
-        self._date_cache.clear()
-        self._minute_cache.clear()
+        """Clear the date cache (including this loader's entries in the shared cache)."""
+        self._overlay_cache.clear()
+        roots = {str(self.data_root), str(self.minute_data_root)}
+        self.chain_cache.discard(
+            lambda key: isinstance(key, tuple) and len(key) > 3 and key[1] in roots and key[3] == self.underlying
+        )
+
+    def cache_stats(self) -> Dict[str, float]:
+        """
+        Hit/miss/eviction counters and footprint of the shared chain cache:
+        resident_bytes are private to this process, shared_bytes are chain
+        arena pages mapped by every process that reads the day.
+        """
+        return self.chain_cache.stats()
@@ -0,0 +1,118 @@
+"""
+Background prefetch of upcoming trading days.
+
+A simulation walks trading days in order and blocks on gzip/CSV (or Parquet)
+decode whenever it reaches a day that is not in the chain cache. The
+prefetcher loads the next `depth` days into the shared chain cache on a
+thread pool while the current day is processed. zlib and the Parquet/CSV
+readers release the GIL, so the decode overlaps with simulation work.
+
+It also times how long the simulation waited on data versus how long it
+spent computing between days, which is what you need to size `depth` for a
+given storage device.
+"""
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date
+from typing import Dict, List, Optional, Sequence
+
+
+class ChainPrefetcher:
+    """
+    Look-ahead loader for an ordered sequence of trading days.
+
+    Usage:
+        with ChainPrefetcher(loader, dates, depth=4) as prefetcher:
+            for i, trade_date in enumerate(dates):
+                prefetcher.advance(i)   # blocks only if day i is still loading
+                ...                     # simulate day i
+        prefetcher.stats()
+
+    `loader` needs a prefetch_day(trade_date) method that loads a day into its
+    cache (PolygonOptionsLoader provides one).
+    """
+
+    def __init__(self, loader, dates: Sequence[date], depth: int = 4, max_workers: Optional[int] = None,
+                 start: int = 0):
+        if depth < 1:
+            raise ValueError(f"Prefetch depth must be >= 1, got {depth}")
+
+        self.loader = loader
+        self.dates: List[date] = list(dates)
+        self.depth = depth
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or depth, thread_name_prefix='chain-prefetch'
+        )
+        self._futures: Dict[int, Future] = {}
+        self._next_to_schedule = start  # Days before `start` are never loaded (resumed runs)
+
+        self.blocked_seconds = 0.0
+        self.compute_seconds = 0.0
+        self.days_prefetched = 0
+        self.days_ready = 0  # days already loaded when the simulation reached them
+        self.errors = 0
+        self._last_return: Optional[float] = None
+
+    def _schedule_through(self, last: int):
+        last = min(last, len(self.dates) - 1)
+        while self._next_to_schedule <= last:
+            i = self._next_to_schedule
+            self._futures[i] = self._executor.submit(self.loader.prefetch_day, self.dates[i])
+            self._next_to_schedule += 1
+
+    def advance(self, i: int):
+        """
+        Wait for day i to be loaded and keep the next `depth` days in flight.
+
+        Load errors are not raised here - the simulation's own lookup for that
+        day hits the same error path it would without prefetching.
+        """
+        now = time.perf_counter()
+        if self._last_return is not None:
+            self.compute_seconds += now - self._last_return
+
+        self._schedule_through(i + self.depth)
+
+        future = self._futures.pop(i, None)
+        if future is not None:
+            if future.done():
+                self.days_ready += 1
+            try:
+                future.result()
+                self.days_prefetched += 1
+            except Exception:
+                self.errors += 1
+
+        # Drop futures for days that were skipped
+        for stale in [k for k in self._futures if k < i]:
+            self._futures.pop(stale).cancel()
+
+        self._last_return = time.perf_counter()
+        self.blocked_seconds += self._last_return - now
+
+    def close(self):
+        """Cancel outstanding loads and stop the worker threads."""
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> 'ChainPrefetcher':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def stats(self) -> Dict[str, float]:
+        """Look-ahead depth, blocked-on-I/O vs compute time, and day counters."""
+        total = self.blocked_seconds + self.compute_seconds
+        return {
+            'depth': self.depth,
+            'days_prefetched': self.days_prefetched,
+            'days_ready': self.days_ready,
+            'errors': self.errors,
+            'blocked_seconds': self.blocked_seconds,
+            'compute_seconds': self.compute_seconds,
+            'blocked_fraction': self.blocked_seconds / total if total else 0.0
+        }
@@ -0,0 +1,94 @@
+"""
+Incrementally maintained data spine.
+
+DataSpine.get_day_data used to rebuild a 100-calendar-day spine (SPY load,
+VIX merge, all derived features) for every date it was asked about. The
+rolling spine is built once over the whole coverage and extended by
+appending new days; only the trailing feature windows are recomputed
+(features.extend_derived_features). Day lookups are a dict hit plus one row.
+"""
+
+import sys
+import pandas as pd
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional
+
+from .features import extend_derived_features
+
+
+class RollingSpine:
+    """SPY OHLCV + VIX + derived features, one row per trading day, append-only."""
+
+    def __init__(self, loader, include_vix: bool = True):
+        """
+        Args:
+            loader: OptionsDataLoader (SPY bars, VIX, coverage)
+            include_vix: Merge vix_close when the local VIX store has it
+        """
+        self.loader = loader
+        self.include_vix = include_vix
+        self.frame = pd.DataFrame()
+        self._positions: Dict[date, int] = {}
+
+    @property
+    def last_date(self) -> Optional[date]:
+        return self.frame['date'].iloc[-1] if not self.frame.empty else None
+
+    def coverage_end(self) -> date:
+        """Last day both SPY bars and option chains are available."""
+        end = self.loader.get_spy_stock_coverage()['end']
+        option_end = self.loader.get_data_coverage()['end']
+        if option_end:
+            end = min(end, date.fromisoformat(option_end))
+        return end
+
+    def _load_rows(self, start: date, end: date) -> pd.DataFrame:
+        start_dt = datetime.combine(start, datetime.min.time())
+        end_dt = datetime.combine(end, datetime.min.time())
+        try:
+            rows = self.loader.load_spy_ohlcv(start_dt, end_dt)
+        except ValueError:
+            return pd.DataFrame()
+
+        if self.include_vix:
+            try:
+                vix_df = self.loader.load_vix(start_dt, end_dt, allow_download=False)
+                rows = rows.merge(vix_df, on='date', how='left')
+            except Exception as e:
+                # VIX optional - warn but don't fail
+                print(f"Warning: Could not load VIX data: {e}", file=sys.stderr)
+
+        return rows
+
+    def extend(self, end: Optional[date] = None) -> int:
+        """
+        Append trading days after the current last row through `end`
+        (default: end of coverage).
+
+        Returns:
+            Number of rows appended
+        """
+        limit = self.coverage_end()
+        end = min(end, limit) if end is not None else limit
+
+        if self.frame.empty:
+            start = self.loader.get_spy_stock_coverage()['start']
+        else:
+            start = self.last_date + timedelta(days=1)
+        if end < start:
+            return 0
+
+        rows = self._load_rows(start, end)
+        if rows.empty:
+            return 0
+
+        first_new = len(self.frame)
+        self.frame = extend_derived_features(self.frame, rows)
+        for i, day in enumerate(self.frame['date'].iloc[first_new:], first_new):
+            self._positions[day] = i
+        return len(self.frame) - first_new
+
+    def row(self, trade_date: date) -> Optional[pd.Series]:
+        """Featured row for a trading day, or None if it is not in the spine."""
+        i = self._positions.get(trade_date)
+        return self.frame.iloc[i] if i is not None else None
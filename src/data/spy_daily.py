@@ -0,0 +1,165 @@
+"""
+Consolidated daily SPY bars derived from the per-day minute parquets.
+
+The SPY stock data is exported as one minute-bar parquet per trading day:
+
+    <stock_root>/<YYYY-MM-DD>.parquet
+
+Building daily OHLCV used to open and reduce every one of those files on each
+run. This module maintains a single daily-bar table next to the other derived
+stores and refreshes it incrementally: each source file's size and mtime are
+recorded, and only new or changed files are re-read. Source sizes/mtimes come
+from the stock root's coverage manifest (src/data/manifest.py), so loading
+years of daily SPY is one Parquet read plus a directory stat.
+"""
+
+import os
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from .manifest import DataManifest, get_manifest
+
+
+DEFAULT_SPY_DAILY_PATH = "/Volumes/VelocityData/rotation_engine/spy_daily/SPY_daily.parquet"
+
+DAILY_BAR_COLUMNS = ['date', 'open', 'high', 'low', 'close', 'volume']
+
+# Source bookkeeping stored alongside each bar
+SOURCE_COLUMNS = ['source_file', 'source_size', 'source_mtime_ns']
+
+
+def reduce_minute_file(path: Path, trade_day: date) -> Optional[Dict]:
+    """Daily OHLCV from one day's minute parquet (None if the file is empty)."""
+    df = pd.read_parquet(path, columns=['ts', 'open', 'high', 'low', 'close', 'volume'])
+    if df.empty:
+        return None
+
+    df = df.sort_values('ts')
+    return {
+        'date': trade_day,
+        'open': float(df['open'].iloc[0]),
+        'high': float(df['high'].max()),
+        'low': float(df['low'].min()),
+        'close': float(df['close'].iloc[-1]),
+        'volume': float(df['volume'].sum())
+    }
+
+
+class SpyDailyBars:
+    """Daily SPY bar table, kept in sync with the minute parquets it is built from."""
+
+    def __init__(
+        self,
+        stock_root: str,
+        table_path: Optional[str] = None,
+        manifest: Optional[DataManifest] = None
+    ):
+        self.stock_root = Path(stock_root).expanduser()
+        resolved_path = table_path or os.environ.get("SPY_DAILY_BARS_PATH", DEFAULT_SPY_DAILY_PATH)
+        self.table_path = Path(resolved_path).expanduser()
+        self.manifest = manifest or get_manifest(self.stock_root, suffix='.parquet', nested=False)
+        self._table: Optional[pd.DataFrame] = None
+
+    def scan_sources(self, full: bool = False) -> Dict[date, Tuple[int, int]]:
+        """(size, mtime_ns) of every per-day minute parquet, via the coverage manifest."""
+        self.manifest.refresh(full=full)
+        return self.manifest.signatures()
+
+    def _read_table(self) -> pd.DataFrame:
+        if self.table_path.exists():
+            try:
+                return pd.read_parquet(self.table_path)
+            except Exception as e:
+                print(f"Error loading {self.table_path}: {e} (rebuilding)")
+        return pd.DataFrame(columns=DAILY_BAR_COLUMNS + SOURCE_COLUMNS)
+
+    def refresh(self, force: bool = False) -> Dict[str, int]:
+        """
+        Bring the table up to date with the minute parquets.
+
+        New files are reduced and appended, files whose size or mtime changed
+        are re-read, and days whose file disappeared are dropped. The table is
+        only rewritten when something changed. Files rewritten in place
+        (without a new directory entry) are picked up with force=True.
+
+        Returns:
+            Counts of added/updated/removed/unchanged days
+        """
+        table = self._read_table() if not force else pd.DataFrame(columns=DAILY_BAR_COLUMNS + SOURCE_COLUMNS)
+        sources = self.scan_sources(full=force)
+
+        recorded = {}
+        if not table.empty:
+            recorded = dict(zip(
+                table['date'],
+                zip(table['source_size'].astype(np.int64), table['source_mtime_ns'].astype(np.int64))
+            ))
+
+        counts = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
+        new_rows = []
+        stale = set(recorded) - set(sources)
+        counts['removed'] = len(stale)
+
+        for trade_day, signature in sorted(sources.items()):
+            previous = recorded.get(trade_day)
+            if previous == signature:
+                counts['unchanged'] += 1
+                continue
+
+            counts['added' if previous is None else 'updated'] += 1
+            if previous is not None:
+                stale.add(trade_day)
+
+            name = f"{trade_day.isoformat()}.parquet"
+            bar = reduce_minute_file(self.stock_root / name, trade_day)
+            if bar is None:
+                # Empty file: remember it so it is not re-read until it changes
+                bar = {'date': trade_day, **{col: np.nan for col in DAILY_BAR_COLUMNS[1:]}}
+            bar.update({'source_file': name, 'source_size': signature[0], 'source_mtime_ns': signature[1]})
+            new_rows.append(bar)
+
+        changed = bool(new_rows or stale)
+        if changed:
+            if stale:
+                table = table[~table['date'].isin(stale)]
+            if new_rows:
+                additions = pd.DataFrame(new_rows, columns=DAILY_BAR_COLUMNS + SOURCE_COLUMNS)
+                table = additions if table.empty else pd.concat([table, additions], ignore_index=True)
+            table = table.sort_values('date').reset_index(drop=True)
+            self._write_table(table)
+
+        self._table = table
+        return counts
+
+    def _write_table(self, table: pd.DataFrame):
+        """Write atomically; a read-only location just keeps the table in memory."""
+        try:
+            self.table_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.table_path.with_name(self.table_path.name + '.tmp')
+            table.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, self.table_path)
+        except OSError as e:
+            print(f"Warning: could not write SPY daily bars to {self.table_path}: {e}")
+
+    def dates(self) -> List[date]:
+        """All trading days with a source file (including empty ones), sorted."""
+        if self._table is None:
+            self._table = self._read_table()
+        return sorted(self._table['date'])
+
+    def load(self, refresh: bool = True) -> pd.DataFrame:
+        """
+        Daily bars (date, open, high, low, close, volume) sorted by date.
+
+        Days whose minute file was empty are omitted.
+        """
+        if refresh:
+            self.refresh()
+        elif self._table is None:
+            self._table = self._read_table()
+
+        bars = self._table.dropna(subset=['close'])
+        return bars[DAILY_BAR_COLUMNS].reset_index(drop=True)
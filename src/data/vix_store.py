@@ -0,0 +1,143 @@
+"""
+Offline VIX-family time-series store.
+
+load_vix used to download ^VIX from yfinance on every cold cache, which
+blocks (or fails) on machines without outbound network. This store keeps the
+daily closes locally as one Parquet table:
+
+    date, vix_close, vix9d_close, vix3m_close, vvix_close
+
+Only vix_close is required; the other series are imported when available.
+Populate it once with scripts/import_vix.py (from yfinance where the network
+is reachable, or from CBOE history CSVs) and refresh it the same way.
+"""
+
+import os
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from datetime import date
+from typing import Dict, List, Optional
+
+
+DEFAULT_VIX_STORE_PATH = "/Volumes/VelocityData/rotation_engine/vix/vix_daily.parquet"
+
+# Store column -> Yahoo ticker
+VIX_SERIES: Dict[str, str] = {
+    'vix_close': '^VIX',
+    'vix9d_close': '^VIX9D',
+    'vix3m_close': '^VIX3M',
+    'vvix_close': '^VVIX',
+}
+
+
+def merge_series(base: Optional[pd.DataFrame], new: pd.DataFrame) -> pd.DataFrame:
+    """
+    Union two date-keyed frames. New non-NaN values win; columns missing
+    from either side are kept.
+    """
+    if base is None or base.empty:
+        return new.sort_values('date').reset_index(drop=True)
+    if new.empty:
+        return base
+
+    merged = base.set_index('date')
+    update = new.set_index('date')
+    merged = update.combine_first(merged)
+    return merged.reset_index().sort_values('date').reset_index(drop=True)
+
+
+def download_series(column: str, start: date, end: date) -> pd.DataFrame:
+    """
+    Download one series' daily closes from yfinance (imported lazily so the
+    rest of the data layer never needs it).
+
+    Returns DataFrame with: date, <column>
+    """
+    import yfinance as yf
+
+    history = yf.Ticker(VIX_SERIES[column]).history(
+        start=start.strftime('%Y-%m-%d'),
+        end=end.strftime('%Y-%m-%d')
+    )
+    if history.empty:
+        return pd.DataFrame(columns=['date', column])
+
+    history = history.reset_index()
+    return pd.DataFrame({
+        'date': pd.to_datetime(history['Date']).dt.date,
+        column: history['Close'].to_numpy(dtype=float)
+    })
+
+
+def read_cboe_csv(path: str, column: str = 'vix_close') -> pd.DataFrame:
+    """
+    Parse a CBOE history CSV (DATE, OPEN, HIGH, LOW, CLOSE or DATE, <SERIES>).
+
+    Returns DataFrame with: date, <column>
+    """
+    df = pd.read_csv(path)
+    df.columns = [c.strip().upper() for c in df.columns]
+    value_col = 'CLOSE' if 'CLOSE' in df.columns else df.columns[-1]
+    return pd.DataFrame({
+        'date': pd.to_datetime(df['DATE']).dt.date,
+        column: pd.to_numeric(df[value_col], errors='coerce').to_numpy(dtype=float)
+    }).dropna()
+
+
+class VixStore:
+    """Local daily VIX / VIX9D / VIX3M / VVIX closes."""
+
+    def __init__(self, path: Optional[str] = None):
+        resolved_path = path or os.environ.get("VIX_STORE_PATH", DEFAULT_VIX_STORE_PATH)
+        self.path = Path(resolved_path).expanduser()
+        self._table: Optional[pd.DataFrame] = None
+
+    @property
+    def available(self) -> bool:
+        """True when the store file exists."""
+        return self.path.exists()
+
+    def load(self) -> pd.DataFrame:
+        """Whole table sorted by date (empty frame if the store is missing)."""
+        if self._table is None:
+            if self.available:
+                table = pd.read_parquet(self.path)
+                table['date'] = pd.to_datetime(table['date']).dt.date
+                self._table = table.sort_values('date').reset_index(drop=True)
+            else:
+                self._table = pd.DataFrame(columns=['date', 'vix_close'])
+        return self._table
+
+    def coverage(self, column: str = 'vix_close') -> Optional[tuple]:
+        """(first, last) date with a value for `column`, or None."""
+        table = self.load()
+        if column not in table.columns:
+            return None
+        dates = table.loc[table[column].notna(), 'date']
+        if dates.empty:
+            return None
+        return dates.iloc[0], dates.iloc[-1]
+
+    def read(self, start: date, end: date, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Rows in [start, end] with date + `columns` (default vix_close)."""
+        columns = columns or ['vix_close']
+        table = self.load()
+        out = table.loc[(table['date'] >= start) & (table['date'] <= end)]
+        out = out.reindex(columns=['date'] + columns)
+        return out.dropna(subset=columns, how='all').reset_index(drop=True)
+
+    def upsert(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Merge rows into the store and write it atomically."""
+        table = merge_series(self.load() if self.available else None, df)
+        for column in table.columns:
+            if column != 'date':
+                table[column] = table[column].astype(np.float64)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        table.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, self.path)
+
+        self._table = table
+        return table
@@ -10,7 +10,8 @@ from .greeks import (
     calculate_gamma,
     calculate_vega,
     calculate_theta,
-    calculate_all_greeks
+    calculate_all_greeks,
+    calculate_greeks_array
 )
 
 __all__ = [
@@ -18,5 +19,6 @@ __all__ = [
     'calculate_gamma',
     'calculate_vega',
     'calculate_theta',
-    'calculate_all_greeks'
+    'calculate_all_greeks',
+    'calculate_greeks_array'
 ]
@@ -399,3 +399,66 @@ def calculate_all_greeks(
         'charm': calculate_charm(S, K, T, r, sigma, option_type),
         'vanna': calculate_vanna(S, K, T, r, sigma)
     }
+
+
+def calculate_greeks_array(
+    S: float,
+    K: np.ndarray,
+    T: np.ndarray,
+    r: float,
+    sigma: float,
+    is_call: np.ndarray
+) -> dict:
+    """
+    Vectorized delta, gamma, vega and theta over arrays of options.
+
+    Same formulas (and the same expiry conventions) as calculate_delta /
+    calculate_gamma / calculate_vega / calculate_theta, evaluated for every
+    option in one pass.
+
+    Parameters:
+    -----------
+    S : float
+        Current underlying price
+    K : np.ndarray
+        Strike prices
+    T : np.ndarray
+        Times to expiration in years
+    r : float
+        Risk-free interest rate (annualized)
+    sigma : float
+        Implied volatility (annualized)
+    is_call : np.ndarray
+        True for calls, False for puts
+
+    Returns:
+    --------
+    dict
+        Arrays keyed 'delta', 'gamma', 'vega', 'theta'
+    """
+    K = np.asarray(K, dtype=float)
+    T = np.asarray(T, dtype=float)
+    is_call = np.asarray(is_call, dtype=bool)
+
+    live = T > 0
+    # Placeholder T for expired options keeps the math finite; masked below
+    T_live = np.where(live, T, 1.0)
+    sqrt_T = np.sqrt(T_live)
+
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T_live) / (sigma * sqrt_T)
+    d2 = d1 - sigma * sqrt_T
+    pdf_d1 = norm.pdf(d1)
+    cdf_d1 = norm.cdf(d1)
+
+    expired_delta = np.where(is_call, (S > K).astype(float), -(S < K).astype(float))
+    delta = np.where(live, np.where(is_call, cdf_d1, cdf_d1 - 1.0), expired_delta)
+
+    gamma = np.where(live, pdf_d1 / (S * sigma * sqrt_T), 0.0)
+    vega = np.where(live, S * pdf_d1 * sqrt_T * 0.01, 0.0)
+
+    common_term = -(S * pdf_d1 * sigma) / (2 * sqrt_T)
+    discount = r * K * np.exp(-r * T_live)
+    theta = np.where(is_call, common_term - discount * norm.cdf(d2), common_term + discount * norm.cdf(-d2))
+    theta = np.where(live, theta, 0.0)
+
+    return {'delta': delta, 'gamma': gamma, 'vega': vega, 'theta': theta}
@@ -0,0 +1,161 @@
+"""
+Checkpoint / resume for long simulations.
+
+A full multi-year run on real chains takes long enough that a crash near the
+end used to mean starting over. With checkpointing enabled, TradeSimulator
+writes its loop state every N simulated days:
+
+    <checkpoint_dir>/<profile>_<mode>_<fingerprint>.ckpt
+
+The state is the next day index, open trade(s), equity accumulators, the
+pending entry flag, results so far, closed trades, counters/stats, and the
+global RNG states (random and numpy) in case callbacks draw from them. It is
+written atomically (temp file + rename) as a pickle.
+
+The fingerprint hashes the market data (values, index, columns and dtypes),
+the simulation config, the pricing source and a caller-supplied checkpoint
+key describing the callbacks' parameters (RotationEngine passes each
+profile's config). A run with the same fingerprint resumes after the last
+saved day. It produces the same results as an uninterrupted run, because the
+simulator's day loop is deterministic given that state. Callbacks themselves
+cannot be hashed: they must be stateless (the profile callbacks are), and
+anything that changes their behaviour belongs in the key. Runs with different
+fingerprints (e.g. a parameter sweep) can share one checkpoint directory:
+each only reads and removes its own file, on completion.
+
+Enable via SimulationConfig(checkpoint_dir=..., checkpoint_every=...) or the
+SIMULATION_CHECKPOINT_DIR / SIMULATION_CHECKPOINT_EVERY /
+SIMULATION_CHECKPOINT_KEY environment variables (how RotationEngine threads it
+into the profile backtests).
+"""
+
+import hashlib
+import os
+import pickle
+import random
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# Days between checkpoints when checkpointing is enabled
+DEFAULT_CHECKPOINT_EVERY = 20
+
+CHECKPOINT_VERSION = 1
+
+
+def checkpoint_dir_default() -> Optional[str]:
+    return os.environ.get("SIMULATION_CHECKPOINT_DIR") or None
+
+
+def checkpoint_every_default() -> int:
+    return int(os.environ.get("SIMULATION_CHECKPOINT_EVERY", DEFAULT_CHECKPOINT_EVERY))
+
+
+def checkpoint_key_default() -> Optional[str]:
+    return os.environ.get("SIMULATION_CHECKPOINT_KEY") or None
+
+
+@contextmanager
+def checkpoint_env(checkpoint_dir: Optional[str], every: Optional[int] = None, key: Any = None):
+    """
+    Enable checkpointing for simulators created inside the block (including
+    ones built by profile runners and in forked worker processes). `key`
+    (its repr) becomes the simulators' default checkpoint key.
+    """
+    overrides = {"SIMULATION_CHECKPOINT_DIR": checkpoint_dir}
+    if every is not None:
+        overrides["SIMULATION_CHECKPOINT_EVERY"] = str(every)
+    if key is not None:
+        overrides["SIMULATION_CHECKPOINT_KEY"] = repr(key)
+
+    saved = {key: os.environ.get(key) for key in overrides}
+    try:
+        for key, value in overrides.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def data_fingerprint(data: pd.DataFrame) -> str:
+    """Stable hash of a DataFrame's values, index, columns and dtypes."""
+    digest = hashlib.sha256()
+    digest.update(repr([(str(col), str(dtype)) for col, dtype in data.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def fingerprint(*parts: Any) -> str:
+    """Hash of data fingerprints / reprs identifying one run."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(repr(part).encode())
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def capture_rng_state() -> Dict[str, Any]:
+    return {'random': random.getstate(), 'numpy': np.random.get_state()}
+
+
+def restore_rng_state(state: Dict[str, Any]):
+    random.setstate(state['random'])
+    np.random.set_state(state['numpy'])
+
+
+class SimulationCheckpoint:
+    """One run's checkpoint file: saved every `every` days, cleared on completion."""
+
+    def __init__(self, checkpoint_dir: str, name: str, run_fingerprint: str, every: int):
+        self.path = Path(checkpoint_dir).expanduser() / f"{name}_{run_fingerprint[:16]}.ckpt"
+        self.fingerprint = run_fingerprint
+        self.every = max(int(every), 1)
+
+    def due(self, idx: int) -> bool:
+        """True after every `every`-th day (idx is the day just finished)."""
+        return (idx + 1) % self.every == 0
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Saved state for this run, or None (missing, unreadable or a different run)."""
+        if not self.path.exists():
+            return None
+        try:
+            with open(self.path, 'rb') as f:
+                payload = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+            print(f"Warning: ignoring unreadable checkpoint {self.path}: {e}")
+            return None
+
+        if payload.get('version') != CHECKPOINT_VERSION or payload.get('fingerprint') != self.fingerprint:
+            return None
+
+        restore_rng_state(payload['rng'])
+        return payload['state']
+
+    def save(self, state: Dict[str, Any]):
+        """Write state atomically (temp file + rename)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            'version': CHECKPOINT_VERSION,
+            'fingerprint': self.fingerprint,
+            'rng': capture_rng_state(),
+            'state': state,
+        }
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        self.path.unlink(missing_ok=True)
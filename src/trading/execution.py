@@ -124,6 +124,40 @@ class ExecutionModel:
         #   OTM 15%, VIX 20: $0.30 * 1.75 * 1.0 * 1.25 = $0.66 (moneyness scaling works!)
         return spread
 
+    def get_spread_array(
+        self,
+        mid_price,
+        moneyness,
+        dte,
+        vix_level=20.0,
+        is_strangle: bool = False
+    ) -> np.ndarray:
+        """
+        Vectorized get_spread over arrays of contracts (e.g. a whole chain).
+
+        Parameters broadcast like numpy arrays; vix_level may be a scalar.
+        Matches get_spread element-wise (same operations, same order).
+
+        Returns:
+        --------
+        spread : np.ndarray
+            Bid-ask spread in dollars per contract
+        """
+        mid_price = np.asarray(mid_price, dtype=float)
+        moneyness = np.asarray(moneyness, dtype=float)
+        dte = np.asarray(dte)
+        vix_level = np.asarray(vix_level, dtype=float)
+
+        base = self.base_spread_otm if is_strangle else self.base_spread_atm
+
+        moneyness_factor = 1.0 + moneyness * 5.0
+        dte_factor = np.where(dte < 7, 1.3, np.where(dte < 14, 1.15, 1.0))
+        vol_factor = 1.0 + np.maximum(0, (vix_level - 15.0) / 20.0)
+        vol_factor = np.minimum(3.0, vol_factor)
+
+        spread = base * moneyness_factor * dte_factor * vol_factor
+        return np.broadcast_to(spread, np.broadcast(mid_price, spread).shape).astype(float)
+
     def get_execution_price(
         self,
         mid_price: float,
@@ -184,6 +218,43 @@ class ExecutionModel:
         else:
             raise ValueError(f"Invalid side: {side}. Must be 'buy' or 'sell'")
 
+    def get_execution_price_array(
+        self,
+        mid_price,
+        side,  # 'buy'/'sell' (scalar or array)
+        moneyness,
+        dte,
+        vix_level=20.0,
+        is_strangle: bool = False,
+        quantity=1
+    ) -> np.ndarray:
+        """
+        Vectorized get_execution_price (mid ± half spread ± size-based slippage).
+
+        Returns:
+        --------
+        exec_price : np.ndarray
+            Execution price per contract
+        """
+        mid_price = np.asarray(mid_price, dtype=float)
+        side = np.asarray(side)
+        if not np.isin(side, ['buy', 'sell']).all():
+            raise ValueError(f"Invalid side in {np.unique(side)}. Must be 'buy' or 'sell'")
+
+        spread = self.get_spread_array(mid_price, moneyness, dte, vix_level, is_strangle)
+        half_spread = spread / 2.0
+
+        abs_qty = np.abs(np.asarray(quantity))
+        slippage_pct = np.where(
+            abs_qty <= 10, self.slippage_small,
+            np.where(abs_qty <= 50, self.slippage_medium, self.slippage_large)
+        )
+        slippage = half_spread * slippage_pct
+
+        buy_price = mid_price + half_spread + slippage
+        sell_price = np.maximum(0.01, mid_price - half_spread - slippage)
+        return np.where(side == 'buy', buy_price, sell_price)
+
     def get_delta_hedge_cost(self, contracts: float, es_mid_price: float = 4500.0) -> float:
         """
         Calculate cost of delta hedging with ES futures.
@@ -224,6 +295,24 @@ class ExecutionModel:
 
         return actual_contracts * cost_per_contract * impact_multiplier
 
+    def get_delta_hedge_cost_array(self, contracts) -> np.ndarray:
+        """
+        Vectorized get_delta_hedge_cost over arrays of hedge sizes.
+
+        Returns:
+        --------
+        cost : np.ndarray
+            Hedging cost per order (0 where |contracts| < 0.5)
+        """
+        contracts = np.asarray(contracts, dtype=float)
+        actual_contracts = np.abs(np.round(contracts))
+
+        cost_per_contract = self.es_commission + self.es_spread / 2.0
+        impact_multiplier = np.where(actual_contracts > 10, 1.1, 1.0)
+
+        cost = actual_contracts * cost_per_contract * impact_multiplier
+        return np.where(np.abs(contracts) < 0.5, 0.0, cost)
+
     def apply_spread_to_price(
         self,
         mid_price: float,
@@ -261,6 +350,28 @@ class ExecutionModel:
             mid_price, side, moneyness, dte, vix_level, is_strangle
         )
 
+    def apply_spread_to_price_array(
+        self,
+        mid_price,
+        quantity,  # Positive = long, negative = short (array)
+        moneyness,
+        dte,
+        vix_level=20.0,
+        is_strangle: bool = False
+    ) -> np.ndarray:
+        """
+        Vectorized apply_spread_to_price: side from the sign of each quantity.
+
+        Returns:
+        --------
+        exec_price : np.ndarray
+            Execution price per contract
+        """
+        side = np.where(np.asarray(quantity) > 0, 'buy', 'sell')
+        return self.get_execution_price_array(
+            mid_price, side, moneyness, dte, vix_level, is_strangle
+        )
+
     def get_commission_cost(self, num_contracts: int, is_short: bool = False, premium: float = 0.0) -> float:
         """
         Calculate total commission and fees for options trade.
@@ -300,6 +411,30 @@ class ExecutionModel:
 
         return commission + sec_fees + occ_fees + finra_fees
 
+    def get_commission_cost_array(self, num_contracts, is_short=False, premium=0.0) -> np.ndarray:
+        """
+        Vectorized get_commission_cost over arrays of orders.
+
+        Returns:
+        --------
+        total_cost : np.ndarray
+            Commission + fees per order (always positive)
+        """
+        num_contracts = np.abs(np.asarray(num_contracts, dtype=float))
+        is_short = np.asarray(is_short, dtype=bool)
+        premium = np.asarray(premium, dtype=float)
+
+        commission = num_contracts * self.option_commission
+
+        principal = num_contracts * 100 * premium
+        sec_fees = np.where(is_short & (premium > 0), principal * (0.00182 / 1000.0), 0.0)
+
+        occ_fees = num_contracts * 0.055
+
+        finra_fees = np.where(is_short, num_contracts * 0.00205, 0.0)
+
+        return commission + sec_fees + occ_fees + finra_fees
+
 
 def calculate_moneyness(strike: float, spot: float) -> float:
     """Calculate moneyness as abs(strike - spot) / spot."""
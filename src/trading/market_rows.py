@@ -0,0 +1,95 @@
+"""
+Lightweight per-day row views for the simulation loop.
+
+TradeSimulator.simulate used to walk the market data with DataFrame.iterrows(),
+which builds a full pandas Series (index, dtype inference, name) for every day
+before the callbacks ever look at it. MarketRows extracts the frame's values
+once - the same object matrix iterrows reads from, so every value is the
+identical Python/numpy scalar - and hands out MarketRow views that index into
+it.
+
+MarketRow supports what profile callbacks use on a row Series: row['col'],
+row.get('col', default), attribute access (row.close), `in`, len() and
+iteration. Anything else (row.index, row.to_dict(), arithmetic, ...) falls
+through to a real Series built on first use, so older callbacks keep working
+unchanged.
+"""
+
+from typing import Any, Dict, Hashable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class MarketRow:
+    """Read-only view of one day of market data (a drop-in for the iterrows Series)."""
+
+    __slots__ = ('_values', '_positions', '_columns', 'name', '_series')
+
+    def __init__(self, values: np.ndarray, positions: Dict[Hashable, int], columns: List[Hashable], name: Hashable):
+        self._values = values
+        self._positions = positions
+        self._columns = columns
+        self.name = name
+        self._series: Optional[pd.Series] = None
+
+    def __getitem__(self, key):
+        try:
+            return self._values[self._positions[key]]
+        except (KeyError, TypeError):
+            # Lists, slices, positional access: use the Series semantics
+            return self.to_series()[key]
+
+    def get(self, key, default=None) -> Any:
+        pos = self._positions.get(key)
+        return default if pos is None else self._values[pos]
+
+    def __getattr__(self, attr: str):
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        pos = self._positions.get(attr)
+        if pos is not None:
+            return self._values[pos]
+        return getattr(self.to_series(), attr)
+
+    def __contains__(self, key) -> bool:
+        return key in self._positions
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._values)
+
+    def keys(self) -> pd.Index:
+        return pd.Index(self._columns)
+
+    def to_series(self) -> pd.Series:
+        """The row as the Series iterrows would have produced (built once)."""
+        if self._series is None:
+            self._series = pd.Series(self._values, index=self._columns, name=self.name)
+        return self._series
+
+    def __repr__(self) -> str:
+        return f"MarketRow({self.name!r}, {dict(zip(self._columns, self._values))!r})"
+
+
+class MarketRows:
+    """Market data values extracted once, with a MarketRow per position."""
+
+    def __init__(self, data: pd.DataFrame):
+        self.columns: List[Hashable] = list(data.columns)
+        self.positions: Dict[Hashable, int] = {col: i for i, col in enumerate(self.columns)}
+        # Same interleaved matrix DataFrame.iterrows() builds its rows from
+        self.values: np.ndarray = data.values
+        self.index = data.index
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, i: int) -> MarketRow:
+        return MarketRow(self.values[i], self.positions, self.columns, self.index[i])
+
+    def column(self, name: Hashable) -> np.ndarray:
+        """One column across all days (object values, as rows see them)."""
+        return self.values[:, self.positions[name]]
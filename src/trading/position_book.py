@@ -0,0 +1,161 @@
+"""
+Struct-of-arrays book of open multi-leg trades.
+
+TradeSimulator.simulate holds one Trade and walks its legs in Python every
+day. For layered entries (many overlapping trades) the per-trade loops - P&L
+per leg, Greeks per leg, DTE per leg - dominate. PositionBook keeps every open
+leg as one row of parallel numpy arrays (strike, expiry, type, quantity, entry
+price, owning trade), plus per-trade arrays (entry day, contracts, hedge
+cost). Daily mark-to-market, net Greeks and exit checks are then a few array
+operations over all open legs, reduced per trade with np.bincount.
+
+Trade objects stay the record of each position: the book references them,
+and the simulator writes results back (hedge cost, Greeks history) when
+needed. Legs of a trade are contiguous and keep their order, so leg_index
+maps book rows back to trade.legs / entry_prices.
+"""
+
+from typing import Dict, List
+
+import numpy as np
+
+from src.pricing.greeks import calculate_greeks_array
+from .trade import CONTRACT_MULTIPLIER, Trade, TradeLeg
+from .utils import normalize_date
+
+
+GREEK_NAMES = ('delta', 'gamma', 'vega', 'theta')
+
+
+class PositionBook:
+    """Open legs of many trades as parallel arrays (one row per leg)."""
+
+    def __init__(self):
+        self.trades: List[Trade] = []  # Open trades; a trade's slot is its position here
+        self.legs: List[TradeLeg] = []  # Open legs, in book row order
+
+        # Per leg
+        self.slot = np.zeros(0, dtype=np.int64)
+        self.leg_index = np.zeros(0, dtype=np.int64)
+        self.strike = np.zeros(0, dtype=np.float64)
+        self.expiry = np.zeros(0, dtype=np.int64)  # Proleptic ordinal
+        self.is_call = np.zeros(0, dtype=bool)
+        self.quantity = np.zeros(0, dtype=np.float64)
+        self.entry_price = np.zeros(0, dtype=np.float64)
+
+        # Per trade
+        self.entry_day = np.zeros(0, dtype=np.int64)  # Proleptic ordinal
+        self.contracts = np.zeros(0, dtype=np.int64)
+        self.has_short = np.zeros(0, dtype=bool)
+        self.entry_cost = np.zeros(0, dtype=np.float64)
+        self.hedge_cost = np.zeros(0, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.trades)
+
+    @property
+    def num_legs(self) -> int:
+        return len(self.legs)
+
+    def add(self, trade: Trade) -> int:
+        """Add an open trade (entry prices set) and return its slot."""
+        slot = len(self.trades)
+        n = len(trade.legs)
+
+        self.trades.append(trade)
+        self.legs.extend(trade.legs)
+
+        self.slot = np.concatenate([self.slot, np.full(n, slot, dtype=np.int64)])
+        self.leg_index = np.concatenate([self.leg_index, np.arange(n, dtype=np.int64)])
+        self.strike = np.concatenate([self.strike, [leg.strike for leg in trade.legs]])
+        self.expiry = np.concatenate([self.expiry, [normalize_date(leg.expiry).toordinal() for leg in trade.legs]])
+        self.is_call = np.concatenate([self.is_call, [leg.option_type == 'call' for leg in trade.legs]])
+        self.quantity = np.concatenate([self.quantity, [leg.quantity for leg in trade.legs]])
+        self.entry_price = np.concatenate([self.entry_price, [trade.entry_prices[i] for i in range(n)]])
+
+        self.entry_day = np.append(self.entry_day, normalize_date(trade.entry_date).toordinal())
+        self.contracts = np.append(self.contracts, sum(abs(leg.quantity) for leg in trade.legs))
+        self.has_short = np.append(self.has_short, any(leg.quantity < 0 for leg in trade.legs))
+        self.entry_cost = np.append(self.entry_cost, trade.entry_cost)
+        self.hedge_cost = np.append(self.hedge_cost, trade.cumulative_hedge_cost)
+
+        return slot
+
+    def remove(self, slots) -> List[Trade]:
+        """
+        Drop trades by slot (remaining trades keep their order) and return
+        them with their accumulated hedge cost written back.
+        """
+        drop = np.zeros(len(self.trades), dtype=bool)
+        drop[np.asarray(slots, dtype=np.int64)] = True
+        if not drop.any():
+            return []
+
+        removed = []
+        for slot in np.flatnonzero(drop):
+            trade = self.trades[slot]
+            trade.cumulative_hedge_cost = float(self.hedge_cost[slot])
+            removed.append(trade)
+
+        keep_trade = ~drop
+        keep_leg = keep_trade[self.slot]
+        new_slot = np.cumsum(keep_trade) - 1
+
+        self.trades = [t for t, keep in zip(self.trades, keep_trade) if keep]
+        self.legs = [leg for leg, keep in zip(self.legs, keep_leg) if keep]
+
+        self.slot = new_slot[self.slot[keep_leg]]
+        self.leg_index = self.leg_index[keep_leg]
+        self.strike = self.strike[keep_leg]
+        self.expiry = self.expiry[keep_leg]
+        self.is_call = self.is_call[keep_leg]
+        self.quantity = self.quantity[keep_leg]
+        self.entry_price = self.entry_price[keep_leg]
+
+        self.entry_day = self.entry_day[keep_trade]
+        self.contracts = self.contracts[keep_trade]
+        self.has_short = self.has_short[keep_trade]
+        self.entry_cost = self.entry_cost[keep_trade]
+        self.hedge_cost = self.hedge_cost[keep_trade]
+
+        return removed
+
+    def refresh_leg(self, row: int):
+        """Re-read a leg's contract after it was snapped to a listed contract."""
+        leg = self.legs[row]
+        self.strike[row] = leg.strike
+        self.expiry[row] = normalize_date(leg.expiry).toordinal()
+
+    def per_trade(self, leg_values: np.ndarray) -> np.ndarray:
+        """Sum a per-leg array into a per-trade array."""
+        return np.bincount(self.slot, weights=leg_values, minlength=len(self.trades))
+
+    def leg_pnl(self, prices: np.ndarray) -> np.ndarray:
+        """Per-trade P&L of the legs at the given prices: qty x (price - entry), in dollars."""
+        return self.per_trade(self.quantity * (prices - self.entry_price) * CONTRACT_MULTIPLIER)
+
+    def days_in_trade(self, day: int) -> np.ndarray:
+        return day - self.entry_day
+
+    def min_dte(self, day: int) -> np.ndarray:
+        """Per-trade DTE of the nearest expiry."""
+        out = np.full(len(self.trades), np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(out, self.slot, self.expiry - day)
+        return out
+
+    def avg_dte(self, day: int) -> np.ndarray:
+        """Per-trade mean DTE across legs (expired legs count as 0)."""
+        counts = np.bincount(self.slot, minlength=len(self.trades))
+        totals = self.per_trade(np.maximum(self.expiry - day, 0).astype(float))
+        return np.divide(totals, counts, out=np.zeros(len(self.trades)), where=counts > 0)
+
+    def net_greeks(self, spot: float, day: int, implied_vol: float, risk_free_rate: float = 0.05) -> Dict[str, np.ndarray]:
+        """
+        Per-trade net delta/gamma/vega/theta (x quantity x multiplier), as
+        Trade.calculate_greeks computes them: expired legs contribute nothing.
+        """
+        time_to_expiry = (self.expiry - day) / 365.0
+        greeks = calculate_greeks_array(spot, self.strike, time_to_expiry, risk_free_rate, implied_vol, self.is_call)
+
+        weight = np.where(time_to_expiry > 0, self.quantity * CONTRACT_MULTIPLIER, 0.0)
+        return {name: self.per_trade(weight * greeks[name]) for name in GREEK_NAMES}
@@ -12,13 +12,20 @@ Handles:
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta, date
-from typing import List, Optional, Dict, Callable
-from dataclasses import dataclass
+from typing import Any, List, Optional, Dict, Callable, Tuple
+from dataclasses import dataclass, fields
 
 from .trade import Trade, TradeLeg
 from .execution import ExecutionModel, calculate_moneyness, get_vix_proxy
 from .utils import normalize_date
+from .market_rows import MarketRows
+from .position_book import GREEK_NAMES, PositionBook
+from .checkpoint import (
+    SimulationCheckpoint, checkpoint_dir_default, checkpoint_every_default, checkpoint_key_default,
+    data_fingerprint, fingerprint
+)
 from src.data.polygon_options import PolygonOptionsLoader
+from src.data.prefetch import ChainPrefetcher
 
 
 @dataclass
@@ -43,10 +50,27 @@ class SimulationConfig:
     capital_per_trade: float = 100_000.0  # Used for return normalization
     allow_toy_pricing: bool = False  # Diagnostics-only fallback pricing
 
+    # Data loading
+    prefetch_depth: int = 0  # Trading days to load ahead in background threads (0 = off)
+
+    # Simulation loop
+    row_views: bool = True  # Pass MarketRow views to callbacks (False = a pandas Series per day)
+
+    # Multi-position mode (simulate_multi)
+    max_open_trades: int = 0  # Cap on concurrently open trades (0 = unlimited)
+
+    # Checkpoint / resume (src/trading/checkpoint.py)
+    checkpoint_dir: Optional[str] = None  # None = env SIMULATION_CHECKPOINT_DIR, unset = off
+    checkpoint_every: Optional[int] = None  # Simulated days between checkpoints
+
     def __post_init__(self):
         """Set default execution model if not provided."""
         if self.execution_model is None:
             self.execution_model = ExecutionModel()
+        if self.checkpoint_dir is None:
+            self.checkpoint_dir = checkpoint_dir_default()
+        if self.checkpoint_every is None:
+            self.checkpoint_every = checkpoint_every_default()
 
 
 class TradeSimulator:
@@ -57,7 +81,8 @@ class TradeSimulator:
         data: pd.DataFrame,  # Full dataset with OHLCV, features, regimes
         config: Optional[SimulationConfig] = None,
         use_real_options_data: bool = True,
-        polygon_data_root: Optional[str] = None
+        polygon_data_root: Optional[str] = None,
+        polygon_loader: Optional[PolygonOptionsLoader] = None
     ):
         """
         Initialize trade simulator.
@@ -72,6 +97,9 @@ class TradeSimulator:
             If True, use real Polygon options data. If False, use toy pricing model.
         polygon_data_root : str, optional
             Path to Polygon data root. If None, uses default.
+        polygon_loader : PolygonOptionsLoader, optional
+            Pre-built loader to reuse. Loaders share the process-wide chain
+            cache either way, so each trading day is parsed once per run.
         """
         self.data = data.copy()
         self.config = config or SimulationConfig()
@@ -84,7 +112,9 @@ class TradeSimulator:
 
         # Polygon options loader
         self.use_real_options_data = use_real_options_data
-        if use_real_options_data:
+        if use_real_options_data and polygon_loader is not None:
+            self.polygon_loader = polygon_loader
+        elif use_real_options_data:
             self.polygon_loader = PolygonOptionsLoader(
                 data_root=polygon_data_root or "/Volumes/VelocityData/polygon_downloads/us_options_opra/day_aggs_v1"
             )
@@ -101,9 +131,19 @@ class TradeSimulator:
         self.stats = {
             'real_prices_used': 0,
             'fallback_prices_used': 0,
-            'missing_contracts': []
+            'missing_contracts': [],
+            # Quote lookups: one batch per leg-day, snaps only for missing contracts
+            'days_simulated': 0,
+            'leg_quote_requests': 0,
+            'quote_batches': 0,
+            'snap_lookups': 0
         }
 
+        # Quotes fetched for the current simulated day: contract -> quote (None = not listed)
+        self._quote_day: Optional[date] = None
+        self._day_quotes: Dict[tuple, Optional[Dict]] = {}
+        self._day_snaps: Dict[tuple, Optional[Dict]] = {}
+
         # Ensure data is sorted by date
         self.data = self.data.sort_values('date').reset_index(drop=True)
 
@@ -112,11 +152,17 @@ class TradeSimulator:
         entry_logic: Callable[[pd.Series, Optional[Trade]], bool],
         trade_constructor: Callable[[pd.Series, str], Trade],
         exit_logic: Optional[Callable[[pd.Series, Trade], bool]] = None,
-        profile_name: str = "Generic"
+        profile_name: str = "Generic",
+        checkpoint_key: Any = None
     ) -> pd.DataFrame:
         """
         Run backtest simulation using provided entry/exit logic.
 
+        Callbacks receive each day as a MarketRow (src/trading/market_rows.py):
+        row['col'], row.get('col', default) and attribute access read straight
+        from values extracted once; any other Series API falls back to a real
+        Series. Set config.row_views=False to pass Series as before.
+
         Parameters:
         -----------
         entry_logic : callable
@@ -131,6 +177,10 @@ class TradeSimulator:
             If None, uses default exit logic (DTE threshold, max loss)
         profile_name : str
             Name of profile for logging
+        checkpoint_key : any, optional
+            Parameters behind the callbacks (thresholds, filters, DTEs...);
+            its repr is part of the checkpoint fingerprint, so changing them
+            starts a fresh run (default env SIMULATION_CHECKPOINT_KEY)
 
         Returns:
         --------
@@ -143,123 +193,199 @@ class TradeSimulator:
         pending_entry_signal = False
 
         results = []
-        total_rows = len(self.data)
-
-        for idx, row in self.data.iterrows():
-            current_date = row['date']
-            spot = row['close']
-            vix_proxy = get_vix_proxy(row.get('RV20', 0.20))
-
-            pnl_today = 0.0
-
-            # Execute any pending entry signaled from previous day (T+1 fill)
-            # ==================================================================
-            # TIMING VERIFICATION:
-            # - pending_entry_signal was set at Day T using row_T data
-            # - We are now at Day T+1 with row_T+1 data
-            # - trade_constructor(row_T+1) uses ONLY Day T+1 prices
-            # - No look-ahead bias: Signal (T) → Fill (T+1)
-            # ==================================================================
-            if pending_entry_signal and current_trade is None:
-                pending_entry_signal = False
-                self.trade_counter += 1
-                # Use date + profile + counter for unique trade IDs
-                date_str = current_date.strftime('%Y%m%d') if hasattr(current_date, 'strftime') else str(current_date).replace('-', '')
-                trade_id = f"{profile_name}_{date_str}_{self.trade_counter:04d}"
-
-                current_trade = trade_constructor(row, trade_id)
-                current_trade.profile_name = profile_name
-                current_trade.underlying_price_entry = spot
-
-                entry_prices = self._get_entry_prices(current_trade, row)
-                current_trade.entry_prices = entry_prices
-                current_trade.__post_init__()
-
-                total_contracts = sum(abs(leg.quantity) for leg in current_trade.legs)
-                has_short = any(leg.quantity < 0 for leg in current_trade.legs)
-                current_trade.entry_commission = self.config.execution_model.get_commission_cost(
-                    total_contracts, is_short=has_short
-                )
+        rows = MarketRows(self.data)
+        total_rows = len(rows)
+
+        # Resume after the last checkpointed day of an identical run
+        start_idx = 0
+        checkpoint = self._open_checkpoint('simulate', profile_name, checkpoint_key)
+        if checkpoint is not None:
+            state = checkpoint.load()
+            if state is not None:
+                start_idx, loop = self._restore_checkpoint(state, profile_name, total_rows)
+                current_trade = loop['current_trade']
+                realized_equity = loop['realized_equity']
+                prev_total_equity = loop['prev_total_equity']
+                pending_entry_signal = loop['pending_entry_signal']
+                results = loop['results']
+
+        # Optional look-ahead loading of upcoming days' chains
+        prefetcher = None
+        if self.config.prefetch_depth > 0 and self.use_real_options_data and self.polygon_loader is not None:
+            prefetcher = ChainPrefetcher(
+                self.polygon_loader,
+                [normalize_date(d) for d in self.data['date']],
+                depth=self.config.prefetch_depth,
+                start=start_idx
+            )
 
-                current_trade.calculate_greeks(
-                    underlying_price=spot,
-                    current_date=current_date,
-                    implied_vol=vix_proxy,
-                    risk_free_rate=0.05
-                )
+        try:
+            for idx in range(start_idx, total_rows):
+                row = rows[idx] if self.config.row_views else rows[idx].to_series()
+                self.stats['days_simulated'] += 1
+                if prefetcher is not None:
+                    prefetcher.advance(idx)
+
+                current_date = row['date']
+                spot = row['close']
+                vix_proxy = get_vix_proxy(row.get('RV20', 0.20))
+
+                pnl_today = 0.0
+
+                # Execute any pending entry signaled from previous day (T+1 fill)
+                # ==================================================================
+                # TIMING VERIFICATION:
+                # - pending_entry_signal was set at Day T using row_T data
+                # - We are now at Day T+1 with row_T+1 data
+                # - trade_constructor(row_T+1) uses ONLY Day T+1 prices
+                # - No look-ahead bias: Signal (T) → Fill (T+1)
+                # ==================================================================
+                if pending_entry_signal and current_trade is None:
+                    pending_entry_signal = False
+                    self.trade_counter += 1
+                    # Use date + profile + counter for unique trade IDs
+                    date_str = current_date.strftime('%Y%m%d') if hasattr(current_date, 'strftime') else str(current_date).replace('-', '')
+                    trade_id = f"{profile_name}_{date_str}_{self.trade_counter:04d}"
+
+                    current_trade = trade_constructor(row, trade_id)
+                    current_trade.profile_name = profile_name
+                    current_trade.underlying_price_entry = spot
+
+                    entry_prices = self._get_entry_prices(current_trade, row)
+                    current_trade.entry_prices = entry_prices
+                    current_trade.__post_init__()
 
-            # Check if we should exit current trade
-            if current_trade is not None and current_trade.is_open:
-                should_exit = False
-                exit_reason = None
-
-                # Custom exit logic
-                if exit_logic is not None and exit_logic(row, current_trade):
-                    should_exit = True
-                    exit_reason = "Custom exit logic"
-
-                # Default exit: DTE threshold
-                # Normalize dates for comparison
-                current_date_normalized = normalize_date(current_date)
-                entry_date_normalized = normalize_date(current_trade.entry_date)
-
-                days_in_trade = (current_date_normalized - entry_date_normalized).days
-
-                # Calculate DTE for nearest expiry (most conservative)
-                min_dte = float('inf')
-                for leg in current_trade.legs:
-                    expiry = normalize_date(leg.expiry)
-                    dte = (expiry - current_date_normalized).days
-                    min_dte = min(min_dte, dte)
-
-                if min_dte <= self.config.roll_dte_threshold:
-                    should_exit = True
-                    exit_reason = f"DTE threshold ({min_dte} DTE)"
-
-                # Default exit: Max loss
-                current_prices = self._get_current_prices(current_trade, row)
-                # Calculate estimated exit commission for realistic P&L
-                total_contracts = sum(abs(leg.quantity) for leg in current_trade.legs)
-                has_short = any(leg.quantity < 0 for leg in current_trade.legs)
-                estimated_exit_commission = self.config.execution_model.get_commission_cost(
-                    total_contracts, is_short=has_short
-                )
-                current_pnl = current_trade.mark_to_market(
-                    current_prices,
-                    estimated_exit_commission=estimated_exit_commission
-                )
+                    total_contracts = sum(abs(leg.quantity) for leg in current_trade.legs)
+                    has_short = any(leg.quantity < 0 for leg in current_trade.legs)
+                    current_trade.entry_commission = self.config.execution_model.get_commission_cost(
+                        total_contracts, is_short=has_short
+                    )
+
+                    current_trade.calculate_greeks(
+                        underlying_price=spot,
+                        current_date=current_date,
+                        implied_vol=vix_proxy,
+                        risk_free_rate=0.05
+                    )
+
+                # Check if we should exit current trade
+                if current_trade is not None and current_trade.is_open:
+                    should_exit = False
+                    exit_reason = None
+
+                    # Custom exit logic
+                    if exit_logic is not None and exit_logic(row, current_trade):
+                        should_exit = True
+                        exit_reason = "Custom exit logic"
 
-                if current_pnl < -abs(current_trade.entry_cost) * self.config.max_loss_pct:
-                    should_exit = True
-                    exit_reason = f"Max loss ({current_pnl:.2f})"
+                    # Default exit: DTE threshold
+                    # Normalize dates for comparison
+                    current_date_normalized = normalize_date(current_date)
+                    entry_date_normalized = normalize_date(current_trade.entry_date)
 
-                # Default exit: Max days
-                if days_in_trade >= self.config.max_days_in_trade:
-                    should_exit = True
-                    exit_reason = f"Max days ({days_in_trade} days)"
+                    days_in_trade = (current_date_normalized - entry_date_normalized).days
 
-                # Execute exit
-                if should_exit:
-                    exit_prices = self._get_exit_prices(current_trade, row)
+                    # Calculate DTE for nearest expiry (most conservative)
+                    min_dte = float('inf')
+                    for leg in current_trade.legs:
+                        expiry = normalize_date(leg.expiry)
+                        dte = (expiry - current_date_normalized).days
+                        min_dte = min(min_dte, dte)
 
-                    # Calculate exit commission
+                    if min_dte <= self.config.roll_dte_threshold:
+                        should_exit = True
+                        exit_reason = f"DTE threshold ({min_dte} DTE)"
+
+                    # Default exit: Max loss
+                    current_prices = self._get_current_prices(current_trade, row)
+                    # Calculate estimated exit commission for realistic P&L
                     total_contracts = sum(abs(leg.quantity) for leg in current_trade.legs)
                     has_short = any(leg.quantity < 0 for leg in current_trade.legs)
-                    current_trade.exit_commission = self.config.execution_model.get_commission_cost(
+                    estimated_exit_commission = self.config.execution_model.get_commission_cost(
                         total_contracts, is_short=has_short
                     )
+                    current_pnl = current_trade.mark_to_market(
+                        current_prices,
+                        estimated_exit_commission=estimated_exit_commission
+                    )
 
-                    current_trade.close(current_date, exit_prices, exit_reason or "Unknown")
-                    realized_equity += current_trade.realized_pnl
-                    self.trades.append(current_trade)
-                    current_trade = None
-
-                # Daily delta hedge (if trade still open)
-                elif self.config.delta_hedge_enabled:
-                    hedge_cost = self._perform_delta_hedge(current_trade, row)
-                    current_trade.add_hedge_cost(hedge_cost)
-
-                # Mark-to-market (if trade still open) with Greeks updates
+                    if current_pnl < -abs(current_trade.entry_cost) * self.config.max_loss_pct:
+                        should_exit = True
+                        exit_reason = f"Max loss ({current_pnl:.2f})"
+
+                    # Default exit: Max days
+                    if days_in_trade >= self.config.max_days_in_trade:
+                        should_exit = True
+                        exit_reason = f"Max days ({days_in_trade} days)"
+
+                    # Execute exit
+                    if should_exit:
+                        exit_prices = self._get_exit_prices(current_trade, row)
+
+                        # Calculate exit commission
+                        total_contracts = sum(abs(leg.quantity) for leg in current_trade.legs)
+                        has_short = any(leg.quantity < 0 for leg in current_trade.legs)
+                        current_trade.exit_commission = self.config.execution_model.get_commission_cost(
+                            total_contracts, is_short=has_short
+                        )
+
+                        current_trade.close(current_date, exit_prices, exit_reason or "Unknown")
+                        realized_equity += current_trade.realized_pnl
+                        self.trades.append(current_trade)
+                        current_trade = None
+
+                    # Daily delta hedge (if trade still open)
+                    elif self.config.delta_hedge_enabled:
+                        hedge_cost = self._perform_delta_hedge(current_trade, row)
+                        current_trade.add_hedge_cost(hedge_cost)
+
+                    # Mark-to-market (if trade still open) with Greeks updates
+                    if current_trade is not None:
+                        current_prices = self._get_current_prices(current_trade, row)
+                        # Calculate estimated exit commission for realistic P&L
+                        total_contracts = sum(abs(leg.quantity) for leg in current_trade.legs)
+                        has_short = any(leg.quantity < 0 for leg in current_trade.legs)
+                        estimated_exit_commission = self.config.execution_model.get_commission_cost(
+                            total_contracts, is_short=has_short
+                        )
+                        pnl_today = current_trade.mark_to_market(
+                            current_prices=current_prices,
+                            current_date=current_date,
+                            underlying_price=spot,
+                            implied_vol=vix_proxy,
+                            risk_free_rate=0.05,
+                            estimated_exit_commission=estimated_exit_commission
+                        )
+
+                # TIMING DIAGRAM: Entry Signal vs. Execution (No Look-Ahead Bias)
+                # ==================================================================
+                # Day T (Current Row):
+                #   - entry_logic(row_T) evaluates using ONLY Day T EOD data
+                #   - SPY close_T, VIX_T, RV20_T, regime_T, profile_scores_T
+                #   - If True: Sets pending_entry_signal = True
+                #   - NO trade execution on Day T
+                #
+                # Day T+1 (Next Row):
+                #   - pending_entry_signal triggers trade_constructor(row_T+1)
+                #   - Trade executed using Day T+1 prices (close_T+1, options_T+1)
+                #   - This is T+1 fill - realistic execution timing
+                #
+                # Result: Signal generated at T EOD, trade filled at T+1 EOD
+                # No future information used - walk-forward compliant
+                # ==================================================================
+
+                # Check if we should enter new trade (schedule for next session)
+                is_last_row = idx == total_rows - 1
+                if (
+                    current_trade is None
+                    and not pending_entry_signal
+                    and not is_last_row
+                    and entry_logic(row, current_trade)
+                ):
+                    pending_entry_signal = True
+
+                # Track equity using realized + unrealized outstanding position value
+                unrealized_pnl = 0.0
                 if current_trade is not None:
                     current_prices = self._get_current_prices(current_trade, row)
                     # Calculate estimated exit commission for realistic P&L
@@ -268,7 +394,7 @@ class TradeSimulator:
                     estimated_exit_commission = self.config.execution_model.get_commission_cost(
                         total_contracts, is_short=has_short
                     )
-                    pnl_today = current_trade.mark_to_market(
+                    unrealized_pnl = current_trade.mark_to_market(
                         current_prices=current_prices,
                         current_date=current_date,
                         underlying_price=spot,
@@ -277,80 +403,47 @@ class TradeSimulator:
                         estimated_exit_commission=estimated_exit_commission
                     )
 
-            # TIMING DIAGRAM: Entry Signal vs. Execution (No Look-Ahead Bias)
-            # ==================================================================
-            # Day T (Current Row):
-            #   - entry_logic(row_T) evaluates using ONLY Day T EOD data
-            #   - SPY close_T, VIX_T, RV20_T, regime_T, profile_scores_T
-            #   - If True: Sets pending_entry_signal = True
-            #   - NO trade execution on Day T
-            #
-            # Day T+1 (Next Row):
-            #   - pending_entry_signal triggers trade_constructor(row_T+1)
-            #   - Trade executed using Day T+1 prices (close_T+1, options_T+1)
-            #   - This is T+1 fill - realistic execution timing
-            #
-            # Result: Signal generated at T EOD, trade filled at T+1 EOD
-            # No future information used - walk-forward compliant
-            # ==================================================================
-
-            # Check if we should enter new trade (schedule for next session)
-            is_last_row = idx == total_rows - 1
-            if (
-                current_trade is None
-                and not pending_entry_signal
-                and not is_last_row
-                and entry_logic(row, current_trade)
-            ):
-                pending_entry_signal = True
-
-            # Track equity using realized + unrealized outstanding position value
-            unrealized_pnl = 0.0
-            if current_trade is not None:
-                current_prices = self._get_current_prices(current_trade, row)
-                # Calculate estimated exit commission for realistic P&L
-                total_contracts = sum(abs(leg.quantity) for leg in current_trade.legs)
-                has_short = any(leg.quantity < 0 for leg in current_trade.legs)
-                estimated_exit_commission = self.config.execution_model.get_commission_cost(
-                    total_contracts, is_short=has_short
-                )
-                unrealized_pnl = current_trade.mark_to_market(
-                    current_prices=current_prices,
-                    current_date=current_date,
-                    underlying_price=spot,
-                    implied_vol=vix_proxy,
-                    risk_free_rate=0.05,
-                    estimated_exit_commission=estimated_exit_commission
-                )
+                total_equity = realized_equity + unrealized_pnl
+                daily_pnl = total_equity - prev_total_equity
 
-            total_equity = realized_equity + unrealized_pnl
-            daily_pnl = total_equity - prev_total_equity
-
-            # Use previous day's total equity as denominator for returns
-            if prev_total_equity > 0:
-                daily_return = daily_pnl / prev_total_equity
-            else:
-                # First day or zero equity - use initial capital
-                daily_return = daily_pnl / max(self.config.capital_per_trade, 1.0)
-
-            prev_total_equity = total_equity
+                # Use previous day's total equity as denominator for returns
+                if prev_total_equity > 0:
+                    daily_return = daily_pnl / prev_total_equity
+                else:
+                    # First day or zero equity - use initial capital
+                    daily_return = daily_pnl / max(self.config.capital_per_trade, 1.0)
+
+                prev_total_equity = total_equity
+
+                results.append({
+                    'date': current_date,
+                    'spot': spot,
+                    'regime': row.get('regime', 0),
+                    'position_open': current_trade is not None,
+                    'daily_pnl': daily_pnl,
+                    'daily_return': daily_return,
+                    'realized_pnl_total': realized_equity,
+                    'unrealized_pnl': unrealized_pnl,
+                    'total_pnl': total_equity,
+                    'trade_id': current_trade.trade_id if current_trade else None
+                })
 
-            results.append({
-                'date': current_date,
-                'spot': spot,
-                'regime': row.get('regime', 0),
-                'position_open': current_trade is not None,
-                'daily_pnl': daily_pnl,
-                'daily_return': daily_return,
-                'realized_pnl_total': realized_equity,
-                'unrealized_pnl': unrealized_pnl,
-                'total_pnl': total_equity,
-                'trade_id': current_trade.trade_id if current_trade else None
-            })
+                if checkpoint is not None and checkpoint.due(idx):
+                    checkpoint.save(self._checkpoint_state(idx + 1, {
+                        'current_trade': current_trade,
+                        'realized_equity': realized_equity,
+                        'prev_total_equity': prev_total_equity,
+                        'pending_entry_signal': pending_entry_signal,
+                        'results': results
+                    }))
+        finally:
+            if prefetcher is not None:
+                prefetcher.close()
+                self.stats['prefetch'] = prefetcher.stats()
 
         # Close any remaining open trade at end
         if current_trade is not None and current_trade.is_open:
-            final_row = self.data.iloc[-1]
+            final_row = rows[total_rows - 1]
             exit_prices = self._get_exit_prices(current_trade, final_row)
 
             # Calculate exit commission
@@ -375,8 +468,365 @@ class TradeSimulator:
                 last_row['daily_pnl'] += adjustment
                 last_row['daily_return'] = last_row['daily_pnl'] / capital_base
 
+        if checkpoint is not None:
+            checkpoint.clear()
+
+        return pd.DataFrame(results)
+
+    def simulate_multi(
+        self,
+        entry_logic: Callable[[pd.Series, List[Trade]], bool],
+        trade_constructor: Callable[[pd.Series, str], Trade],
+        exit_logic: Optional[Callable[[pd.Series, Trade], bool]] = None,
+        profile_name: str = "Generic",
+        checkpoint_key: Any = None
+    ) -> pd.DataFrame:
+        """
+        Run backtest simulation holding any number of concurrent trades.
+
+        Same timing and exit rules as simulate() (T+1 fills; custom, DTE,
+        max-loss and max-days exits; daily delta hedge), but entries layer:
+        a new signal opens another trade while earlier ones stay open, up to
+        config.max_open_trades (0 = unlimited). Open legs live in a
+        PositionBook, so mark-to-market, net Greeks, hedging and the default
+        exit checks are computed for all open trades in one array pass per
+        day. All open legs are quoted with one bulk lookup per day.
+
+        With max_open_trades=1 it reproduces simulate()'s daily P&L and trade
+        summary. Greeks are recorded differently: each open trade gets one
+        greeks_history entry per day (simulate() appends one per
+        mark-to-market, i.e. twice a day), so pnl_attribution is per day.
+
+        Parameters:
+        -----------
+        entry_logic : callable
+            Function(row, open_trades) -> bool
+            Returns True if should enter another trade on this date
+        trade_constructor : callable
+            Function(row, trade_id) -> Trade
+            Constructs trade object given market conditions
+        exit_logic : callable, optional
+            Function(row, trade) -> bool
+            Called for each open trade; True exits that trade
+        profile_name : str
+            Name of profile for logging
+        checkpoint_key : any, optional
+            Parameters behind the callbacks (thresholds, filters, DTEs...);
+            its repr is part of the checkpoint fingerprint, so changing them
+            starts a fresh run (default env SIMULATION_CHECKPOINT_KEY)
+
+        Returns:
+        --------
+        results : pd.DataFrame
+            Daily P&L, equity curve, open trade count and net portfolio Greeks
+        """
+        book = PositionBook()
+        execution = self.config.execution_model
+        max_open = self.config.max_open_trades
+        realized_equity = 0.0
+        prev_total_equity = 0.0
+        pending_entry_signal = False
+
+        results = []
+        rows = MarketRows(self.data)
+        total_rows = len(rows)
+
+        start_idx = 0
+        checkpoint = self._open_checkpoint('simulate_multi', profile_name, checkpoint_key)
+        if checkpoint is not None:
+            state = checkpoint.load()
+            if state is not None:
+                start_idx, loop = self._restore_checkpoint(state, profile_name, total_rows)
+                book = loop['book']
+                realized_equity = loop['realized_equity']
+                prev_total_equity = loop['prev_total_equity']
+                pending_entry_signal = loop['pending_entry_signal']
+                results = loop['results']
+
+        prefetcher = None
+        if self.config.prefetch_depth > 0 and self.use_real_options_data and self.polygon_loader is not None:
+            prefetcher = ChainPrefetcher(
+                self.polygon_loader,
+                [normalize_date(d) for d in self.data['date']],
+                depth=self.config.prefetch_depth,
+                start=start_idx
+            )
+
+        try:
+            for idx in range(start_idx, total_rows):
+                row = rows[idx] if self.config.row_views else rows[idx].to_series()
+                self.stats['days_simulated'] += 1
+                if prefetcher is not None:
+                    prefetcher.advance(idx)
+
+                current_date = row['date']
+                spot = row['close']
+                vix_proxy = get_vix_proxy(row.get('RV20', 0.20))
+                day = normalize_date(current_date).toordinal()
+
+                # Execute pending entry signaled from previous day (T+1 fill)
+                if pending_entry_signal and (max_open <= 0 or len(book) < max_open):
+                    pending_entry_signal = False
+                    self.trade_counter += 1
+                    date_str = current_date.strftime('%Y%m%d') if hasattr(current_date, 'strftime') else str(current_date).replace('-', '')
+                    trade_id = f"{profile_name}_{date_str}_{self.trade_counter:04d}"
+
+                    trade = trade_constructor(row, trade_id)
+                    trade.profile_name = profile_name
+                    trade.underlying_price_entry = spot
+                    trade.entry_prices = self._get_entry_prices(trade, row)
+                    trade.__post_init__()
+
+                    total_contracts = sum(abs(leg.quantity) for leg in trade.legs)
+                    has_short = any(leg.quantity < 0 for leg in trade.legs)
+                    trade.entry_commission = execution.get_commission_cost(total_contracts, is_short=has_short)
+                    trade.calculate_greeks(
+                        underlying_price=spot,
+                        current_date=current_date,
+                        implied_vol=vix_proxy,
+                        risk_free_rate=0.05
+                    )
+                    book.add(trade)
+
+                greeks = None
+                unrealized = np.zeros(0)
+                if len(book):
+                    prices = self._book_mid_prices(book, row)
+                    exit_commission = execution.get_commission_cost_array(book.contracts, book.has_short)
+                    current_pnl = book.leg_pnl(prices) - book.hedge_cost - exit_commission
+
+                    # Default exits for every open trade at once (later rules win the reason, as in simulate)
+                    min_dte = book.min_dte(day)
+                    days_in_trade = book.days_in_trade(day)
+                    custom_exit = np.array([exit_logic(row, trade) for trade in book.trades], dtype=bool) \
+                        if exit_logic is not None else np.zeros(len(book), dtype=bool)
+                    dte_exit = min_dte <= self.config.roll_dte_threshold
+                    loss_exit = current_pnl < -np.abs(book.entry_cost) * self.config.max_loss_pct
+                    days_exit = days_in_trade >= self.config.max_days_in_trade
+                    should_exit = custom_exit | dte_exit | loss_exit | days_exit
+
+                    if should_exit.any():
+                        exit_slots = np.flatnonzero(should_exit)
+                        reasons = {}
+                        for slot in exit_slots:
+                            reason = "Custom exit logic" if custom_exit[slot] else None
+                            if dte_exit[slot]:
+                                reason = f"DTE threshold ({min_dte[slot]} DTE)"
+                            if loss_exit[slot]:
+                                reason = f"Max loss ({current_pnl[slot]:.2f})"
+                            if days_exit[slot]:
+                                reason = f"Max days ({days_in_trade[slot]} days)"
+                            reasons[id(book.trades[slot])] = reason
+
+                        keep_legs = ~should_exit[book.slot]
+                        for trade in book.remove(exit_slots):
+                            realized_equity += self._close_trade(trade, row, reasons[id(trade)] or "Unknown")
+                        prices = prices[keep_legs]
+                        exit_commission = exit_commission[~should_exit]
+
+                    if len(book):
+                        greeks = book.net_greeks(spot, day, vix_proxy)
+
+                        # Daily delta hedge of every remaining trade
+                        if self.config.delta_hedge_enabled and self.config.delta_hedge_frequency == 'daily':
+                            net_delta = greeks['delta']
+                            hedge_cost = execution.get_delta_hedge_cost_array(np.abs(net_delta) / 50)
+                            book.hedge_cost += np.where(np.abs(net_delta) < 20, 0.0, hedge_cost)
+
+                        unrealized = book.leg_pnl(prices) - book.hedge_cost - exit_commission
+                        self._record_book_greeks(book, greeks, row, vix_proxy)
+
+                # Signal at T, fill at T+1 (see simulate)
+                is_last_row = idx == total_rows - 1
+                if (
+                    not pending_entry_signal
+                    and not is_last_row
+                    and (max_open <= 0 or len(book) < max_open)
+                    and entry_logic(row, list(book.trades))
+                ):
+                    pending_entry_signal = True
+
+                unrealized_pnl = float(unrealized.sum())
+                total_equity = realized_equity + unrealized_pnl
+                daily_pnl = total_equity - prev_total_equity
+
+                if prev_total_equity > 0:
+                    daily_return = daily_pnl / prev_total_equity
+                else:
+                    daily_return = daily_pnl / max(self.config.capital_per_trade, 1.0)
+
+                prev_total_equity = total_equity
+
+                record = {
+                    'date': current_date,
+                    'spot': spot,
+                    'regime': row.get('regime', 0),
+                    'position_open': len(book) > 0,
+                    'open_trades': len(book),
+                    'daily_pnl': daily_pnl,
+                    'daily_return': daily_return,
+                    'realized_pnl_total': realized_equity,
+                    'unrealized_pnl': unrealized_pnl,
+                    'total_pnl': total_equity,
+                }
+                for name in GREEK_NAMES:
+                    record[f'net_{name}'] = float(greeks[name].sum()) if greeks is not None else 0.0
+                results.append(record)
+
+                if checkpoint is not None and checkpoint.due(idx):
+                    checkpoint.save(self._checkpoint_state(idx + 1, {
+                        'book': book,
+                        'realized_equity': realized_equity,
+                        'prev_total_equity': prev_total_equity,
+                        'pending_entry_signal': pending_entry_signal,
+                        'results': results
+                    }))
+        finally:
+            if prefetcher is not None:
+                prefetcher.close()
+                self.stats['prefetch'] = prefetcher.stats()
+
+        # Close any remaining open trades at end
+        if len(book):
+            final_row = rows[total_rows - 1]
+            for trade in book.remove(np.arange(len(book))):
+                realized_equity += self._close_trade(trade, final_row, "End of backtest")
+
+            if results:
+                capital_base = max(self.config.capital_per_trade, 1.0)
+                last_row = results[-1]
+                previous_total = last_row['total_pnl']
+                last_row['realized_pnl_total'] = realized_equity
+                last_row['unrealized_pnl'] = 0.0
+                last_row['total_pnl'] = realized_equity
+                last_row['daily_pnl'] += realized_equity - previous_total
+                last_row['daily_return'] = last_row['daily_pnl'] / capital_base
+
+        if checkpoint is not None:
+            checkpoint.clear()
+
         return pd.DataFrame(results)
 
+    def _open_checkpoint(self, mode: str, profile_name: str, checkpoint_key: Any = None) -> Optional[SimulationCheckpoint]:
+        """
+        Checkpoint for this run if checkpointing is enabled. Runs are
+        identified by mode, profile, caller key (profile parameters), market
+        data, config and pricing source.
+        """
+        if not self.config.checkpoint_dir:
+            return None
+        if checkpoint_key is None:
+            checkpoint_key = checkpoint_key_default()
+
+        config_items = {
+            f.name: getattr(self.config, f.name)
+            for f in fields(self.config) if not f.name.startswith('checkpoint_')
+        }
+        config_items['execution_model'] = sorted(vars(self.config.execution_model).items())
+        data_root = getattr(self.polygon_loader, 'data_root', None)
+
+        run_fingerprint = fingerprint(
+            mode, profile_name, checkpoint_key, data_fingerprint(self.data), sorted(config_items.items()),
+            self.use_real_options_data, str(data_root)
+        )
+        return SimulationCheckpoint(
+            self.config.checkpoint_dir, f"{profile_name}_{mode}", run_fingerprint, self.config.checkpoint_every
+        )
+
+    def _checkpoint_state(self, next_idx: int, loop: Dict[str, Any]) -> Dict[str, Any]:
+        """Everything the day loop needs to continue at next_idx."""
+        return {
+            'next_idx': next_idx,
+            'loop': loop,
+            'trades': self.trades,
+            'trade_counter': self.trade_counter,
+            'stats': self.stats
+        }
+
+    def _restore_checkpoint(self, state: Dict[str, Any], profile_name: str, total_rows: int) -> Tuple[int, Dict[str, Any]]:
+        """Restore simulator fields from a checkpoint; returns (start index, loop state)."""
+        self.trades = state['trades']
+        self.trade_counter = state['trade_counter']
+        self.stats = state['stats']
+        print(f"Resuming {profile_name} from checkpoint at day {state['next_idx']}/{total_rows}")
+        return state['next_idx'], state['loop']
+
+    def _close_trade(self, trade: Trade, row: pd.Series, reason: str) -> float:
+        """Close a trade at the row's exit prices and return its realized P&L."""
+        exit_prices = self._get_exit_prices(trade, row)
+
+        total_contracts = sum(abs(leg.quantity) for leg in trade.legs)
+        has_short = any(leg.quantity < 0 for leg in trade.legs)
+        trade.exit_commission = self.config.execution_model.get_commission_cost(
+            total_contracts, is_short=has_short
+        )
+
+        trade.close(row['date'], exit_prices, reason)
+        self.trades.append(trade)
+        return trade.realized_pnl
+
+    def _book_mid_prices(self, book: PositionBook, row: pd.Series) -> np.ndarray:
+        """
+        Mark-to-market (mid) price of every open leg in the book.
+
+        All legs are quoted in one batch; legs without a usable quote go
+        through _estimate_option_price (snap / missing-contract policy), and
+        snapped legs are refreshed in the book.
+        """
+        spot = row['close']
+        trade_date = normalize_date(row['date'])
+        days_in_trade = book.days_in_trade(trade_date.toordinal())[book.slot]
+
+        prices = np.empty(book.num_legs)
+        quotes = {}
+        if self.use_real_options_data and self.polygon_loader is not None:
+            self._fetch_leg_quotes(trade_date, book.legs)
+            quotes = self._day_quotes
+
+        real = 0
+        for i, leg in enumerate(book.legs):
+            quote = quotes.get(self._contract(leg)) if quotes else None
+            if quote is not None and quote['mid'] is not None and quote['mid'] > 0:
+                prices[i] = quote['mid']
+                real += 1
+                continue
+
+            contract = (leg.strike, leg.expiry)
+            prices[i] = self._estimate_option_price(leg, spot, row, leg.dte - days_in_trade[i])
+            if (leg.strike, leg.expiry) != contract:
+                book.refresh_leg(i)
+
+        self.stats['real_prices_used'] += real
+        self.stats['leg_quote_requests'] += real
+        return prices
+
+    def _record_book_greeks(self, book: PositionBook, greeks: Dict[str, np.ndarray], row: pd.Series, implied_vol: float):
+        """Write the day's net Greeks back to each open trade (history + P&L attribution)."""
+        current_date = normalize_date(row['date'])
+        day = current_date.toordinal()
+        spot = row['close']
+        days_in_trade = book.days_in_trade(day)
+        avg_dte = book.avg_dte(day)
+
+        for slot, trade in enumerate(book.trades):
+            trade.net_delta = float(greeks['delta'][slot])
+            trade.net_gamma = float(greeks['gamma'][slot])
+            trade.net_vega = float(greeks['vega'][slot])
+            trade.net_theta = float(greeks['theta'][slot])
+            trade.greeks_history.append({
+                'date': current_date,
+                'days_in_trade': int(days_in_trade[slot]),
+                'avg_dte': float(avg_dte[slot]),
+                'spot': spot,
+                'delta': trade.net_delta,
+                'gamma': trade.net_gamma,
+                'vega': trade.net_vega,
+                'theta': trade.net_theta,
+                'iv': implied_vol
+            })
+            if len(trade.greeks_history) >= 2:
+                trade._calculate_pnl_attribution()
+
     def _get_entry_prices(self, trade: Trade, row: pd.Series) -> Dict[int, float]:
         """Get execution prices for trade entry (pay ask for longs, receive bid for shorts)."""
         spot = row['close']
@@ -386,39 +836,11 @@ class TradeSimulator:
         trade_date = normalize_date(row['date'])
 
         entry_prices = {}
+        self._fetch_leg_quotes(trade_date, trade.legs)
 
         for i, leg in enumerate(trade.legs):
-            # Try to get real bid/ask from Polygon
-            real_bid = None
-            real_ask = None
-
-            if self.use_real_options_data and self.polygon_loader is not None:
-                try:
-                    expiry = normalize_date(leg.expiry)
-
-                    real_bid = self.polygon_loader.get_option_price(
-                        trade_date=trade_date,
-                        strike=leg.strike,
-                        expiry=expiry,
-                        option_type=leg.option_type,
-                        price_type='bid'
-                    )
-
-                    real_ask = self.polygon_loader.get_option_price(
-                        trade_date=trade_date,
-                        strike=leg.strike,
-                        expiry=expiry,
-                        option_type=leg.option_type,
-                        price_type='ask'
-                    )
-                except:
-                    pass
-
-            if (real_bid is None or real_ask is None) and self.use_real_options_data:
-                suggestion = self._snap_contract_to_available(trade_date, leg)
-                if suggestion:
-                    real_bid = suggestion['bid']
-                    real_ask = suggestion['ask']
+            # Real bid/ask from Polygon (fetched for all legs in one batch)
+            real_bid, real_ask = self._leg_bid_ask(trade_date, leg)
 
             # If we have real bid/ask, use them directly
             if real_bid is not None and real_ask is not None:
@@ -452,6 +874,7 @@ class TradeSimulator:
         trade_date = normalize_date(row['date'])
 
         exit_prices = {}
+        self._fetch_leg_quotes(trade_date, trade.legs)
 
         for i, leg in enumerate(trade.legs):
             # Normalize dates for DTE calculation
@@ -461,37 +884,8 @@ class TradeSimulator:
             days_in_trade = (current_date_exit - entry_date_exit).days
             current_dte = leg.dte - days_in_trade
 
-            # Try to get real bid/ask from Polygon
-            real_bid = None
-            real_ask = None
-
-            if self.use_real_options_data and self.polygon_loader is not None:
-                try:
-                    expiry = normalize_date(leg.expiry)
-
-                    real_bid = self.polygon_loader.get_option_price(
-                        trade_date=trade_date,
-                        strike=leg.strike,
-                        expiry=expiry,
-                        option_type=leg.option_type,
-                        price_type='bid'
-                    )
-
-                    real_ask = self.polygon_loader.get_option_price(
-                        trade_date=trade_date,
-                        strike=leg.strike,
-                        expiry=expiry,
-                        option_type=leg.option_type,
-                        price_type='ask'
-                    )
-                except:
-                    pass
-
-            if (real_bid is None or real_ask is None) and self.use_real_options_data:
-                suggestion = self._snap_contract_to_available(trade_date, leg)
-                if suggestion:
-                    real_bid = suggestion['bid']
-                    real_ask = suggestion['ask']
+            # Real bid/ask from Polygon (fetched for all legs in one batch)
+            real_bid, real_ask = self._leg_bid_ask(trade_date, leg)
 
             # If we have real bid/ask, use them (reverse of entry)
             if real_bid is not None and real_ask is not None:
@@ -528,6 +922,9 @@ class TradeSimulator:
         current_date = normalize_date(row['date'])
         entry_date = normalize_date(trade.entry_date)
 
+        if self.use_real_options_data and self.polygon_loader is not None:
+            self._fetch_leg_quotes(current_date, trade.legs)
+
         for i, leg in enumerate(trade.legs):
             days_in_trade = (current_date - entry_date).days
             current_dte = leg.dte - days_in_trade
@@ -578,13 +975,8 @@ class TradeSimulator:
 
         # Try to get real Polygon data first
         if self.use_real_options_data and self.polygon_loader is not None:
-            price = self.polygon_loader.get_option_price(
-                trade_date=trade_date,
-                strike=leg.strike,
-                expiry=expiry,
-                option_type=leg.option_type,
-                price_type='mid'  # Use mid for fair value
-            )
+            quote = self._leg_quote(trade_date, leg, expiry)
+            price = quote['mid'] if quote is not None else None  # Use mid for fair value
 
             if price is not None and price > 0:
                 self.stats['real_prices_used'] += 1
@@ -608,6 +1000,73 @@ class TradeSimulator:
         # Fallback to toy model (diagnostics only)
         return self._toy_option_price(leg, spot, row, dte)
 
+    @staticmethod
+    def _contract(leg: TradeLeg, expiry: Optional[date] = None) -> tuple:
+        return (leg.strike, expiry if expiry is not None else normalize_date(leg.expiry), leg.option_type)
+
+    def _start_quote_day(self, trade_date: date):
+        """Quotes are only valid for one trading day."""
+        if trade_date != self._quote_day:
+            self._quote_day = trade_date
+            self._day_quotes = {}
+            self._day_snaps = {}
+
+    def _fetch_leg_quotes(self, trade_date: date, legs: List[TradeLeg]):
+        """
+        Quote every leg contract not yet quoted today with one bulk lookup
+        (bid/ask/mid/volume per contract; garbage quotes count as missing).
+        """
+        self._fetch_quotes(trade_date, [self._contract(leg) for leg in legs if leg.expiry is not None])
+
+    def _fetch_quotes(self, trade_date: date, contracts: List[tuple]):
+        if not self.use_real_options_data or self.polygon_loader is None:
+            return
+        trade_date = normalize_date(trade_date)
+        self._start_quote_day(trade_date)
+
+        pending = []
+        for contract in contracts:
+            if contract not in self._day_quotes and contract not in pending:
+                pending.append(contract)
+        if not pending:
+            return
+
+        self.stats['quote_batches'] += 1
+        # Missing days/contracts come back empty; anything raised is a real error
+        quotes = self.polygon_loader.get_option_quotes_bulk(trade_date, pending)
+        for contract in pending:
+            self._day_quotes[contract] = quotes.get(contract)
+
+    def _leg_quote(self, trade_date: date, leg: TradeLeg, expiry: Optional[date] = None) -> Optional[Dict]:
+        """Today's quote for a leg's contract (fetched on first request), or None."""
+        trade_date = normalize_date(trade_date)
+        self._start_quote_day(trade_date)
+        self.stats['leg_quote_requests'] += 1
+
+        contract = self._contract(leg, expiry)
+        if contract not in self._day_quotes:
+            self._fetch_quotes(trade_date, [contract])
+        return self._day_quotes.get(contract)
+
+    def _leg_bid_ask(self, trade_date: date, leg: TradeLeg) -> tuple:
+        """(bid, ask) for a leg, snapping to the closest listed contract if missing."""
+        real_bid = None
+        real_ask = None
+
+        if self.use_real_options_data and self.polygon_loader is not None:
+            quote = self._leg_quote(trade_date, leg)
+            if quote is not None:
+                real_bid = quote['bid']
+                real_ask = quote['ask']
+
+        if (real_bid is None or real_ask is None) and self.use_real_options_data:
+            suggestion = self._snap_contract_to_available(trade_date, leg)
+            if suggestion:
+                real_bid = suggestion['bid']
+                real_ask = suggestion['ask']
+
+        return real_bid, real_ask
+
     def _handle_missing_contract(self, trade_date, leg: TradeLeg, expiry):
         """Record missing contracts and optionally raise when toy pricing disabled."""
         normalized_trade_date = trade_date
@@ -641,12 +1100,21 @@ class TradeSimulator:
 
         expiry_date = normalize_date(leg.expiry)
 
-        suggestion = self.polygon_loader.find_closest_contract(
-            trade_date=trade_date,
-            strike=leg.strike,
-            expiry=expiry_date,
-            option_type=leg.option_type
-        )
+        # Nearest-contract searches are deterministic per day - run each once
+        trade_date = normalize_date(trade_date)
+        self._start_quote_day(trade_date)
+        contract = self._contract(leg, expiry_date)
+        if contract in self._day_snaps:
+            suggestion = self._day_snaps[contract]
+        else:
+            self.stats['snap_lookups'] += 1
+            suggestion = self.polygon_loader.find_closest_contract(
+                trade_date=trade_date,
+                strike=leg.strike,
+                expiry=expiry_date,
+                option_type=leg.option_type
+            )
+            self._day_snaps[contract] = suggestion
 
         if suggestion is None:
             return None
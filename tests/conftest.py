@@ -0,0 +1,169 @@
+"""
+Shared fixtures: small synthetic Polygon day_aggs files, a TradeSimulator run
+over them, and market data plus a fake profile runner for RotationEngine tests.
+
+Lets loader/cache tests run without the VelocityData drive mounted.
+"""
+
+import gzip
+import warnings
+import numpy as np
+import pytest
+import pandas as pd
+from datetime import date, timedelta
+
+
+RAW_COLUMNS = ['ticker', 'volume', 'open', 'close', 'high', 'low', 'window_start', 'transactions']
+
+SYNTHETIC_DATES = [date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 4)]
+
+
+def write_polygon_day(root, trade_date, rows):
+    """Write a Polygon-style day_aggs CSV.gz under root/YYYY/MM/."""
+    day_dir = root / str(trade_date.year) / f"{trade_date.month:02d}"
+    day_dir.mkdir(parents=True, exist_ok=True)
+    path = day_dir / f"{trade_date.isoformat()}.csv.gz"
+    df = pd.DataFrame(rows, columns=RAW_COLUMNS)
+    with gzip.open(path, 'wt') as f:
+        df.to_csv(f, index=False)
+    return path
+
+
+def synthetic_chain_rows(day_offset: int = 0):
+    """
+    SPY chain around 470 with two expiries, plus noise rows
+    (another underlying, a zero-volume quote, a zero-close quote).
+    """
+    rows = []
+    ts = 1704171600000000000 + day_offset * 86_400_000_000_000
+    for expiry in ['240119', '240315']:
+        for strike in [460, 465, 470, 475, 480]:
+            for opt in ['C', 'P']:
+                intrinsic = max(0, 470 - strike) if opt == 'C' else max(0, strike - 470)
+                close = round(intrinsic + 4.0 + (2.0 if expiry == '240315' else 0.0) + 0.1 * day_offset, 2)
+                rows.append([f"O:SPY{expiry}{opt}{strike * 1000:08d}", 100 + strike,
+                             close, close, close + 0.2, close - 0.2, ts, 10])
+    rows.append(['O:QQQ240119C00400000', 700, 2.0, 2.1, 2.2, 1.9, ts, 90])
+    rows.append(['O:SPY240119P00450000', 0, 1.0, 1.0, 1.0, 1.0, ts, 0])
+    rows.append(['O:SPY240119C00490000', 5, 0.0, 0.0, 0.0, 0.0, ts, 1])
+    return rows
+
+
+@pytest.fixture
+def polygon_day_root(tmp_path):
+    """Raw day_aggs root with three synthetic trading days."""
+    root = tmp_path / 'day_aggs'
+    for offset, trade_date in enumerate(SYNTHETIC_DATES):
+        write_polygon_day(root, trade_date, synthetic_chain_rows(offset))
+    return root
+
+
+def profile_market_data():
+    """60 days of underlying data and profile scores for RotationEngine tests."""
+    days = 60
+    rng = np.random.default_rng(7)
+    data = pd.DataFrame({
+        'date': [date(2024, 1, 1) + timedelta(days=i) for i in range(days)],
+        'close': 470.0 + np.cumsum(rng.normal(0, 2, days)),
+        'RV20': rng.uniform(0.1, 0.3, days),
+        'regime': (np.arange(days) % 5) + 1,
+        'label': [f"d{i}" for i in range(days)],
+    })
+    scores = pd.DataFrame({'date': data['date']})
+    for i in range(1, 7):
+        scores[f'profile_{i}_score'] = rng.uniform(0, 1, days)
+    return data, scores
+
+
+def fake_runner(data, profile_scores, score_threshold, regime_filter):
+    """Stand-in for a profile runner: cheap, deterministic, picklable."""
+    merged = data.merge(profile_scores, on='date')
+    active = merged['regime'].isin(regime_filter) & (merged.filter(like='_score').max(axis=1) > score_threshold)
+    results = pd.DataFrame({
+        'date': merged['date'],
+        'daily_pnl': np.where(active, merged['close'].diff().fillna(0.0), 0.0),
+        'label': merged['label'],
+    })
+    trades = merged.loc[active, ['date']]
+    return results, trades
+
+
+@pytest.fixture
+def fake_runners(monkeypatch):
+    """Replace RotationEngine's profile runners with fake_runner (mutable dict)."""
+    from src.backtest import engine as engine_module
+
+    runners = {f'profile_{i}': fake_runner for i in range(1, 7)}
+    monkeypatch.setattr(engine_module, 'PROFILE_RUNNERS', runners)
+    return runners
+
+
+def straddle_constructor(strike: float = 470.0, expiry: date = date(2024, 1, 19)):
+    """trade_constructor opening a 16-DTE straddle on the synthetic chain."""
+    from src.trading.trade import create_straddle_trade
+
+    def constructor(row, trade_id):
+        return create_straddle_trade(trade_id, 'Test', row['date'], strike, expiry, dte=16)
+    return constructor
+
+
+@pytest.fixture
+def synthetic_market_data():
+    """Underlying rows for SYNTHETIC_DATES (regime 2 on the last day)."""
+    return pd.DataFrame({
+        'date': SYNTHETIC_DATES,
+        'close': [470.0, 471.0, 469.5],
+        'RV20': [0.15, 0.15, 0.16],
+        'regime': [1, 1, 2],
+    })
+
+
+@pytest.fixture
+def synthetic_loader(polygon_day_root, tmp_path):
+    """Factory: loader (PolygonOptionsLoader or a subclass) on polygon_day_root with a private cache."""
+    from src.data.chain_cache import ChainCache
+    from src.data.polygon_options import PolygonOptionsLoader
+
+    def make(loader_class=None):
+        loader_class = loader_class or PolygonOptionsLoader
+        return loader_class(data_root=str(polygon_day_root), chain_store_root=str(tmp_path / 'none'),
+                            chain_cache=ChainCache())
+    return make
+
+
+@pytest.fixture
+def simulate_synthetic(synthetic_market_data, synthetic_loader):
+    """
+    Factory: run TradeSimulator over the synthetic days, returning (sim, results).
+
+    Defaults: a fresh loader (of loader_class if given), the default
+    SimulationConfig, entry signalled on the first day only, the 470 straddle
+    constructor and no custom exit.
+    """
+    from src.trading.simulator import SimulationConfig, TradeSimulator
+
+    def run(config=None, multi=False, loader=None, loader_class=None, entry_logic=None, trade_constructor=None,
+            exit_logic=None):
+        sim = TradeSimulator(synthetic_market_data.copy(), config=config or SimulationConfig(),
+                             polygon_loader=loader or synthetic_loader(loader_class))
+        simulate = sim.simulate_multi if multi else sim.simulate
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            results = simulate(
+                entry_logic=entry_logic or (lambda row, trades: row['date'] == SYNTHETIC_DATES[0]),
+                trade_constructor=trade_constructor or straddle_constructor(),
+                exit_logic=exit_logic
+            )
+        return sim, results
+    return run
+
+
+@pytest.fixture(autouse=True)
+def isolated_manifests(tmp_path_factory, monkeypatch):
+    """Keep coverage manifests out of the home directory and per-test."""
+    from src.data.manifest import reset_manifests
+
+    monkeypatch.setenv('DATA_MANIFEST_DIR', str(tmp_path_factory.mktemp('manifests')))
+    reset_manifests()
+    yield
+    reset_manifests()
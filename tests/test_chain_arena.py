@@ -0,0 +1,85 @@
+"""
+Test the shared chain arena: mapped day chains match parsed ones, are
+read-only, and are reported as shared rather than resident bytes.
+"""
+
+import pandas as pd
+import pytest
+from datetime import date
+
+from src.data.chain_arena import ChainArena
+from src.data.chain_cache import ChainCache
+from src.data.polygon_options import PolygonOptionsLoader
+
+from tests.conftest import SYNTHETIC_DATES
+
+
+EXPIRY = date(2024, 1, 19)
+
+
+def make_loader(polygon_day_root, tmp_path, arena=True):
+    return PolygonOptionsLoader(
+        data_root=str(polygon_day_root),
+        chain_store_root=str(tmp_path / 'none'),
+        chain_cache=ChainCache(),
+        chain_arena_root=str(tmp_path / ('arena' if arena else 'no_arena'))
+    )
+
+
+@pytest.fixture
+def arena_root(tmp_path):
+    root = tmp_path / 'arena'
+    root.mkdir()
+    return root
+
+
+def test_first_build_publishes_day(polygon_day_root, tmp_path, arena_root):
+    loader = make_loader(polygon_day_root, tmp_path)
+    loader.load_day(SYNTHETIC_DATES[0], spot_price=470.0)
+
+    assert ChainArena(str(arena_root)).list_dates() == [SYNTHETIC_DATES[0]]
+
+
+def test_mapped_chain_matches_parsed(polygon_day_root, tmp_path, arena_root):
+    """Loaders attached to the arena return exactly what a private parse returns."""
+    make_loader(polygon_day_root, tmp_path).load_day(SYNTHETIC_DATES[1], spot_price=470.0)
+
+    attached = make_loader(polygon_day_root, tmp_path)
+    private = make_loader(polygon_day_root, tmp_path, arena=False)
+    for trade_date in SYNTHETIC_DATES[:2]:
+        pd.testing.assert_frame_equal(
+            attached.load_day(trade_date, spot_price=470.0, rv_20=0.15),
+            private.load_day(trade_date, spot_price=470.0, rv_20=0.15)
+        )
+    assert attached.get_option_price(SYNTHETIC_DATES[1], 470.0, EXPIRY, 'call', spot_price=470.0) == \
+        private.get_option_price(SYNTHETIC_DATES[1], 470.0, EXPIRY, 'call', spot_price=470.0)
+
+
+def test_mapped_columns_are_shared_and_read_only(polygon_day_root, tmp_path, arena_root):
+    make_loader(polygon_day_root, tmp_path).load_day(SYNTHETIC_DATES[0], spot_price=470.0)
+    loader = make_loader(polygon_day_root, tmp_path)
+
+    day_chain = loader._load_day_chain(SYNTHETIC_DATES[0])
+    frame = day_chain.frame
+    close = frame['close'].to_numpy()
+    assert not close.flags.writeable
+    with pytest.raises(ValueError):
+        close[0] = -1.0
+
+    stats = loader.cache_stats()
+    assert stats['shared_bytes'] > 0
+    assert stats['resident_bytes'] == stats['bytes']
+
+    assert stats['shared_bytes'] == day_chain.shared_nbytes
+
+    # The mapped day holds less private memory than a parsed one
+    private = make_loader(polygon_day_root, tmp_path, arena=False)
+    private_chain = private._load_day_chain(SYNTHETIC_DATES[0])
+    assert private_chain.shared_nbytes == 0
+    assert day_chain.nbytes < private_chain.nbytes
+
+
+def test_empty_day_not_published(polygon_day_root, tmp_path, arena_root):
+    loader = make_loader(polygon_day_root, tmp_path)
+    assert loader.load_day(SYNTHETIC_DATES[0].replace(day=5)).empty
+    assert ChainArena(str(arena_root)).list_dates() == []
@@ -0,0 +1,228 @@
+"""
+Test shared chain cache: LRU byte budget, counters, sharing across loaders.
+"""
+
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import date
+
+from src.data.chain_cache import ChainCache, freeze_frame, get_shared_chain_cache, set_shared_chain_cache
+from src.data.polygon_options import PolygonOptionsLoader
+from src.trading.simulator import TradeSimulator
+
+
+TRADE_DATES = [date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 4)]
+
+
+def test_lru_eviction_by_bytes():
+    """Least recently used entries are evicted once the byte budget is exceeded."""
+    cache = ChainCache(max_bytes=250)
+    cache.put('a', np.zeros(10), nbytes=100)
+    cache.put('b', np.zeros(10), nbytes=100)
+
+    assert cache.get('a') is not None  # 'a' now most recently used
+    cache.put('c', np.zeros(10), nbytes=100)
+
+    assert 'b' not in cache
+    assert 'a' in cache and 'c' in cache
+    stats = cache.stats()
+    assert stats['evictions'] == 1
+    assert stats['bytes'] == 200
+    assert stats['hits'] == 1
+
+
+def test_oversized_entry_is_kept():
+    """A single entry larger than the budget still caches (evicting everything else)."""
+    cache = ChainCache(max_bytes=50)
+    cache.put('small', 1, nbytes=10)
+    cache.put('big', 2, nbytes=100)
+
+    assert 'big' in cache
+    assert 'small' not in cache
+
+
+def test_counters():
+    cache = ChainCache()
+    calls = []
+
+    def load():
+        calls.append(1)
+        return pd.DataFrame({'x': [1, 2, 3]})
+
+    cache.get_or_load('k', load)
+    cache.get_or_load('k', load)
+    cache.get_or_load('k', load)
+
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert stats['misses'] == 1
+    assert stats['hits'] == 2
+    assert stats['bytes'] > 0
+
+
+def test_concurrent_get_or_load_loads_once():
+    cache = ChainCache()
+    calls = []
+
+    def load():
+        calls.append(threading.get_ident())
+        time.sleep(0.05)
+        return np.zeros(10)
+
+    results = [None] * 4
+
+    def worker(i):
+        results[i] = cache.get_or_load('day', load)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert cache.get('day') is results[0]
+
+
+def test_failed_load_not_cached():
+    cache = ChainCache()
+
+    def fail():
+        raise OSError("disk gone")
+
+    with pytest.raises(OSError):
+        cache.get_or_load('day', fail)
+    assert cache.get_or_load('day', lambda: 1) == 1
+
+
+def test_loaders_share_parsed_days(polygon_day_root, tmp_path):
+    """Two loaders on one cache parse each day once."""
+    cache = ChainCache()
+    kwargs = dict(data_root=str(polygon_day_root), chain_store_root=str(tmp_path / 'none'), chain_cache=cache)
+    first = PolygonOptionsLoader(**kwargs)
+    second = PolygonOptionsLoader(**kwargs)
+
+    for trade_date in TRADE_DATES:
+        first.load_day(trade_date, spot_price=470.0)
+        second.load_day(trade_date, spot_price=470.0)
+
+    # One indexed chain per date, built once; the parsed day is not cached beside it
+    stats = cache.stats()
+    assert stats['misses'] == len(TRADE_DATES)
+    assert stats['hits'] == len(TRADE_DATES)
+    assert stats['entries'] == len(TRADE_DATES)
+    assert ('day_aggs', str(polygon_day_root), TRADE_DATES[0], 'SPY') not in cache
+
+
+def test_shared_cache_is_default(polygon_day_root, tmp_path):
+    """Loaders and simulators without an explicit cache use the process-wide one."""
+    shared = ChainCache()
+    set_shared_chain_cache(shared)
+    try:
+        loader = PolygonOptionsLoader(data_root=str(polygon_day_root), chain_store_root=str(tmp_path / 'none'))
+        assert loader.chain_cache is shared
+        assert get_shared_chain_cache() is shared
+
+        data = pd.DataFrame({'date': TRADE_DATES, 'close': [470.0, 471.0, 472.0]})
+        sim = TradeSimulator(data, polygon_data_root=str(polygon_day_root))
+        assert sim.polygon_loader.chain_cache is shared
+
+        injected = TradeSimulator(data, polygon_loader=loader)
+        assert injected.polygon_loader is loader
+    finally:
+        set_shared_chain_cache(None)
+
+
+def test_clear_cache_drops_loader_entries(polygon_day_root, tmp_path):
+    cache = ChainCache()
+    loader = PolygonOptionsLoader(data_root=str(polygon_day_root), chain_store_root=str(tmp_path / 'none'),
+                                  chain_cache=cache)
+    loader.load_day(TRADE_DATES[0], spot_price=470.0)
+    cache.put('unrelated', 1, nbytes=1)
+
+    loader.clear_cache()
+
+    assert len(cache) == 1
+    assert 'unrelated' in cache
+
+
+def test_freeze_frame():
+    """Frozen frames reject in-place writes; whole-column changes on a shallow view are allowed."""
+    frame = freeze_frame(pd.DataFrame({'close': [1.0, 2.0], 'volume': [10, 20]}))
+
+    with pytest.raises(ValueError):
+        frame.loc[0, 'close'] = -1.0
+
+    view = frame.copy(deep=False)
+    view['close'] = 0.0
+    assert frame['close'].tolist() == [1.0, 2.0]
+
+
+def test_cached_frames_are_read_only(polygon_day_root, tmp_path):
+    """Cached chains are frozen and returned as zero-copy views that cannot write through."""
+    cache = ChainCache()
+    loader = PolygonOptionsLoader(data_root=str(polygon_day_root), chain_store_root=str(tmp_path / 'none'),
+                                  chain_cache=cache)
+    cached = loader._load_day_chain(TRADE_DATES[0]).frame
+
+    df = loader.load_day(TRADE_DATES[0], spot_price=470.0)
+    assert np.shares_memory(df['close'].to_numpy(), cached['close'].to_numpy())
+
+    # In-place writes on the view either raise (read-only) or copy first (copy-on-write)
+    try:
+        df.loc[0, 'strike'] = -1.0
+    except ValueError:
+        pass
+    df['close'] = 0.0
+    df['extra'] = 1
+
+    again = loader.load_day(TRADE_DATES[0], spot_price=470.0)
+    assert (again['strike'] > 0).all()
+    assert (again['close'] > 0).any()
+    assert 'extra' not in again.columns
+
+
+def test_get_chain_matches_sequential_filters(polygon_day_root, tmp_path):
+    """Single-mask get_chain returns the rows the chained filters used to."""
+    loader = PolygonOptionsLoader(data_root=str(polygon_day_root), chain_store_root=str(tmp_path / 'none'),
+                                  chain_cache=ChainCache())
+    df = loader.load_day(TRADE_DATES[0], spot_price=470.0)
+
+    expected = df[df['expiry'] == date(2024, 1, 19)]
+    expected = expected[expected['dte'] >= 10]
+    expected = expected[(expected['close'] > 0) & (expected['bid'] > 0) & (expected['ask'] > 0)
+                        & (expected['ask'] >= expected['bid']) & (expected['volume'] > 0)]
+
+    chain = loader.get_chain(TRADE_DATES[0], expiry=date(2024, 1, 19), min_dte=10, spot_price=470.0)
+
+    assert len(chain) == 10
+    pd.testing.assert_frame_equal(chain, expected)
+
+
+def test_sibling_underlyings_cached_from_one_read(polygon_day_root, tmp_path, monkeypatch):
+    """A raw read for SPY also caches the other extracted underlyings for the same day."""
+    cache = ChainCache()
+    spy = PolygonOptionsLoader(data_root=str(polygon_day_root), chain_store_root=str(tmp_path / 'none'),
+                               chain_cache=cache, extract_underlyings=['QQQ'])
+    qqq = PolygonOptionsLoader(data_root=str(polygon_day_root), chain_store_root=str(tmp_path / 'none'),
+                               chain_cache=cache, underlying='QQQ')
+
+    assert len(spy.load_day(TRADE_DATES[0], spot_price=470.0)) > 0
+    assert ('day_aggs', str(polygon_day_root), TRADE_DATES[0], 'QQQ') in cache
+
+    def fail(*args, **kwargs):
+        raise AssertionError("raw file read twice")
+    monkeypatch.setattr(PolygonOptionsLoader, '_read_raw_file', staticmethod(fail))
+
+    chain = qqq.load_day(TRADE_DATES[0], spot_price=400.0)
+    assert list(chain['strike']) == [400.0]
+    # Building QQQ's chain took its parsed day out of the cache
+    assert ('day_aggs', str(polygon_day_root), TRADE_DATES[0], 'QQQ') not in cache
+
+    spy.clear_cache()
+    assert ('day_chain', str(polygon_day_root), TRADE_DATES[0], 'QQQ') in cache
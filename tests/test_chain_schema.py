@@ -0,0 +1,67 @@
+"""
+Test the compact chain schema and its expansion at the loader API edge.
+"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from src.data.chain_cache import ChainCache
+from src.data.chain_schema import chain_day_ordinals, chain_strikes, compact_chain, expand_chain
+from src.data.polygon_options import PolygonOptionsLoader
+
+
+TRADE_DATE = date(2024, 1, 2)
+
+
+def test_round_trip(polygon_day_root, tmp_path):
+    loader = PolygonOptionsLoader(data_root=str(polygon_day_root), chain_store_root=str(tmp_path / 'none'))
+    raw = loader.read_raw_day(TRADE_DATE)
+
+    compact = compact_chain(raw)
+    assert isinstance(compact['expiry'].dtype, pd.CategoricalDtype)
+    assert isinstance(compact['option_type'].dtype, pd.CategoricalDtype)
+    assert compact['strike_cents'].dtype == np.int32
+    assert compact['volume'].dtype == np.int32
+    assert compact_chain(compact).equals(compact)
+
+    expanded = expand_chain(compact)
+    assert list(expanded.columns) == list(raw.columns)
+    pd.testing.assert_frame_equal(expanded, raw, check_dtype=False)
+    assert expanded['expiry'].iloc[0] == date(2024, 1, 19)
+    assert isinstance(expanded['strike'].iloc[0], float)
+
+    np.testing.assert_array_equal(chain_strikes(compact), raw['strike'].to_numpy())
+    np.testing.assert_array_equal(chain_day_ordinals(compact['expiry']),
+                                  [d.toordinal() for d in raw['expiry']])
+
+
+def test_float32_prices_optional(polygon_day_root, tmp_path):
+    loader = PolygonOptionsLoader(data_root=str(polygon_day_root), chain_store_root=str(tmp_path / 'none'))
+    raw = loader.read_raw_day(TRADE_DATE)
+
+    compact = compact_chain(raw, float32_prices=True)
+    assert compact['close'].dtype == np.float32
+    expanded = expand_chain(compact)
+    assert expanded['close'].dtype == np.float64
+    np.testing.assert_allclose(expanded['close'], raw['close'], rtol=1e-6)
+
+
+def test_cached_day_is_smaller(polygon_day_root, tmp_path):
+    """The cached chain is several times smaller than the object-column layout it replaces."""
+    loader = PolygonOptionsLoader(data_root=str(polygon_day_root), chain_store_root=str(tmp_path / 'none'),
+                                  chain_cache=ChainCache())
+    cached = loader._load_day_chain(TRADE_DATE).frame
+    expanded = expand_chain(cached)
+
+    # Scale up so per-column overhead (category tables, index) doesn't dominate
+    big_cached = pd.concat([cached] * 200, ignore_index=True)
+    big_expanded = pd.concat([expanded] * 200, ignore_index=True)
+    compact_bytes = big_cached.memory_usage(deep=True).sum()
+    expanded_bytes = big_expanded.memory_usage(deep=True).sum()
+    assert expanded_bytes > 2.5 * compact_bytes
+
+    day = loader.load_day(TRADE_DATE, spot_price=470.0)
+    assert day['strike'].dtype == np.float64
+    assert day['expiry'].dtype == object
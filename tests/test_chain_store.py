@@ -0,0 +1,156 @@
+"""
+Test columnar options chain store.
+
+Uses synthetic Polygon day_aggs files (tests/conftest.py) so it runs without the data drive.
+"""
+
+import pyarrow.parquet as pq
+import pytest
+import pandas as pd
+from datetime import date
+
+from src.data.chain_cache import ChainCache
+from src.data.chain_store import CHAIN_STORE_SORT_KEYS, OptionsChainStore
+from src.data.polygon_options import PolygonOptionsLoader
+
+
+TRADE_DATE = date(2024, 1, 2)
+
+
+def by_contract(df):
+    """Rows in store order (partitions are sorted by expiry, type, strike)."""
+    return df.sort_values(CHAIN_STORE_SORT_KEYS, kind='stable').reset_index(drop=True)
+
+
+def test_store_round_trip(polygon_day_root, tmp_path):
+    """Ingested partition matches the raw CSV parse."""
+    store_root = tmp_path / 'store'
+    loader = PolygonOptionsLoader(data_root=str(polygon_day_root), chain_store_root=str(store_root))
+
+    raw = loader.read_raw_day(TRADE_DATE)
+    assert len(raw) == 22  # QQQ dropped
+    assert (raw['underlying'] == 'SPY').all()
+
+    store = OptionsChainStore(str(store_root))
+    store.write_day(TRADE_DATE, raw)
+    assert store.has_day(TRADE_DATE)
+    assert store.list_dates() == [TRADE_DATE]
+
+    stored = store.read_day(TRADE_DATE)
+    pd.testing.assert_frame_equal(
+        stored[raw.columns].reset_index(drop=True),
+        by_contract(raw),
+        check_dtype=False
+    )
+
+
+def test_loader_reads_store_transparently(polygon_day_root, tmp_path):
+    """load_day returns the same chain from the store as from raw CSV."""
+    store_root = tmp_path / 'store'
+    loader = PolygonOptionsLoader(data_root=str(polygon_day_root), chain_store_root=str(store_root))
+    from_raw = loader.load_day(TRADE_DATE, spot_price=472.0, rv_20=0.15)
+
+    OptionsChainStore(str(store_root)).write_day(TRADE_DATE, loader.read_raw_day(TRADE_DATE))
+
+    # Remove raw file - loader must now serve from the store
+    for path in polygon_day_root.rglob('*.csv.gz'):
+        path.unlink()
+
+    loader = PolygonOptionsLoader(data_root=str(polygon_day_root), chain_store_root=str(store_root))
+    from_store = loader.load_day(TRADE_DATE, spot_price=472.0, rv_20=0.15)
+
+    pd.testing.assert_frame_equal(by_contract(from_store), by_contract(from_raw), check_dtype=False)
+
+
+def test_missing_partition_falls_back_to_raw(polygon_day_root, tmp_path):
+    """Days without a partition are parsed from the raw CSV.gz."""
+    store_root = tmp_path / 'store'
+    store_root.mkdir()
+    loader = PolygonOptionsLoader(data_root=str(polygon_day_root), chain_store_root=str(store_root))
+
+    assert not loader.chain_store.has_day(TRADE_DATE)
+    df = loader.load_day(TRADE_DATE, spot_price=472.0)
+    assert len(df) == 22
+    assert set(df['option_type']) == {'call', 'put'}
+
+
+def test_empty_day_partition(tmp_path):
+    """Empty partitions are written and read back as empty chains."""
+    store = OptionsChainStore(str(tmp_path / 'store'))
+    store.write_day(TRADE_DATE, pd.DataFrame())
+
+    df = store.read_day(TRADE_DATE)
+    assert df is not None
+    assert df.empty
+
+
+def reference_chain(df, option_type=None, min_dte=None, max_dte=None, lo=None, hi=None, min_volume=None):
+    """Reference: boolean filters over the full load_day frame."""
+    keep = (df['close'] > 0) & (df['bid'] > 0) & (df['ask'] > 0) & (df['ask'] >= df['bid']) & (df['volume'] > 0)
+    if option_type is not None:
+        keep &= df['option_type'] == option_type
+    if min_dte is not None:
+        keep &= df['dte'] >= min_dte
+    if max_dte is not None:
+        keep &= df['dte'] <= max_dte
+    if lo is not None:
+        keep &= df['strike'] >= lo
+    if hi is not None:
+        keep &= df['strike'] <= hi
+    if min_volume is not None:
+        keep &= df['volume'] >= min_volume
+    return df[keep].reset_index(drop=True)
+
+
+@pytest.mark.parametrize('cached', [True, False])
+def test_get_chain_pushdown(polygon_day_root, tmp_path, cached):
+    """Predicates give the same rows from the cached day and from a pruned store read."""
+    store_root = tmp_path / 'store'
+    loader = PolygonOptionsLoader(data_root=str(polygon_day_root), chain_store_root=str(store_root),
+                                  chain_cache=ChainCache())
+    OptionsChainStore(str(store_root), row_group_size=4).write_day(TRADE_DATE, loader.read_raw_day(TRADE_DATE))
+
+    reference_loader = PolygonOptionsLoader(data_root=str(polygon_day_root), chain_store_root=str(tmp_path / 'none'),
+                                            chain_cache=ChainCache())
+    full = reference_loader.load_day(TRADE_DATE, spot_price=470.0)
+    if cached:
+        loader.load_day(TRADE_DATE, spot_price=470.0)
+
+    chain = loader.get_chain(TRADE_DATE, option_type='put', min_dte=10, max_dte=30,
+                             max_moneyness=0.015, min_volume=570, spot_price=470.0)
+    expected = reference_chain(full, 'put', 10, 30, 470.0 * 0.985, 470.0 * 1.015, 570)
+    assert len(expected) == 2
+    pd.testing.assert_frame_equal(by_contract(chain), by_contract(expected), check_dtype=False)
+
+    wide = loader.get_chain(TRADE_DATE, min_dte=30, spot_price=470.0)
+    pd.testing.assert_frame_equal(by_contract(wide), by_contract(reference_chain(full, min_dte=30)),
+                                  check_dtype=False)
+
+    # A pushed-down read does not populate the day cache with a partial chain
+    assert loader._day_chain_cached(TRADE_DATE) == cached
+
+
+def test_partition_sorted_for_pruning(polygon_day_root, tmp_path):
+    """Rows are written in contract order, so one expiry touches few row groups."""
+    loader = PolygonOptionsLoader(data_root=str(polygon_day_root), chain_store_root=str(tmp_path / 'none'))
+    raw = loader.read_raw_day(TRADE_DATE)
+    shuffled = raw.sample(frac=1.0, random_state=0)
+
+    store = OptionsChainStore(str(tmp_path / 'store'), row_group_size=4)
+    path = store.write_day(TRADE_DATE, shuffled)
+
+    stored = store.read_day(TRADE_DATE)
+    pd.testing.assert_frame_equal(stored[raw.columns], by_contract(raw), check_dtype=False)
+
+    metadata = pq.ParquetFile(path).metadata
+    expiry_column = metadata.schema.to_arrow_schema().get_field_index('expiry')
+    expiry = stored['expiry'].iloc[0]
+    touched = 0
+    for i in range(metadata.num_row_groups):
+        stats = metadata.row_group(i).column(expiry_column).statistics
+        touched += stats.min <= expiry <= stats.max
+    assert touched < metadata.num_row_groups
+
+    one_expiry = store.read_day(TRADE_DATE, filters=[('expiry', '==', expiry)])
+    assert (one_expiry['expiry'] == expiry).all()
+    assert len(one_expiry) == (raw['expiry'] == expiry).sum()
@@ -0,0 +1,161 @@
+"""
+Test checkpoint / resume: a run interrupted after a checkpoint and rerun
+produces the same results as an uninterrupted run, for TradeSimulator and for
+RotationEngine profile backtests.
+"""
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import date, timedelta
+
+from src.backtest.engine import RotationEngine
+from src.trading.simulator import SimulationConfig, TradeSimulator
+from src.trading.trade import create_straddle_trade
+
+from tests.conftest import fake_runner, profile_market_data
+
+
+DAYS = 60
+
+
+class Crash(Exception):
+    pass
+
+
+def _data():
+    rng = np.random.default_rng(11)
+    return pd.DataFrame({
+        'date': pd.to_datetime([date(2024, 1, 1) + timedelta(days=i) for i in range(DAYS)]),
+        'close': 470.0 + np.cumsum(rng.normal(0, 3, DAYS)),
+        'RV20': rng.uniform(0.1, 0.3, DAYS),
+        'regime': (np.arange(DAYS) % 5) + 1,
+    })
+
+
+def _simulate(tmp_path, multi, checkpoint=True, crash_at=None, probability=0.3):
+    config = SimulationConfig(
+        allow_toy_pricing=True,
+        checkpoint_dir=str(tmp_path / 'ckpt') if checkpoint else None,
+        checkpoint_every=7,
+        max_open_trades=3
+    )
+    sim = TradeSimulator(_data(), config=config, use_real_options_data=False)
+
+    days_seen = []
+    sim.days_seen = days_seen
+
+    def crash_check(row):
+        days_seen.append(row['date'])
+        if crash_at is not None and row['date'] == _data()['date'][crash_at]:
+            raise Crash()
+
+    def entry(row, trades):
+        crash_check(row)
+        # Callbacks drawing from the global RNG resume from the saved state
+        return np.random.random() < probability
+
+    def constructor(row, trade_id):
+        expiry = row['date'] + timedelta(days=30)
+        return create_straddle_trade(trade_id, 'Test', row['date'], round(row['close']), expiry, dte=30)
+
+    def exit_logic(row, trade):
+        crash_check(row)
+        return row['regime'] == 4
+
+    np.random.seed(3)
+    run = sim.simulate_multi if multi else sim.simulate
+    results = run(entry_logic=entry, trade_constructor=constructor, exit_logic=exit_logic, profile_name='P',
+                  checkpoint_key={'probability': probability})
+    return sim, results
+
+
+@pytest.mark.parametrize('multi', [False, True])
+def test_resumed_run_identical(tmp_path, multi):
+    reference_sim, reference = _simulate(tmp_path, multi, checkpoint=False)
+    assert len(reference_sim.trades) > 3
+
+    with pytest.raises(Crash):
+        _simulate(tmp_path, multi, crash_at=45)
+    assert len(list((tmp_path / 'ckpt').glob('*.ckpt'))) == 1
+
+    resumed_sim, resumed = _simulate(tmp_path, multi)
+
+    assert pickle.dumps(resumed) == pickle.dumps(reference)
+    pd.testing.assert_frame_equal(resumed_sim.get_trade_summary(), reference_sim.get_trade_summary())
+    assert resumed_sim.trade_counter == reference_sim.trade_counter
+    # Completed runs remove their checkpoint
+    assert list((tmp_path / 'ckpt').glob('*.ckpt')) == []
+
+
+def test_checkpoint_ignored_for_different_data(tmp_path):
+    with pytest.raises(Crash):
+        _simulate(tmp_path, multi=False, crash_at=45)
+
+    config = SimulationConfig(allow_toy_pricing=True, checkpoint_dir=str(tmp_path / 'ckpt'), checkpoint_every=7)
+    data = _data()
+    data.loc[3, 'close'] += 1.0
+    sim = TradeSimulator(data, config=config, use_real_options_data=False)
+    assert sim._open_checkpoint('simulate', 'P').load() is None
+
+
+@pytest.mark.parametrize('multi', [False, True])
+def test_changed_parameters_start_fresh(tmp_path, multi):
+    reference_sim, reference = _simulate(tmp_path, multi, checkpoint=False, probability=0.5)
+
+    with pytest.raises(Crash):
+        _simulate(tmp_path, multi, crash_at=45, probability=0.3)
+
+    fresh_sim, fresh = _simulate(tmp_path, multi, probability=0.5)
+
+    assert pickle.dumps(fresh) == pickle.dumps(reference)
+    assert fresh_sim.trade_counter == reference_sim.trade_counter
+
+
+def test_runs_sharing_directory_both_resume(tmp_path):
+    """A parameter sweep's runs keep each other's checkpoints."""
+    probabilities = [0.3, 0.5]
+    references = {p: _simulate(tmp_path, multi=False, checkpoint=False, probability=p)[1] for p in probabilities}
+
+    for p in probabilities:
+        with pytest.raises(Crash):
+            _simulate(tmp_path, multi=False, crash_at=45, probability=p)
+    assert len(list((tmp_path / 'ckpt').glob('*.ckpt'))) == 2
+
+    for p in probabilities:
+        resumed_sim, resumed = _simulate(tmp_path, multi=False, probability=p)
+        assert pickle.dumps(resumed) == pickle.dumps(references[p])
+        # Picked up after the last checkpoint before the crash, not from day 0
+        assert min(resumed_sim.days_seen) == _data()['date'][42]
+    assert list((tmp_path / 'ckpt').glob('*.ckpt')) == []
+
+
+def test_engine_resumes_completed_profiles(tmp_path, fake_runners):
+    calls = []
+
+    def counting_runner(**kwargs):
+        calls.append(kwargs['score_threshold'])
+        return fake_runner(**kwargs)
+
+    def failing_runner(**kwargs):
+        raise ValueError("crash")
+
+    runners = fake_runners
+    runners.update({name: counting_runner for name in runners})
+    data, scores = profile_market_data()
+    reference = RotationEngine()._run_profile_backtests(data, scores)
+
+    runners['profile_4'] = failing_runner
+    with pytest.raises(RuntimeError):
+        RotationEngine(checkpoint_dir=str(tmp_path))._run_profile_backtests(data, scores)
+
+    runners['profile_4'] = counting_runner
+    calls.clear()
+    resumed = RotationEngine(checkpoint_dir=str(tmp_path))._run_profile_backtests(data, scores)
+
+    assert len(calls) == 3  # profiles 1-3 restored
+    assert list(resumed) == list(reference)
+    for name in reference:
+        pd.testing.assert_frame_equal(resumed[name], reference[name])
@@ -0,0 +1,194 @@
+"""
+Test O(1) contract lookup index against the boolean-mask scan it replaces.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import date, datetime
+
+from src.data.chain_cache import ChainCache
+from src.data.contract_index import ContractIndex, contract_key
+from src.data.polygon_options import PolygonOptionsLoader
+
+
+TRADE_DATE = date(2024, 1, 2)
+SPOT = 470.0
+
+
+def mask_scan_price(df, strike, expiry, option_type, price_type, filter_garbage=True):
+    """Reference: the pre-index lookup logic."""
+    if filter_garbage:
+        df = df[(df['close'] > 0) & (df['bid'] > 0) & (df['ask'] > 0)
+                & (df['ask'] >= df['bid']) & (df['volume'] > 0)]
+    mask = (
+        (np.abs(df['strike'] - strike) < 0.01)
+        & (df['expiry'] == expiry)
+        & (df['option_type'] == option_type)
+    )
+    matches = df[mask]
+    if len(matches) == 0:
+        return None
+    return float(matches.iloc[0][price_type])
+
+
+@pytest.fixture
+def loader(polygon_day_root, tmp_path):
+    return PolygonOptionsLoader(data_root=str(polygon_day_root), chain_store_root=str(tmp_path / 'none'))
+
+
+def test_single_lookup_matches_mask_scan(loader):
+    """Every contract in the chain resolves to the same price as a mask scan."""
+    df = loader.load_day(TRADE_DATE, spot_price=SPOT, rv_20=0.15)
+
+    for _, row in df.iterrows():
+        for price_type in ['bid', 'ask', 'mid', 'close']:
+            expected = mask_scan_price(df, row['strike'], row['expiry'], row['option_type'], price_type)
+            actual = loader.get_option_price(
+                TRADE_DATE, row['strike'], row['expiry'], row['option_type'],
+                price_type=price_type, spot_price=SPOT, rv_20=0.15
+            )
+            assert actual == expected
+
+
+def test_garbage_quotes_excluded(loader):
+    """Zero-volume and zero-close contracts are not returned by single lookups."""
+    zero_volume = loader.get_option_price(TRADE_DATE, 450.0, date(2024, 1, 19), 'put', spot_price=SPOT)
+    zero_close = loader.get_option_price(TRADE_DATE, 490.0, date(2024, 1, 19), 'call', spot_price=SPOT)
+
+    assert zero_volume is None
+    assert zero_close is None
+
+
+def test_quote_returns_all_prices(loader):
+    """One lookup returns bid/ask/mid/close together."""
+    quote = loader.get_option_quote(TRADE_DATE, 470.0, date(2024, 1, 19), 'call', spot_price=SPOT)
+
+    assert quote is not None
+    assert quote['bid'] < quote['mid'] < quote['ask']
+    assert quote['close'] == quote['mid']
+    assert quote['expiry'] == date(2024, 1, 19)
+    assert quote['option_type'] == 'call'
+
+
+def test_sub_cent_strike_and_datetime_expiry(loader):
+    """Strike float noise and datetime expiries resolve to the same contract."""
+    base = loader.get_option_quote(TRADE_DATE, 465.0, date(2024, 3, 15), 'put', spot_price=SPOT)
+    noisy = loader.get_option_quote(TRADE_DATE, 465.0000001, datetime(2024, 3, 15), 'put', spot_price=SPOT)
+
+    assert base == noisy
+
+
+def test_bulk_lookup(loader):
+    """Bulk quotes and prices agree with single lookups; missing contracts omitted."""
+    contracts = [
+        (470.0, date(2024, 1, 19), 'call'),
+        (475.0, date(2024, 3, 15), 'put'),
+        (999.0, date(2024, 1, 19), 'call'),
+    ]
+    quotes = loader.get_option_quotes_bulk(TRADE_DATE, contracts, spot_price=SPOT)
+    prices = loader.get_option_prices_bulk(TRADE_DATE, contracts, price_type='ask', spot_price=SPOT)
+
+    assert len(quotes) == 2
+    assert len(prices) == 2
+    for contract in contracts[:2]:
+        single = loader.get_option_price(TRADE_DATE, *contract, price_type='ask', spot_price=SPOT)
+        assert prices[contract] == single
+        assert quotes[contract]['ask'] == single
+
+
+def test_index_built_once_per_day(loader):
+    """Index is cached next to the loaded day."""
+    first = loader.get_contract_index(TRADE_DATE)
+    loader.load_day(TRADE_DATE, spot_price=SPOT + 5.0)
+    second = loader.get_contract_index(TRADE_DATE)
+    assert first is second
+
+
+def test_spot_inputs_share_parsed_chain(polygon_day_root, tmp_path):
+    """Different spot/RV inputs reuse one parsed chain; only small overlays multiply."""
+    cache = ChainCache()
+    loader = PolygonOptionsLoader(data_root=str(polygon_day_root), chain_store_root=str(tmp_path / 'none'),
+                                  chain_cache=cache)
+    loader.overlay_cache_size = 4
+
+    frames = [loader.load_day(TRADE_DATE, spot_price=460.0 + i, rv_20=0.15) for i in range(10)]
+
+    stats = cache.stats()
+    assert stats['misses'] == 1  # indexed chain, built once (the parsed day is not kept)
+    assert stats['entries'] == 1
+    assert len(loader._overlay_cache) == 4
+
+    # Spot changes the modeled spread, not the chain
+    assert not frames[0]['bid'].equals(frames[9]['bid'])
+    pd.testing.assert_series_equal(frames[0]['mid'], frames[9]['mid'])
+
+
+def test_overlay_matches_per_row_spread_model(loader):
+    """Overlay bid/ask equal the ExecutionModel applied row by row."""
+    from src.trading.execution import calculate_moneyness, get_vix_proxy
+
+    df = loader.load_day(TRADE_DATE, spot_price=SPOT, rv_20=0.25)
+    for _, row in df.iterrows():
+        spread = loader.execution_model.get_spread(
+            row['mid'], calculate_moneyness(row['strike'], SPOT), row['dte'], get_vix_proxy(0.25)
+        )
+        assert row['bid'] == pytest.approx(max(row['mid'] - spread / 2, 0.005))
+        assert row['ask'] == pytest.approx(row['mid'] + spread / 2)
+
+
+def test_empty_index():
+    index = ContractIndex(pd.DataFrame())
+    assert index.find(470.0, date(2024, 1, 19), 'call') is None
+    assert contract_key(470.0, date(2024, 1, 19), 'straddle') is None
+
+
+def sort_scan_closest(df, strike, expiry, option_type, max_expiry_diff=90, max_strike_diff=500.0):
+    """Reference: the pre-index find_closest_contract (stable sort of the whole subset)."""
+    subset = df[df['option_type'] == option_type].copy()
+    if subset.empty:
+        return None
+    subset['expiry_date'] = pd.to_datetime(subset['expiry']).dt.date
+    subset['expiry_diff'] = subset['expiry_date'].apply(lambda d: abs((d - expiry).days))
+    subset['strike_diff'] = (subset['strike'] - strike).abs()
+    best = subset.sort_values(['expiry_diff', 'strike_diff']).iloc[0]
+    if best['expiry_diff'] > max_expiry_diff or best['strike_diff'] > max_strike_diff:
+        return None
+    return {'strike': float(best['strike']), 'expiry': best['expiry_date'],
+            'bid': float(best['bid']), 'ask': float(best['ask']), 'mid': float(best['mid'])}
+
+
+def test_closest_contract_matches_sort_scan(loader):
+    df = loader.load_day(TRADE_DATE, spot_price=SPOT)
+    targets = [
+        (470.0, date(2024, 1, 19)),   # exact
+        (467.5, date(2024, 1, 19)),   # strike tie between 465 and 470
+        (472.4, date(2024, 2, 16)),   # expiry tie (28 days either side)
+        (430.0, date(2024, 6, 21)),   # beyond strikes and expiries
+        (500.0, date(2023, 12, 1)),
+    ]
+    for strike, expiry in targets:
+        for option_type in ['call', 'put']:
+            expected = sort_scan_closest(df, strike, expiry, option_type)
+            result = loader.find_closest_contract(TRADE_DATE, strike, expiry, option_type, spot_price=SPOT)
+            assert result == expected, (strike, expiry, option_type)
+
+    assert loader.find_closest_contract(TRADE_DATE, 470.0, date(2024, 1, 19), 'call', max_strike_diff=1.0) is not None
+    assert loader.find_closest_contract(TRADE_DATE, 530.0, date(2024, 1, 19), 'call', max_strike_diff=10.0) is None
+    assert loader.find_closest_contract(TRADE_DATE, 470.0, date(2025, 1, 17), 'call', max_expiry_diff=30) is None
+
+
+def test_nearest_tie_breaking_on_duplicates():
+    """Equal (expiry_diff, strike_diff) candidates resolve to the earliest row."""
+    df = pd.DataFrame({
+        'strike': [470.0, 465.0, 475.0, 465.0, 470.0],
+        'expiry': [date(2024, 1, 26), date(2024, 1, 12), date(2024, 1, 12), date(2024, 1, 12), date(2024, 1, 26)],
+        'option_type': ['call'] * 5,
+        'close': 1.0, 'mid': 1.0, 'volume': 1.0,
+    })
+    index = ContractIndex(df)
+    # Jan 12 and Jan 26 are both 7 days from Jan 19; strike 470 ties 465/475 on Jan 12
+    assert index.nearest(470.0, date(2024, 1, 19), 'call') == (0, 7, 0.0)
+    assert index.nearest(468.0, date(2024, 1, 12), 'call') == (1, 0, 3.0)
+    assert index.nearest(470.0, date(2024, 1, 12), 'call') == (1, 0, 5.0)
+    assert index.nearest(470.0, date(2024, 1, 12), 'put') is None
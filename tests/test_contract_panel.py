@@ -0,0 +1,85 @@
+"""
+Test per-contract time-series panel against per-day chain lookups.
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import date
+
+from src.analysis.trade_tracker import TradeTracker
+from src.data.chain_cache import ChainCache
+from src.data.contract_panel import ContractPanel
+from src.data.polygon_options import PolygonOptionsLoader
+
+from tests.conftest import SYNTHETIC_DATES
+
+
+EXPIRY = date(2024, 1, 19)
+
+
+@pytest.fixture
+def loader(polygon_day_root, tmp_path):
+    return PolygonOptionsLoader(data_root=str(polygon_day_root), chain_store_root=str(tmp_path / 'none'),
+                                chain_cache=ChainCache())
+
+
+@pytest.fixture
+def panel(loader, tmp_path):
+    return ContractPanel.build((loader._read_day(d) for d in SYNTHETIC_DATES), root=str(tmp_path / 'panel'))
+
+
+def test_panel_path_matches_daily_lookups(loader, panel):
+    """A contract's path slice equals its row in each day's chain."""
+    assert panel.available
+    assert panel.meta['contracts'] == 22
+    assert panel.meta['rows'] == 66
+
+    path = panel.path(470.0, EXPIRY, 'call')
+    assert list(path['date']) == [np.datetime64(d, 'D') for d in SYNTHETIC_DATES]
+
+    for i, trade_date in enumerate(SYNTHETIC_DATES):
+        quote = loader.get_option_quote(trade_date, 470.0, EXPIRY, 'call', spot_price=470.0)
+        assert path['close'][i] == quote['close']
+        assert path['volume'][i] == quote['volume']
+        assert path['dte'][i] == (EXPIRY - trade_date).days
+
+
+def test_panel_path_window_and_missing(panel):
+    path = panel.path(465.0, date(2024, 3, 15), 'put', start=SYNTHETIC_DATES[1], end=SYNTHETIC_DATES[1])
+    assert len(path['date']) == 1
+    assert path['date'][0] == np.datetime64(SYNTHETIC_DATES[1], 'D')
+
+    assert panel.path(999.0, EXPIRY, 'call') is None
+    assert panel.path(470.0, EXPIRY, 'straddle') is None
+
+
+def test_panel_arrays_are_memory_mapped(panel):
+    reopened = ContractPanel(str(panel.root))
+    path = reopened.path(470.0, EXPIRY, 'put')
+
+    assert isinstance(reopened._arrays['close'], np.memmap)
+    with pytest.raises(ValueError):
+        path['close'][0] = 0.0
+
+
+def test_tracker_with_panel_matches_chain_lookups(loader, panel):
+    """Panel-backed tracking produces the same trade record as per-day lookups."""
+    spy_data = pd.DataFrame({'date': SYNTHETIC_DATES, 'close': [470.0, 471.0, 469.5]})
+    position = {
+        'profile': 'Profile_1_LDG',
+        'structure': 'long_straddle',
+        'strike': 470.0,
+        'expiry': EXPIRY,
+        'legs': [{'type': 'call', 'qty': 1}, {'type': 'put', 'qty': 1}],
+    }
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        expected = TradeTracker(loader).track_trade(SYNTHETIC_DATES[0], position, spy_data)
+        actual = TradeTracker(loader, contract_panel=panel).track_trade(SYNTHETIC_DATES[0], position, spy_data)
+
+    assert expected is not None
+    assert actual == expected
@@ -0,0 +1,45 @@
+"""
+Test RotationEngine profile backtests in a process pool against the serial
+path: same merged results, same failure semantics, per-profile timings.
+"""
+
+import pandas as pd
+import pytest
+
+from src.backtest.engine import RotationEngine
+
+from tests.conftest import profile_market_data
+
+
+def failing_runner(data, profile_scores, score_threshold, regime_filter):
+    raise ValueError("bad profile")
+
+
+def test_parallel_matches_serial(fake_runners):
+    data, scores = profile_market_data()
+
+    serial_engine = RotationEngine(profile_workers=1)
+    serial = serial_engine._run_profile_backtests(data, scores)
+    parallel_engine = RotationEngine(profile_workers=3)
+    parallel = parallel_engine._run_profile_backtests(data, scores)
+
+    assert list(parallel) == list(serial) == [f'profile_{i}' for i in range(1, 7)]
+    for name in serial:
+        pd.testing.assert_frame_equal(parallel[name], serial[name])
+    assert set(parallel_engine.profile_timings) == set(serial)
+    assert all(seconds >= 0 for seconds in parallel_engine.profile_timings.values())
+
+
+def test_parallel_failure_raises(fake_runners):
+    fake_runners['profile_4'] = failing_runner
+    data, scores = profile_market_data()
+
+    with pytest.raises(RuntimeError, match="profile_4") as excinfo:
+        RotationEngine(profile_workers=2)._run_profile_backtests(data, scores)
+    assert isinstance(excinfo.value.__cause__, ValueError)
+
+
+def test_workers_from_env(monkeypatch):
+    monkeypatch.setenv('ROTATION_PROFILE_WORKERS', '4')
+    assert RotationEngine().profile_workers == 4
+    assert RotationEngine(profile_workers=0).profile_workers == 1
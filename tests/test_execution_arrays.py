@@ -0,0 +1,105 @@
+"""
+Test vectorized ExecutionModel API against the scalar methods.
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from src.trading.execution import ExecutionModel
+
+
+MIDS = [0.03, 0.5, 2.35, 12.0, 48.7]
+MONEYNESS = [0.0, 0.013, 0.05, 0.15, 0.4]
+DTES = [0, 3, 7, 10, 14, 45, 90]
+VIX = [9.0, 15.0, 22.5, 40.0, 80.0]
+
+
+@pytest.fixture
+def grid():
+    combos = list(itertools.product(MIDS, MONEYNESS, DTES, VIX))
+    mid, mny, dte, vix = (np.array(c) for c in zip(*combos))
+    return mid, mny, dte.astype(int), vix
+
+
+@pytest.mark.parametrize('is_strangle', [False, True])
+def test_spread_array_matches_scalar(grid, is_strangle):
+    model = ExecutionModel()
+    mid, mny, dte, vix = grid
+
+    result = model.get_spread_array(mid, mny, dte, vix, is_strangle=is_strangle)
+    expected = np.array([
+        model.get_spread(m, x, int(d), v, is_strangle) for m, x, d, v in zip(mid, mny, dte, vix)
+    ])
+
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_spread_array_scalar_vix(grid):
+    """A single VIX level broadcasts across the chain."""
+    model = ExecutionModel()
+    mid, mny, dte, _ = grid
+
+    result = model.get_spread_array(mid, mny, dte, 27.0)
+    expected = np.array([model.get_spread(m, x, int(d), 27.0) for m, x, d in zip(mid, mny, dte)])
+
+    np.testing.assert_array_equal(result, expected)
+    assert result.shape == mid.shape
+
+
+def test_apply_spread_array_matches_scalar(grid):
+    model = ExecutionModel()
+    mid, mny, dte, vix = grid
+    quantity = np.where(np.arange(len(mid)) % 2 == 0, 3, -2)
+
+    result = model.apply_spread_to_price_array(mid, quantity, mny, dte, vix)
+    expected = np.array([
+        model.apply_spread_to_price(m, int(q), x, int(d), v)
+        for m, q, x, d, v in zip(mid, quantity, mny, dte, vix)
+    ])
+
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_execution_price_array_size_slippage():
+    """Size-based slippage tiers match the scalar method."""
+    model = ExecutionModel()
+    quantity = np.array([1, 10, 11, 50, 51, 200])
+
+    result = model.get_execution_price_array(5.0, 'buy', 0.02, 30, 20.0, quantity=quantity)
+    expected = np.array([
+        model.get_execution_price(5.0, 'buy', 0.02, 30, 20.0, quantity=int(q)) for q in quantity
+    ])
+
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_execution_price_array_invalid_side():
+    with pytest.raises(ValueError):
+        ExecutionModel().get_execution_price_array([1.0, 2.0], ['buy', 'hold'], 0.0, 30)
+
+
+def test_commission_array_matches_scalar():
+    model = ExecutionModel()
+    contracts = np.array([1, 2, 5, 10, 40, 1, 3])
+    is_short = np.array([False, True, True, False, True, True, False])
+    premium = np.array([0.0, 2.5, 0.0, 7.1, 12.3, 0.4, 1.0])
+
+    result = model.get_commission_cost_array(contracts, is_short, premium)
+    expected = np.array([
+        model.get_commission_cost(int(n), is_short=bool(s), premium=p)
+        for n, s, p in zip(contracts, is_short, premium)
+    ])
+
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_delta_hedge_cost_array_matches_scalar():
+    model = ExecutionModel()
+    contracts = np.array([0.0, 0.3, 0.5, 1.49, 2.5, 3.5, 10.4, 10.6, 64.0, -4.2])
+
+    result = model.get_delta_hedge_cost_array(contracts)
+    expected = np.array([model.get_delta_hedge_cost(float(c)) for c in contracts])
+
+    np.testing.assert_array_equal(result, expected)
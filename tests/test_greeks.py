@@ -18,7 +18,8 @@ from src.pricing.greeks import (
     calculate_gamma,
     calculate_vega,
     calculate_theta,
-    calculate_all_greeks
+    calculate_all_greeks,
+    calculate_greeks_array
 )
 
 
@@ -421,5 +422,22 @@ class TestGreeksInputValidation:
         assert np.isfinite(greeks['gamma'])  # Should not be infinite
 
 
+class TestGreeksArray:
+    """Vectorized Greeks match the scalar functions."""
+
+    def test_matches_scalar(self):
+        S, r, sigma = 470.0, 0.05, 0.22
+        strikes = np.array([400.0, 450.0, 470.0, 470.0, 500.0, 520.0, 470.0, 480.0])
+        times = np.array([0.5, 30 / 365, 7 / 365, 1 / 365, 0.25, 2.0, 0.0, -3 / 365])
+        is_call = np.array([True, False, True, False, True, False, True, False])
+
+        result = calculate_greeks_array(S, strikes, times, r, sigma, is_call)
+
+        for i in range(len(strikes)):
+            expected = calculate_all_greeks(S, strikes[i], times[i], r, sigma, 'call' if is_call[i] else 'put')
+            for name in ('delta', 'gamma', 'vega', 'theta'):
+                assert result[name][i] == pytest.approx(expected[name], rel=1e-12, abs=1e-12)
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
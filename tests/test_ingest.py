@@ -0,0 +1,131 @@
+"""
+Test incremental daily ingest: new/changed detection, checksum short-circuit,
+per-underlying outputs and the state file.
+"""
+
+import gzip
+import os
+import pandas as pd
+import pytest
+from datetime import date
+
+from src.data.chain_store import OptionsChainStore
+from src.data.ingest import DailyIngest, IngestState, convert_stock_minutes
+from src.data.minute_store import MinuteBarStore
+from tests.conftest import SYNTHETIC_DATES, synthetic_chain_rows, write_polygon_day
+
+
+def write_stock_day(root, trade_date, closes):
+    root.mkdir(parents=True, exist_ok=True)
+    ts = 1704205800000000000
+    rows = []
+    for i, close in enumerate(closes):
+        rows.append(['SPY', 1000, close, close, close + 0.1, close - 0.1, ts + i * 60_000_000_000])
+        rows.append(['QQQ', 500, 400.0, 400.0, 400.1, 399.9, ts + i * 60_000_000_000])
+    df = pd.DataFrame(rows, columns=['ticker', 'volume', 'open', 'close', 'high', 'low', 'window_start'])
+    path = root / f"{trade_date.isoformat()}.csv.gz"
+    with gzip.open(path, 'wt') as f:
+        df.to_csv(f, index=False)
+    return path
+
+
+@pytest.fixture
+def roots(tmp_path):
+    stock_raw = tmp_path / 'raw_stock'
+    day_raw = tmp_path / 'day_aggs'
+    minute_raw = tmp_path / 'minute_aggs'
+    for offset, trade_date in enumerate(SYNTHETIC_DATES[:2]):
+        write_stock_day(stock_raw, trade_date, [470.0 + offset, 470.5 + offset])
+        write_polygon_day(day_raw, trade_date, synthetic_chain_rows(offset))
+        write_polygon_day(minute_raw, trade_date, synthetic_chain_rows(offset))
+    return tmp_path
+
+
+def make_ingest(root, underlyings=('SPY', 'QQQ')):
+    return DailyIngest(
+        stock_raw_root=str(root / 'raw_stock'),
+        stock_minute_root=str(root / 'stock_out'),
+        option_day_root=str(root / 'day_aggs'),
+        option_minute_root=str(root / 'minute_aggs'),
+        chain_store_root=str(root / 'chain_store'),
+        minute_store_root=str(root / 'minute_store'),
+        underlyings=underlyings,
+        state_path=str(root / 'state.json'),
+        chunksize=7
+    )
+
+
+def test_first_run_converts_everything(roots):
+    counts = make_ingest(roots).run(workers=1, progress=None)
+
+    assert all(c == {'built': 2, 'unchanged': 0, 'failed': 0} for c in counts.values())
+    for trade_date in SYNTHETIC_DATES[:2]:
+        assert (roots / 'stock_out' / f"{trade_date.isoformat()}.parquet").exists()
+        assert OptionsChainStore(str(roots / 'chain_store'), underlying='QQQ').has_day(trade_date)
+        assert MinuteBarStore(str(roots / 'minute_store'), underlying='SPY').has_day(trade_date)
+
+    spy = OptionsChainStore(str(roots / 'chain_store')).read_day(SYNTHETIC_DATES[0])
+    assert len(spy) == 22 and set(spy['underlying']) == {'SPY'}
+
+    state = IngestState(str(roots / 'state.json'))
+    entry = state.get('option_day', SYNTHETIC_DATES[0])
+    assert entry['rows'] == 23 and len(entry['sha256']) == 64
+
+
+def test_nightly_run_converts_only_new_day(roots):
+    make_ingest(roots).run(workers=1, progress=None)
+    assert make_ingest(roots).plan() == []
+
+    new_day = SYNTHETIC_DATES[2]
+    write_polygon_day(roots / 'day_aggs', new_day, synthetic_chain_rows(2))
+    tasks = make_ingest(roots).plan()
+
+    assert [(t['source'], t['date']) for t in tasks] == [('option_day', new_day.isoformat())]
+
+
+def test_touched_file_is_not_reconverted(roots):
+    make_ingest(roots).run(workers=1, progress=None)
+    path = roots / 'raw_stock' / f"{SYNTHETIC_DATES[0].isoformat()}.csv.gz"
+    output = roots / 'stock_out' / f"{SYNTHETIC_DATES[0].isoformat()}.parquet"
+    built_mtime = output.stat().st_mtime_ns
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+
+    counts = make_ingest(roots).run(sources=['stock_minutes'], workers=1, progress=None)
+
+    assert counts['stock_minutes'] == {'built': 0, 'unchanged': 1, 'failed': 0}
+    assert output.stat().st_mtime_ns == built_mtime
+    assert make_ingest(roots).plan(sources=['stock_minutes']) == []
+
+
+def test_changed_file_is_reconverted(roots):
+    make_ingest(roots).run(workers=1, progress=None)
+    write_stock_day(roots / 'raw_stock', SYNTHETIC_DATES[0], [480.0, 481.0, 482.0])
+
+    counts = make_ingest(roots).run(sources=['stock_minutes'], workers=1, progress=None)
+
+    assert counts['stock_minutes']['built'] == 1
+    bars = pd.read_parquet(roots / 'stock_out' / f"{SYNTHETIC_DATES[0].isoformat()}.parquet")
+    assert list(bars['close']) == [480.0, 481.0, 482.0]
+
+
+def test_missing_output_is_rebuilt(roots):
+    make_ingest(roots).run(workers=1, progress=None)
+    OptionsChainStore(str(roots / 'chain_store'), underlying='QQQ').partition_path(SYNTHETIC_DATES[1]).unlink()
+
+    tasks = make_ingest(roots).plan()
+    assert [(t['source'], t['date']) for t in tasks] == [('option_day', SYNTHETIC_DATES[1].isoformat())]
+
+
+def test_worker_processes_match_inline(roots):
+    counts = make_ingest(roots).run(workers=2, tasks_per_worker=2, progress=None)
+
+    assert all(c['built'] == 2 and c['failed'] == 0 for c in counts.values())
+    assert make_ingest(roots).plan() == []
+
+
+def test_stock_day_without_ticker_writes_empty_file(tmp_path):
+    path = write_stock_day(tmp_path / 'raw', date(2024, 1, 2), [])
+
+    assert convert_stock_minutes(path, tmp_path / 'out', date(2024, 1, 2)) == 0
+    assert pd.read_parquet(tmp_path / 'out' / '2024-01-02.parquet').empty
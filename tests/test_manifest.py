@@ -0,0 +1,84 @@
+"""
+Test the persistent coverage manifest and its incremental refresh.
+"""
+
+import os
+from datetime import date, datetime
+
+import pandas as pd
+
+from src.data.loaders import OptionsDataLoader
+from src.data.manifest import DataManifest, count_rows, file_sha256
+from src.data.polygon_options import PolygonOptionsLoader
+
+from tests.conftest import SYNTHETIC_DATES, synthetic_chain_rows, write_polygon_day
+
+
+def test_manifest_records_days(polygon_day_root, tmp_path):
+    manifest = DataManifest(str(polygon_day_root), manifest_path=str(tmp_path / 'm.json'))
+    counts = manifest.refresh(detail=True)
+
+    assert counts == {'added': 3, 'updated': 0, 'removed': 0, 'dirs_scanned': 1}
+    assert manifest.dates() == SYNTHETIC_DATES
+    assert manifest.coverage() == {'start': '2024-01-02', 'end': '2024-01-04', 'count': 3}
+
+    entry = manifest.entry(SYNTHETIC_DATES[0])
+    path = polygon_day_root / '2024' / '01' / '2024-01-02.csv.gz'
+    assert manifest.path_for(SYNTHETIC_DATES[0]) == path
+    assert entry['size'] == path.stat().st_size
+    assert entry['rows'] == len(synthetic_chain_rows()) == count_rows(path)
+    assert entry['sha256'] == file_sha256(path)
+    assert manifest.verify(SYNTHETIC_DATES[0])
+    assert manifest.path_for(date(2024, 1, 5)) is None
+
+
+def test_incremental_refresh(polygon_day_root, tmp_path):
+    """Unchanged directories are not re-listed; a reloaded manifest needs no walk."""
+    manifest_path = str(tmp_path / 'm.json')
+    DataManifest(str(polygon_day_root), manifest_path=manifest_path).refresh()
+
+    reloaded = DataManifest(str(polygon_day_root), manifest_path=manifest_path)
+    assert reloaded.refresh() == {'added': 0, 'updated': 0, 'removed': 0, 'dirs_scanned': 0}
+
+    write_polygon_day(polygon_day_root, date(2024, 2, 1), synthetic_chain_rows())
+    (polygon_day_root / '2024' / '01' / '2024-01-03.csv.gz').unlink()
+    assert reloaded.refresh() == {'added': 1, 'updated': 0, 'removed': 1, 'dirs_scanned': 2}
+    assert reloaded.dates() == [date(2024, 1, 2), date(2024, 1, 4), date(2024, 2, 1)]
+
+
+def test_miss_rechecks_directory(polygon_day_root, tmp_path):
+    """A day written after the refresh is found by re-statting its directory."""
+    manifest = DataManifest(str(polygon_day_root), manifest_path=str(tmp_path / 'm.json'))
+    manifest.refresh()
+
+    late = date(2024, 1, 5)
+    month_dir = polygon_day_root / '2024' / '01'
+    before = month_dir.stat()
+    write_polygon_day(polygon_day_root, late, synthetic_chain_rows())
+    os.utime(month_dir, ns=(before.st_atime_ns, before.st_mtime_ns + 1_000_000_000))
+
+    assert manifest.has_date(late)
+    assert not manifest.has_date(date(2024, 1, 6))
+
+
+def test_loaders_use_manifest(polygon_day_root, tmp_path):
+    stock_root = tmp_path / 'stock'
+    stock_root.mkdir()
+    pd.DataFrame({
+        'ts': pd.date_range('2024-01-02 14:30', periods=3, freq='min'),
+        'open': 470.0, 'high': 471.0, 'low': 469.0, 'close': 470.5, 'volume': 100,
+    }).to_parquet(stock_root / '2024-01-02.parquet')
+
+    options = OptionsDataLoader(
+        data_root=str(polygon_day_root),
+        stock_data_root=str(stock_root),
+        chain_store_root=str(tmp_path / 'none'),
+        spy_daily_path=str(tmp_path / 'daily.parquet')
+    )
+    assert options.get_data_coverage() == {'start': '2024-01-02', 'end': '2024-01-04', 'count': 3}
+    assert not options.load_options_chain(datetime(2024, 1, 3)).empty
+    assert options.load_options_chain(datetime(2024, 1, 6)).empty
+
+    polygon = PolygonOptionsLoader(data_root=str(polygon_day_root), chain_store_root=str(tmp_path / 'none'))
+    assert polygon.day_manifest is options.options_manifest
+    assert not polygon.load_day(SYNTHETIC_DATES[1], spot_price=470.0).empty
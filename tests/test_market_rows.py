@@ -0,0 +1,69 @@
+"""
+Test MarketRow views against the iterrows Series they replace, and that the
+simulator produces identical results with views and with Series rows.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.trading.market_rows import MarketRows
+from src.trading.simulator import SimulationConfig
+
+from tests.conftest import SYNTHETIC_DATES
+
+
+DATA = pd.DataFrame({
+    'date': pd.to_datetime(['2024-01-02', '2024-01-03', '2024-01-04']),
+    'close': [470.0, 471.0, 469.5],
+    'RV20': [0.15, np.nan, 0.16],
+    'regime': [1, 2, 2],
+    'label': ['a', 'b', 'c'],
+})
+
+
+def test_row_values_identical_to_iterrows():
+    rows = MarketRows(DATA)
+    for i, (idx, series) in enumerate(DATA.iterrows()):
+        row = rows[i]
+        assert row.name == idx
+        for col in DATA.columns:
+            expected = series[col]
+            assert type(row[col]) is type(expected)
+            assert row[col] == expected or (pd.isna(row[col]) and pd.isna(expected))
+        assert row.get('missing', 0.2) == series.get('missing', 0.2)
+        pd.testing.assert_series_equal(row.to_series(), series)
+
+
+def test_series_fallbacks():
+    row = MarketRows(DATA)[0]
+
+    assert row.close == 470.0
+    assert 'regime' in row and 'missing' not in row
+    assert row.to_dict()['label'] == 'a'
+    assert list(row.index) == list(DATA.columns)
+    assert list(row[['close', 'regime']]) == [470.0, 1]
+    with pytest.raises(KeyError):
+        row['missing']
+
+
+def _simulate(simulate_synthetic, row_views):
+    seen = []
+
+    def entry(row, trade):
+        seen.append(type(row).__name__)
+        return row.get('regime', 0) == 1 and row['date'] == SYNTHETIC_DATES[0]
+
+    sim, results = simulate_synthetic(SimulationConfig(row_views=row_views), entry_logic=entry,
+                                      exit_logic=lambda row, trade: row.regime == 2)
+    return sim, results, seen
+
+
+def test_simulation_identical_with_row_views(simulate_synthetic):
+    view_sim, with_views, view_types = _simulate(simulate_synthetic, row_views=True)
+    series_sim, with_series, series_types = _simulate(simulate_synthetic, row_views=False)
+
+    pd.testing.assert_frame_equal(with_views, with_series)
+    pd.testing.assert_frame_equal(view_sim.get_trade_summary(), series_sim.get_trade_summary())
+    assert with_views['position_open'].any()
+    assert set(view_types) == {'MarketRow'} and set(series_types) == {'Series'}
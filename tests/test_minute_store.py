@@ -0,0 +1,89 @@
+"""
+Test per-contract minute-bar store against the raw minute_aggs parse.
+"""
+
+import pandas as pd
+import pytest
+from datetime import date
+
+from src.data.chain_cache import ChainCache
+from src.data.minute_store import MinuteBarStore
+from src.data.polygon_options import PolygonOptionsLoader
+
+from tests.conftest import write_polygon_day
+
+
+TRADE_DATE = date(2024, 1, 2)
+SESSION_OPEN = 1704205800000000000  # 2024-01-02 14:30 UTC in ns
+MINUTE = 60_000_000_000
+
+
+def minute_rows():
+    """Five minutes of bars for six SPY contracts, interleaved by minute, plus QQQ noise."""
+    rows = []
+    for minute in range(5):
+        ts = SESSION_OPEN + minute * MINUTE
+        for strike in [465, 470, 475]:
+            for opt in ['C', 'P']:
+                price = round(5.0 + 0.1 * minute + (strike - 465) * 0.01 + (0.5 if opt == 'P' else 0.0), 2)
+                rows.append([f"O:SPY240119{opt}{strike * 1000:08d}", 10 + minute,
+                             price, price, price + 0.05, price - 0.05, ts, 3])
+        rows.append(['O:QQQ240119C00400000', 50, 2.0, 2.0, 2.1, 1.9, ts, 5])
+    return rows
+
+
+@pytest.fixture
+def minute_root(tmp_path):
+    root = tmp_path / 'minute_aggs'
+    write_polygon_day(root, TRADE_DATE, minute_rows())
+    return root
+
+
+def make_loader(polygon_day_root, minute_root, store_root):
+    return PolygonOptionsLoader(
+        data_root=str(polygon_day_root),
+        minute_data_root=str(minute_root),
+        chain_store_root=str(store_root / 'none'),
+        minute_store_root=str(store_root),
+        chain_cache=ChainCache()
+    )
+
+
+def test_store_matches_raw_minute_bars(polygon_day_root, minute_root, tmp_path):
+    """load_minute_bars returns identical bars from the store and from the raw file."""
+    store_root = tmp_path / 'minute_store'
+    raw_loader = make_loader(polygon_day_root, minute_root, tmp_path / 'missing')
+
+    store = MinuteBarStore(str(store_root), row_group_size=4)
+    store.write_day(TRADE_DATE, raw_loader.read_raw_minute_bars_day(TRADE_DATE))
+    assert store.list_dates() == [TRADE_DATE]
+
+    store_loader = make_loader(polygon_day_root, minute_root, store_root)
+    for strike in [465.0, 470.0, 475.0]:
+        for option_type in ['call', 'put']:
+            expected = raw_loader.load_minute_bars(TRADE_DATE, strike, date(2024, 1, 19), option_type)
+            actual = store_loader.load_minute_bars(TRADE_DATE, strike, date(2024, 1, 19), option_type)
+            assert len(actual) == 5
+            pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+def test_store_is_sorted_by_contract(polygon_day_root, minute_root, tmp_path):
+    """Partitions are sorted by contract so row-group statistics prune reads."""
+    loader = make_loader(polygon_day_root, minute_root, tmp_path / 'missing')
+    store = MinuteBarStore(str(tmp_path / 'minute_store'))
+    store.write_day(TRADE_DATE, loader.read_raw_minute_bars_day(TRADE_DATE))
+
+    day = store.read_day(TRADE_DATE)
+    assert len(day) == 30  # QQQ dropped
+    assert day['contract_key'].is_monotonic_increasing
+    assert (day['date'] == TRADE_DATE).all()
+
+
+def test_missing_contract_and_partition(polygon_day_root, minute_root, tmp_path):
+    store_root = tmp_path / 'minute_store'
+    loader = make_loader(polygon_day_root, minute_root, tmp_path / 'missing')
+    MinuteBarStore(str(store_root)).write_day(TRADE_DATE, loader.read_raw_minute_bars_day(TRADE_DATE))
+
+    store_loader = make_loader(polygon_day_root, minute_root, store_root)
+    assert store_loader.load_minute_bars(TRADE_DATE, 999.0, date(2024, 1, 19), 'call').empty
+    assert store_loader.minute_store.read_contract(date(2024, 1, 3), 470.0, date(2024, 1, 19), 'call') is None
@@ -0,0 +1,122 @@
+"""
+Test vectorized OCC ticker parser against the per-row parsers it replaces.
+"""
+
+import pandas as pd
+from datetime import date
+
+from src.data.option_tickers import parse_option_tickers, attach_parsed_tickers, split_by_underlying
+from src.data.polygon_options import PolygonOptionsLoader
+
+
+TICKERS = [
+    'O:SPY240119C00450000',
+    'O:SPY240119P00452500',
+    'O:SPY251219C00600000',
+    'O:SPY240315P00001500',
+    'O:QQQ240119C00400000',   # other underlying
+    'O:SPYG240119C00050000',  # different root sharing the SPY prefix
+    'O:SPY241332C00450000',   # invalid expiry
+    'O:SPY240119X00450000',   # invalid type
+    'SPY',                    # not an option
+    'O:IWM240119P00190000',
+]
+
+
+def scalar_reference(tickers):
+    """Parse with PolygonOptionsLoader._parse_option_ticker (no data root needed)."""
+    loader = PolygonOptionsLoader.__new__(PolygonOptionsLoader)
+    rows = {}
+    for i, ticker in enumerate(tickers):
+        parsed = loader._parse_option_ticker(ticker)
+        if parsed is not None:
+            rows[i] = parsed
+    return pd.DataFrame.from_dict(rows, orient='index')
+
+
+def test_matches_scalar_parser():
+    """Vectorized output equals per-row parser output."""
+    tickers = pd.Series(TICKERS)
+
+    expected = scalar_reference(TICKERS)
+    result = parse_option_tickers(tickers)
+
+    assert list(result.index) == list(expected.index)
+    pd.testing.assert_frame_equal(result, expected[result.columns], check_dtype=False)
+
+
+def test_parsed_types():
+    """Expiry is a date, strike a float, type call/put."""
+    result = parse_option_tickers(pd.Series(TICKERS))
+
+    assert result.loc[0, 'expiry'] == date(2024, 1, 19)
+    assert result.loc[1, 'strike'] == 452.5
+    assert result.loc[3, 'strike'] == 1.5
+    assert set(result['option_type']) == {'call', 'put'}
+    assert (result['underlying'] == 'SPY').all()
+
+
+def test_no_matches_returns_empty():
+    result = parse_option_tickers(pd.Series(['O:QQQ240119C00400000', 'AAPL']))
+    assert result.empty
+    assert list(result.columns) == ['underlying', 'expiry', 'strike', 'option_type']
+
+
+def test_malformed_tickers_rejected():
+    """Tickers failing the pattern get no parsed row (NaN when realigned)."""
+    malformed = [
+        'X:SPY240119C00450000',    # not an O: prefix
+        'SPY240119C00450000',      # prefix missing
+        'O:SPY240119C0045000',     # 7-digit strike
+        'O:SPY240119c00450000',    # lowercase type
+        'O:SPY240119C00450000X',   # trailing junk
+        'O:SPYC00450000',          # no expiry
+        None,
+    ]
+    tickers = pd.Series(['O:SPY240119C00450000'] + malformed)
+
+    aligned = parse_option_tickers(tickers).reindex(tickers.index)
+
+    assert aligned.loc[0, 'strike'] == 450.0
+    assert aligned.iloc[1:].isna().all(axis=None)
+    # The scalar parser rejects the bad prefixes too
+    loader = PolygonOptionsLoader.__new__(PolygonOptionsLoader)
+    assert loader._parse_option_ticker(malformed[0]) is None
+    assert loader._parse_option_ticker(malformed[1]) is None
+
+
+def test_attach_parsed_tickers_keeps_row_alignment():
+    """Price columns stay aligned with their parsed ticker."""
+    raw = pd.DataFrame({
+        'ticker': ['O:QQQ240119C00400000', 'O:SPY240119C00450000', 'O:SPY240119P00440000'],
+        'close': [1.0, 2.0, 3.0],
+    })
+    result = attach_parsed_tickers(raw)
+
+    assert len(result) == 2
+    assert list(result['close']) == [2.0, 3.0]
+    assert list(result['strike']) == [450.0, 440.0]
+
+
+def test_parse_several_underlyings():
+    """Roots of any length are parsed in one pass; prefix look-alikes are dropped."""
+    result = parse_option_tickers(pd.Series(TICKERS), underlying=['SPY', 'QQQ', 'IWM'])
+
+    assert list(result.index) == [0, 1, 2, 3, 4, 9]
+    assert list(result['underlying']) == ['SPY', 'SPY', 'SPY', 'SPY', 'QQQ', 'IWM']
+    assert result.loc[9, 'strike'] == 190.0
+
+
+def test_split_by_underlying():
+    raw = pd.DataFrame({
+        'ticker': ['O:QQQ240119C00400000', 'O:SPY240119C00450000', 'O:IWM240119P00190000',
+                   'O:SPY240119P00440000'],
+        'close': [1.0, 2.0, 3.0, 4.0],
+    })
+    days = split_by_underlying(raw, ['SPY', 'QQQ', 'DIA'])
+
+    assert list(days) == ['SPY', 'QQQ', 'DIA']
+    assert list(days['SPY']['close']) == [2.0, 4.0]
+    assert list(days['QQQ']['strike']) == [400.0]
+    assert days['DIA'].empty
+    pd.testing.assert_frame_equal(days['SPY'], attach_parsed_tickers(raw).reset_index(drop=True))
@@ -0,0 +1,110 @@
+"""
+Test the struct-of-arrays PositionBook against per-Trade calculations, and
+TradeSimulator.simulate_multi against simulate() for a single position (P&L
+and trade summary; Greeks are recorded once per day instead of per mark).
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import date, datetime
+
+from src.trading.position_book import PositionBook
+from src.trading.simulator import SimulationConfig
+from src.trading.trade import create_spread_trade, create_straddle_trade, create_strangle_trade
+
+
+def _book_trades():
+    trades = [
+        create_straddle_trade('A', 'P1', datetime(2024, 1, 2), 470.0, datetime(2024, 1, 19), dte=17,
+                              entry_prices={0: 6.1, 1: 5.4}),
+        create_strangle_trade('B', 'P2', datetime(2024, 1, 3), 480.0, 460.0, datetime(2024, 2, 16), dte=44,
+                              short=True, entry_prices={0: 3.2, 1: 4.0}),
+        create_spread_trade('C', 'P3', datetime(2024, 1, 3), 465.0, 475.0, datetime(2024, 1, 5), dte=2,
+                            option_type='put', quantity=3, entry_prices={0: 2.0, 1: 6.5}),
+    ]
+    book = PositionBook()
+    for trade in trades:
+        book.add(trade)
+    return book, trades
+
+
+def test_book_matches_trade_calculations():
+    book, trades = _book_trades()
+    today = date(2024, 1, 4)
+    prices = np.array([6.5, 4.9, 2.8, 3.1, 1.7, 7.0])
+
+    pnl = book.leg_pnl(prices)
+    greeks = book.net_greeks(471.0, today.toordinal(), 0.18)
+
+    offset = 0
+    for slot, trade in enumerate(trades):
+        n = len(trade.legs)
+        leg_prices = {i: prices[offset + i] for i in range(n)}
+        assert pnl[slot] == pytest.approx(trade.mark_to_market(leg_prices))
+
+        trade.calculate_greeks(471.0, today, implied_vol=0.18)
+        assert greeks['delta'][slot] == pytest.approx(trade.net_delta)
+        assert greeks['gamma'][slot] == pytest.approx(trade.net_gamma)
+        assert greeks['vega'][slot] == pytest.approx(trade.net_vega)
+        assert greeks['theta'][slot] == pytest.approx(trade.net_theta)
+        offset += n
+
+    assert list(book.min_dte(today.toordinal())) == [15, 43, 1]
+    assert list(book.days_in_trade(today.toordinal())) == [2, 1, 1]
+
+
+def test_remove_keeps_order_and_writes_back_hedge_cost():
+    book, trades = _book_trades()
+    book.hedge_cost += np.array([10.0, 20.0, 30.0])
+
+    removed = book.remove([1])
+
+    assert removed == [trades[1]] and trades[1].cumulative_hedge_cost == 20.0
+    assert book.trades == [trades[0], trades[2]]
+    assert list(book.slot) == [0, 0, 1, 1]
+    assert list(book.leg_index) == [0, 1, 0, 1]
+    assert list(book.strike) == [470.0, 470.0, 465.0, 475.0]
+    assert list(book.hedge_cost) == [10.0, 30.0]
+    assert book.legs == trades[0].legs + trades[2].legs
+
+
+def enter_every_day(row, trades):
+    return True
+
+
+def test_single_position_matches_simulate(simulate_synthetic):
+    single_sim, single = simulate_synthetic(entry_logic=enter_every_day)
+    multi_sim, multi = simulate_synthetic(SimulationConfig(max_open_trades=1), multi=True, entry_logic=enter_every_day)
+
+    columns = ['date', 'daily_pnl', 'daily_return', 'realized_pnl_total', 'unrealized_pnl', 'total_pnl']
+    pd.testing.assert_frame_equal(multi[columns], single[columns])
+    pd.testing.assert_frame_equal(multi_sim.get_trade_summary(), single_sim.get_trade_summary())
+    assert multi['open_trades'].max() == 1
+
+
+def test_single_position_greeks_history(simulate_synthetic):
+    single_sim, _ = simulate_synthetic(entry_logic=enter_every_day)
+    multi_sim, results = simulate_synthetic(SimulationConfig(max_open_trades=1), multi=True, entry_logic=enter_every_day)
+
+    trade = multi_sim.trades[0]
+    single_history = pd.DataFrame(single_sim.trades[0].greeks_history).drop_duplicates('date')
+    history = pd.DataFrame(trade.greeks_history)
+
+    # One entry per day the trade was open after the entry fill, matching simulate()'s marks
+    assert list(history['date']) == list(results.loc[results['open_trades'] > 0, 'date'])
+    assert history['date'].is_unique
+    columns = ['date', 'days_in_trade', 'avg_dte', 'spot', 'delta', 'gamma', 'vega', 'theta', 'iv']
+    pd.testing.assert_frame_equal(history[columns], single_history[columns].reset_index(drop=True),
+                                  check_dtype=False)
+
+
+def test_layered_entries(simulate_synthetic):
+    sim, results = simulate_synthetic(multi=True, entry_logic=enter_every_day)
+
+    assert list(results['open_trades']) == [0, 1, 2]
+    summary = sim.get_trade_summary()
+    assert len(summary) == 2
+    assert results['total_pnl'].iloc[-1] == pytest.approx(summary['realized_pnl'].sum())
+    # Portfolio Greeks are the sum over open trades
+    assert results['net_vega'].iloc[2] == pytest.approx(2 * results['net_vega'].iloc[1], rel=0.2)
@@ -0,0 +1,87 @@
+"""
+Test background prefetch of upcoming trading days.
+"""
+
+import pandas as pd
+import pytest
+
+from src.data.prefetch import ChainPrefetcher
+from src.trading import simulator as simulator_module
+from src.trading.simulator import SimulationConfig
+
+from tests.conftest import SYNTHETIC_DATES
+
+
+@pytest.fixture
+def loader(synthetic_loader):
+    return synthetic_loader()
+
+
+def test_prefetcher_warms_upcoming_days(loader, polygon_day_root):
+    """Days ahead of the current one are loaded into the chain cache."""
+    with ChainPrefetcher(loader, SYNTHETIC_DATES, depth=2) as prefetcher:
+        for i in range(len(SYNTHETIC_DATES)):
+            prefetcher.advance(i)
+
+    for trade_date in SYNTHETIC_DATES:
+        assert ('day_chain', str(polygon_day_root), trade_date, 'SPY') in loader.chain_cache
+
+    stats = prefetcher.stats()
+    assert stats['depth'] == 2
+    assert stats['days_prefetched'] == 3
+    assert stats['errors'] == 0
+    assert stats['blocked_seconds'] >= 0.0
+    assert stats['compute_seconds'] >= 0.0
+
+
+def test_prefetcher_rejects_zero_depth(loader):
+    with pytest.raises(ValueError):
+        ChainPrefetcher(loader, SYNTHETIC_DATES, depth=0)
+
+
+def test_prefetch_load_errors_do_not_raise():
+    """A failing load is counted; the simulation's own lookup reports it."""
+    class FailingLoader:
+        def prefetch_day(self, trade_date):
+            raise OSError("disk gone")
+
+    with ChainPrefetcher(FailingLoader(), SYNTHETIC_DATES, depth=1) as prefetcher:
+        prefetcher.advance(0)
+
+    assert prefetcher.stats()['errors'] == 1
+
+
+def test_simulation_identical_with_prefetch(loader, simulate_synthetic):
+    def run(prefetch_depth):
+        config = SimulationConfig(delta_hedge_enabled=False, prefetch_depth=prefetch_depth)
+        return simulate_synthetic(config, loader=loader)
+
+    baseline_sim, baseline = run(prefetch_depth=0)
+    loader.clear_cache()
+    prefetch_sim, prefetched = run(prefetch_depth=2)
+
+    pd.testing.assert_frame_equal(prefetched, baseline)
+    assert baseline['position_open'].any()
+    assert 'prefetch' not in baseline_sim.stats
+    assert prefetch_sim.stats['prefetch']['days_prefetched'] == len(SYNTHETIC_DATES)
+
+
+@pytest.mark.parametrize('multi', [False, True])
+def test_prefetcher_closed_when_callback_raises(simulate_synthetic, monkeypatch, multi):
+    prefetchers = []
+
+    class RecordingPrefetcher(ChainPrefetcher):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            prefetchers.append(self)
+
+    monkeypatch.setattr(simulator_module, 'ChainPrefetcher', RecordingPrefetcher)
+
+    def entry(row, trades):
+        raise RuntimeError("callback failed")
+
+    with pytest.raises(RuntimeError, match="callback failed"):
+        simulate_synthetic(SimulationConfig(prefetch_depth=2), multi=multi, entry_logic=entry)
+
+    assert len(prefetchers) == 1
+    assert prefetchers[0]._executor._shutdown
@@ -0,0 +1,117 @@
+"""
+Test the incrementally extended spine behind DataSpine.get_day_data.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.features import add_derived_features, extend_derived_features
+from src.data.loaders import DataSpine, OptionsDataLoader
+
+from tests.conftest import synthetic_chain_rows, write_polygon_day
+
+
+DAYS = list(pd.bdate_range('2023-09-01', periods=90).date)
+
+FEATURES = ['RV5', 'RV20', 'ATR10', 'MA20', 'MA50', 'slope_MA50', 'return_20d', 'range_10d']
+
+
+def write_stock_day(root, trade_day, i):
+    close = 440.0 + 5.0 * np.sin(i / 7.0) + 0.1 * i
+    pd.DataFrame({
+        'ts': pd.date_range(f"{trade_day} 14:30", periods=2, freq='min'),
+        'open': [close - 0.5, close], 'high': [close + 1.0, close + 0.8],
+        'low': [close - 1.2, close - 0.6], 'close': [close - 0.2, close],
+        'volume': [1000, 1200],
+    }).to_parquet(root / f"{trade_day.isoformat()}.parquet")
+
+
+@pytest.fixture
+def spine(tmp_path):
+    stock_root = tmp_path / 'stock'
+    stock_root.mkdir()
+    for i, trade_day in enumerate(DAYS[:80]):
+        write_stock_day(stock_root, trade_day, i)
+    day_root = tmp_path / 'day_aggs'
+    write_polygon_day(day_root, DAYS[-1], synthetic_chain_rows())
+
+    loader = OptionsDataLoader(
+        data_root=str(day_root),
+        stock_data_root=str(stock_root),
+        chain_store_root=str(tmp_path / 'none'),
+        spy_daily_path=str(tmp_path / 'daily.parquet'),
+        vix_store_path=str(tmp_path / 'vix.parquet')
+    )
+    return DataSpine(loader=loader), stock_root
+
+
+def test_extend_matches_full_recompute():
+    bars = pd.DataFrame({
+        'date': DAYS,
+        'open': np.linspace(400, 450, 90), 'high': np.linspace(402, 452, 90),
+        'low': np.linspace(398, 448, 90), 'close': 425 + 10 * np.sin(np.arange(90) / 5.0),
+        'volume': 1e6,
+    })
+    full = add_derived_features(bars)
+
+    extended = add_derived_features(bars.iloc[:60])
+    for i in range(60, 90, 7):
+        extended = extend_derived_features(extended, bars.iloc[i:i + 7])
+
+    assert list(extended['date']) == DAYS
+    np.testing.assert_allclose(extended[FEATURES].to_numpy(), full[FEATURES].to_numpy(), rtol=1e-9)
+
+
+def test_get_day_data_matches_windowed_spine(spine):
+    """Rows equal what the old per-day 100-calendar-day rebuild produced."""
+    data_spine, _ = spine
+    for trade_day in [DAYS[10], DAYS[60], DAYS[79]]:
+        target = datetime.combine(trade_day, datetime.min.time())
+        row = data_spine.get_day_data(target, include_options=False)['spy']
+
+        window = data_spine.build_spine(target - pd.Timedelta(days=100), target + pd.Timedelta(days=1))
+        expected = window[window['date'] == trade_day].iloc[0]
+        assert row['date'] == trade_day
+        np.testing.assert_allclose(row[FEATURES].to_numpy(dtype=float),
+                                   expected[FEATURES].to_numpy(dtype=float), rtol=1e-9)
+
+    assert data_spine.get_day_data(datetime(2023, 9, 2))['spy'] is None  # Saturday
+
+
+def test_spine_extends_with_new_days(spine):
+    data_spine, stock_root = spine
+    data_spine.get_day_data(datetime.combine(DAYS[40], datetime.min.time()), include_options=False)
+    built = len(data_spine._rolling.frame)
+    assert built == 80
+
+    for i in range(80, 85):
+        write_stock_day(stock_root, DAYS[i], i)
+
+    row = data_spine.get_day_data(datetime.combine(DAYS[84], datetime.min.time()), include_options=False)['spy']
+    assert row['date'] == DAYS[84]
+    assert len(data_spine._rolling.frame) == 85
+    assert not np.isnan(row['slope_MA50'])
+
+
+def test_refresh_once_per_new_target_past_data(spine, monkeypatch):
+    data_spine, stock_root = spine
+    refreshes = []
+    refresh = data_spine.loader.refresh_stock_data
+    monkeypatch.setattr(data_spine.loader, 'refresh_stock_data', lambda: refreshes.append(1) or refresh())
+
+    beyond = datetime.combine(DAYS[85], datetime.min.time())
+    for _ in range(3):
+        assert data_spine.get_day_data(beyond, include_options=False)['spy'] is None
+    data_spine.get_day_data(datetime.combine(DAYS[82], datetime.min.time()), include_options=False)
+    data_spine.get_day_data(datetime.combine(DAYS[40], datetime.min.time()), include_options=False)
+    assert len(refreshes) == 1
+
+    # A later target rescans and picks up newly exported days
+    for i in range(80, 87):
+        write_stock_day(stock_root, DAYS[i], i)
+    row = data_spine.get_day_data(datetime.combine(DAYS[86], datetime.min.time()), include_options=False)['spy']
+    assert len(refreshes) == 2
+    assert row['date'] == DAYS[86]
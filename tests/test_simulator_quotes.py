@@ -0,0 +1,71 @@
+"""
+Test that the simulator quotes all legs of a day with one bulk loader call,
+and that snapped contracts still price the same as the per-leg lookups.
+"""
+
+import pytest
+from datetime import date
+
+from src.data.polygon_options import PolygonOptionsLoader
+
+from tests.conftest import straddle_constructor
+
+
+class CountingLoader(PolygonOptionsLoader):
+    """Loader that counts the lookups the simulator makes."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = {'get_option_price': 0, 'get_option_quotes_bulk': 0, 'find_closest_contract': 0}
+
+    def get_option_price(self, *args, **kwargs):
+        self.calls['get_option_price'] += 1
+        return super().get_option_price(*args, **kwargs)
+
+    def get_option_quotes_bulk(self, *args, **kwargs):
+        self.calls['get_option_quotes_bulk'] += 1
+        return super().get_option_quotes_bulk(*args, **kwargs)
+
+    def find_closest_contract(self, *args, **kwargs):
+        self.calls['find_closest_contract'] += 1
+        return super().find_closest_contract(*args, **kwargs)
+
+
+class BrokenLoader(CountingLoader):
+    def get_option_quotes_bulk(self, *args, **kwargs):
+        raise ValueError("corrupt chain")
+
+
+def _simulate(simulate_synthetic, expiry, loader_class=CountingLoader):
+    sim, _ = simulate_synthetic(loader_class=loader_class, trade_constructor=straddle_constructor(470.0, expiry),
+                                exit_logic=lambda row, trade: row.regime == 2)
+    return sim, sim.polygon_loader
+
+
+def test_one_quote_batch_per_day(simulate_synthetic):
+    sim, loader = _simulate(simulate_synthetic, date(2024, 1, 19))
+
+    trade = sim.trades[0]
+    assert trade.is_open is False
+    assert loader.calls['get_option_price'] == 0
+    assert loader.calls['get_option_quotes_bulk'] == sim.stats['quote_batches']
+    assert sim.stats['quote_batches'] <= sim.stats['days_simulated']
+    # Both legs are priced several times a day from the same batch
+    assert sim.stats['leg_quote_requests'] >= 2 * sim.stats['quote_batches']
+    assert sim.stats['fallback_prices_used'] == 0
+
+
+def test_snapped_contracts_searched_once_per_day(simulate_synthetic):
+    # No 2024-01-20 expiry listed: legs snap to the nearest contract on entry
+    sim, loader = _simulate(simulate_synthetic, date(2024, 1, 20))
+
+    trade = sim.trades[0]
+    assert all(leg.expiry.date() != date(2024, 1, 20) for leg in trade.legs)
+    assert loader.calls['find_closest_contract'] == sim.stats['snap_lookups'] == len(trade.legs)
+    assert sim.stats['real_prices_used'] > 0
+
+
+def test_loader_errors_surface(simulate_synthetic):
+    """Only missing data falls back; a broken lookup is not silently unpriced."""
+    with pytest.raises(ValueError, match="corrupt chain"):
+        _simulate(simulate_synthetic, date(2024, 1, 19), loader_class=BrokenLoader)
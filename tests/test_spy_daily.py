@@ -0,0 +1,94 @@
+"""
+Test consolidated SPY daily-bar table and its incremental refresh.
+"""
+
+import os
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.loaders import OptionsDataLoader
+from src.data.spy_daily import SpyDailyBars
+
+
+DAYS = [date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 4)]
+
+
+def write_minute_day(root, trade_day, base):
+    """Five unsorted minute bars for one day."""
+    ts = pd.date_range(f"{trade_day} 14:30", periods=5, freq='min')[[2, 0, 4, 1, 3]]
+    offsets = np.array([2, 0, 4, 1, 3], dtype=float)
+    pd.DataFrame({
+        'ts': ts,
+        'open': base + offsets,
+        'high': base + offsets + 0.5,
+        'low': base + offsets - 0.5,
+        'close': base + offsets + 0.25,
+        'volume': [100, 200, 300, 400, 500],
+    }).to_parquet(root / f"{trade_day.isoformat()}.parquet")
+
+
+@pytest.fixture
+def stock_root(tmp_path):
+    root = tmp_path / 'stock'
+    root.mkdir()
+    for i, trade_day in enumerate(DAYS):
+        write_minute_day(root, trade_day, 470.0 + i)
+    return root
+
+
+def test_daily_bars_from_minutes(stock_root, tmp_path):
+    bars = SpyDailyBars(str(stock_root), str(tmp_path / 'daily.parquet')).load()
+
+    assert list(bars['date']) == DAYS
+    first = bars.iloc[0]
+    assert first['open'] == 470.0  # earliest minute, not first row in the file
+    assert first['close'] == 474.25  # latest minute
+    assert first['high'] == 474.5
+    assert first['low'] == 469.5
+    assert first['volume'] == 1500.0
+
+
+def test_incremental_refresh(stock_root, tmp_path):
+    """Only new or changed minute files are re-read; unchanged runs don't rewrite the table."""
+    table_path = tmp_path / 'daily.parquet'
+    first = SpyDailyBars(str(stock_root), str(table_path))
+    assert first.refresh() == {'added': 3, 'updated': 0, 'removed': 0, 'unchanged': 0}
+
+    written = table_path.stat().st_mtime_ns
+    again = SpyDailyBars(str(stock_root), str(table_path))
+    assert again.refresh() == {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 3}
+    assert table_path.stat().st_mtime_ns == written
+
+    write_minute_day(stock_root, DAYS[1], 500.0)
+    stat = (stock_root / f"{DAYS[1]}.parquet").stat()
+    os.utime(stock_root / f"{DAYS[1]}.parquet", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    write_minute_day(stock_root, date(2024, 1, 5), 480.0)
+    (stock_root / f"{DAYS[0]}.parquet").unlink()
+
+    updated = SpyDailyBars(str(stock_root), str(table_path))
+    assert updated.refresh() == {'added': 1, 'updated': 1, 'removed': 1, 'unchanged': 1}
+
+    bars = updated.load(refresh=False)
+    assert list(bars['date']) == [DAYS[1], DAYS[2], date(2024, 1, 5)]
+    assert bars.iloc[0]['open'] == 500.0
+
+
+def test_options_loader_uses_daily_table(stock_root, polygon_day_root, tmp_path):
+    loader = OptionsDataLoader(
+        data_root=str(polygon_day_root),
+        stock_data_root=str(stock_root),
+        chain_store_root=str(tmp_path / 'none'),
+        spy_daily_path=str(tmp_path / 'daily.parquet')
+    )
+
+    assert loader.get_spy_stock_coverage() == {'start': DAYS[0], 'end': DAYS[-1], 'count': 3}
+
+    spy = loader.load_spy_ohlcv(datetime(2024, 1, 3), datetime(2024, 1, 4))
+    assert list(spy.columns) == ['date', 'open', 'high', 'low', 'close', 'volume']
+    assert list(spy['date']) == DAYS[1:]
+
+    with pytest.raises(ValueError):
+        loader.load_spy_ohlcv(datetime(2023, 12, 1), datetime(2024, 1, 4))
@@ -0,0 +1,116 @@
+"""
+Test the offline VIX store and load_vix's range-merging cache.
+"""
+
+from datetime import date, datetime
+
+import pandas as pd
+import pytest
+
+import src.data.loaders as loaders
+from src.data.loaders import OptionsDataLoader
+from src.data.vix_store import VixStore, merge_series, read_cboe_csv
+
+
+DAYS = pd.bdate_range('2024-01-02', '2024-01-31').date
+
+
+@pytest.fixture
+def stock_root(tmp_path):
+    root = tmp_path / 'stock'
+    root.mkdir()
+    pd.DataFrame({
+        'ts': pd.date_range('2024-01-02 14:30', periods=3, freq='min'),
+        'open': 470.0, 'high': 471.0, 'low': 469.0, 'close': 470.5, 'volume': 100,
+    }).to_parquet(root / '2024-01-02.parquet')
+    return root
+
+
+def make_loader(polygon_day_root, stock_root, tmp_path):
+    return OptionsDataLoader(
+        data_root=str(polygon_day_root),
+        stock_data_root=str(stock_root),
+        chain_store_root=str(tmp_path / 'none'),
+        spy_daily_path=str(tmp_path / 'daily.parquet'),
+        vix_store_path=str(tmp_path / 'vix.parquet')
+    )
+
+
+def test_store_upsert_merges_series(tmp_path):
+    store = VixStore(str(tmp_path / 'vix.parquet'))
+    store.upsert(pd.DataFrame({'date': DAYS[:10], 'vix_close': 13.0}))
+    store.upsert(pd.DataFrame({'date': DAYS[5:15], 'vix_close': 14.0, 'vvix_close': 90.0}))
+
+    table = VixStore(str(tmp_path / 'vix.parquet')).load()
+    assert list(table['date']) == list(DAYS[:15])
+    assert table['vix_close'].tolist() == [13.0] * 5 + [14.0] * 10
+    assert table['vvix_close'].isna().sum() == 5
+
+    read = store.read(DAYS[0], DAYS[4], columns=['vix_close', 'vvix_close'])
+    assert list(read.columns) == ['date', 'vix_close', 'vvix_close']
+    assert len(read) == 5
+
+
+def test_merge_series_keeps_existing_values():
+    """NaN in the new frame does not erase stored values; columns of both sides survive."""
+    base = pd.DataFrame({'date': DAYS[:3], 'vix_close': [13.0, 14.0, 15.0], 'vix9d_close': [12.0, 12.5, 13.0]})
+    new = pd.DataFrame({'date': DAYS[1:4], 'vix_close': [float('nan'), 16.0, 17.0], 'vvix_close': 90.0})
+
+    merged = merge_series(base, new)
+
+    assert list(merged['date']) == list(DAYS[:4])
+    assert merged['vix_close'].tolist() == [13.0, 14.0, 16.0, 17.0]
+    assert merged['vix9d_close'].tolist()[:3] == [12.0, 12.5, 13.0]
+    assert pd.isna(merged['vix9d_close'].iloc[3])
+    assert merged['vvix_close'].isna().tolist() == [True, False, False, False]
+
+    pd.testing.assert_frame_equal(merge_series(None, new.iloc[::-1]), new)
+    assert merge_series(base, new.iloc[0:0]) is base
+
+
+def test_read_cboe_csv(tmp_path):
+    path = tmp_path / 'VIX_History.csv'
+    path.write_text("DATE,OPEN,HIGH,LOW,CLOSE\n01/02/2024,13.2,14.2,13.0,13.2\n01/03/2024,13.9,14.5,13.5,14.04\n")
+    df = read_cboe_csv(str(path))
+    assert list(df['date']) == [date(2024, 1, 2), date(2024, 1, 3)]
+    assert df['vix_close'].tolist() == [13.2, 14.04]
+
+
+def test_load_vix_offline(polygon_day_root, stock_root, tmp_path, monkeypatch):
+    """Served from the store without touching the network."""
+    VixStore(str(tmp_path / 'vix.parquet')).upsert(pd.DataFrame({'date': DAYS, 'vix_close': 15.0}))
+
+    def no_network(*args, **kwargs):
+        raise AssertionError("network used")
+    monkeypatch.setattr(loaders, 'download_series', no_network)
+
+    loader = make_loader(polygon_day_root, stock_root, tmp_path)
+    vix = loader.load_vix(datetime(2024, 1, 8), datetime(2024, 1, 12))
+    assert list(vix.columns) == ['date', 'vix_close']
+    assert list(vix['date']) == list(DAYS[4:9])
+
+    with pytest.raises(ValueError):
+        loader.load_vix(datetime(2024, 3, 1), datetime(2024, 3, 5))
+
+
+def test_load_vix_downloads_only_gaps(polygon_day_root, stock_root, tmp_path, monkeypatch):
+    """Wider requests fetch only the uncovered part and merge it into the cache and store."""
+    VixStore(str(tmp_path / 'vix.parquet')).upsert(pd.DataFrame({'date': DAYS[:10], 'vix_close': 15.0}))
+
+    calls = []
+
+    def fake_download(column, start, end):
+        calls.append((start, end))
+        days = [d for d in DAYS if start <= d < end]
+        return pd.DataFrame({'date': days, column: 20.0})
+    monkeypatch.setattr(loaders, 'download_series', fake_download)
+
+    loader = make_loader(polygon_day_root, stock_root, tmp_path)
+    vix = loader.load_vix(datetime(2024, 1, 2), datetime(2024, 1, 31), allow_download=True)
+    assert list(vix['date']) == list(DAYS)
+    assert len(calls) == 1 and calls[0][0] > DAYS[0]
+
+    loader.load_vix(datetime(2024, 1, 10), datetime(2024, 1, 30), allow_download=True)
+    assert len(calls) == 1
+
+    assert list(VixStore(str(tmp_path / 'vix.parquet')).load()['date']) == list(DAYS)